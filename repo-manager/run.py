@@ -9,6 +9,9 @@ import os
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+# Start the startup clock before the application modules are imported
+import startup_profile  # noqa: F401
+
 # Import and run the main application
 from repo_manager import main
 
@@ -41,6 +41,11 @@ fi
 
 echo "✅ Dependencies installed"
 
+# Optional speed-ups; the application works without them
+if ! pip install -r requirements-optional.txt; then
+    echo "⚠️  Optional dependencies not installed; using the standard library fallbacks"
+fi
+
 # Test the application
 echo "🧪 Testing application..."
 python test_app.py
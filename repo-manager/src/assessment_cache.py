@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Assessment Cache - Bounded, mtime-checked cache of evaluation files
+"""
+
+import os
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from atomic_io import atomic_write_json
+from json_codec import load_file
+
+
+AssessmentKey = Tuple[str, str]
+
+
+class AssessmentCache:
+    """Caches parsed ``<idea_id>_<type>.json`` files from the evaluations directory.
+
+    A single directory scan records which assessments exist, so looking up an
+    idea without an assessment costs no disk access at all. Cached payloads are
+    validated against the file mtime before being returned, and at most
+    max_entries payloads are kept (least recently used are dropped).
+    """
+
+    def __init__(self, evaluations_path: str, max_entries: int = 512):
+        self.evaluations_path = evaluations_path
+        self.max_entries = max_entries
+        self.files: Dict[AssessmentKey, float] = {}
+        self._entries: "OrderedDict[AssessmentKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, idea_id: str, assessment_type: str) -> str:
+        return os.path.join(self.evaluations_path, f"{idea_id}_{assessment_type}.json")
+
+    @staticmethod
+    def parse_file_name(name: str) -> Optional[AssessmentKey]:
+        """Return (idea_id, type) for an assessment file name, or None"""
+        stem, ext = os.path.splitext(name)
+        if ext != '.json' or '_' not in stem:
+            return None
+        idea_id, assessment_type = stem.rsplit('_', 1)
+        return idea_id, assessment_type
+
+    def scan(self) -> int:
+        """Record every assessment file and its mtime with one directory scan"""
+        files: Dict[AssessmentKey, float] = {}
+        if os.path.isdir(self.evaluations_path):
+            with os.scandir(self.evaluations_path) as entries:
+                for entry in entries:
+                    key = self.parse_file_name(entry.name)
+                    if key is not None and entry.is_file():
+                        files[key] = entry.stat().st_mtime
+        self.files = files
+        # Drop cached payloads whose file vanished
+        for key in list(self._entries):
+            if key not in files:
+                del self._entries[key]
+        return len(files)
+
+    def get(self, idea_id: str, assessment_type: str) -> Optional[Dict[str, Any]]:
+        """Return an assessment, re-reading the file only if its mtime changed"""
+        key = (idea_id, assessment_type)
+        if key not in self.files:
+            return None
+        file_path = self.path(idea_id, assessment_type)
+        try:
+            mtime = os.stat(file_path).st_mtime
+        except FileNotFoundError:
+            self.invalidate(idea_id, assessment_type, forget_file=True)
+            return None
+
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] == mtime:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        assessment_data = load_file(file_path)
+        self._store(key, mtime, assessment_data)
+        return assessment_data
+
+    def put(self, idea_id: str, assessment_type: str, assessment_data: Dict[str, Any]):
+        """Write an assessment atomically and keep the cache in step (write-through)"""
+        file_path = self.path(idea_id, assessment_type)
+        atomic_write_json(file_path, assessment_data)
+        self._store((idea_id, assessment_type), os.stat(file_path).st_mtime, assessment_data)
+
+    def put_many(self, assessments: Dict[AssessmentKey, Dict[str, Any]]) -> int:
+        """Write a batch of assessments, skipping ones identical to the stored file; returns the number written"""
+        written = 0
+        for (idea_id, assessment_type), assessment_data in assessments.items():
+            try:
+                if self.get(idea_id, assessment_type) == assessment_data:
+                    continue
+            except (OSError, ValueError):
+                pass  # Unreadable or corrupt file - overwrite it
+            self.put(idea_id, assessment_type, assessment_data)
+            written += 1
+        return written
+
+    def refresh_file(self, file_name: str) -> Optional[AssessmentKey]:
+        """Re-stat one assessment file after an outside change; returns its key"""
+        key = self.parse_file_name(file_name)
+        if key is None:
+            return None
+        self._entries.pop(key, None)
+        try:
+            self.files[key] = os.stat(self.path(*key)).st_mtime
+        except FileNotFoundError:
+            self.files.pop(key, None)
+        return key
+
+    def _store(self, key: AssessmentKey, mtime: float, assessment_data: Dict[str, Any]):
+        self.files[key] = mtime
+        self._entries[key] = (mtime, assessment_data)
+        self._entries.move_to_end(key)
+        while len(self._entries) > max(self.max_entries, 1):
+            self._entries.popitem(last=False)
+
+    def invalidate(self, idea_id: str, assessment_type: str, forget_file: bool = False):
+        """Drop a cached payload, and optionally the record that its file exists"""
+        key = (idea_id, assessment_type)
+        self._entries.pop(key, None)
+        if forget_file:
+            self.files.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Assessment Import - Bulk import of Evaluator outputs from directories, JSON or JSONL files
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Set, Tuple
+
+
+# Required fields and their types, as given in agents/Evaluator-(GPT)/*-format.md
+ASSESSMENT_FORMATS = {
+    'trend': {'idea_id': str, 'trend_score': int, 'justification': str, 'suggested_tags': list},
+    'maturity': {'idea_id': str, 'maturity_score': int, 'justification': str, 'suggested_next_steps': list},
+}
+SCORE_RANGE = (1, 10)
+# Below this many files validation runs in-process; starting worker processes would cost more
+PARALLEL_THRESHOLD = 16
+
+
+def detect_assessment_type(record: Dict[str, Any]) -> Optional[str]:
+    """Return 'trend' or 'maturity' depending on which score the record carries"""
+    types = [assessment_type for assessment_type in ASSESSMENT_FORMATS if f'{assessment_type}_score' in record]
+    return types[0] if len(types) == 1 else None
+
+
+def validate_assessment(record: Any) -> Tuple[Optional[str], List[str]]:
+    """Check a record against the Evaluator formats and return (type, errors)"""
+    if not isinstance(record, dict):
+        return None, ["not a JSON object"]
+    assessment_type = detect_assessment_type(record)
+    if assessment_type is None:
+        return None, ["expected exactly one of 'trend_score' or 'maturity_score'"]
+
+    errors = []
+    for field, field_type in ASSESSMENT_FORMATS[assessment_type].items():
+        value = record.get(field)
+        if value is None:
+            errors.append(f"missing '{field}'")
+        elif not isinstance(value, field_type) or isinstance(value, bool):
+            errors.append(f"'{field}' must be {field_type.__name__}")
+        elif field_type is str and not value.strip():
+            errors.append(f"'{field}' is empty")
+        elif field_type is list and not all(isinstance(entry, str) for entry in value):
+            errors.append(f"'{field}' must be a list of strings")
+        elif field_type is int and not SCORE_RANGE[0] <= value <= SCORE_RANGE[1]:
+            errors.append(f"'{field}' must be between {SCORE_RANGE[0]} and {SCORE_RANGE[1]}")
+    return assessment_type, errors
+
+
+def iter_sources(paths: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """Yield (location, JSON text) for every record in the given files and directories
+
+    Directories contribute their *.json and *.jsonl files, .jsonl files one record
+    per non-empty line, and .json files their whole content (an object or a list).
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            names = sorted(name for name in os.listdir(path) if name.endswith(('.json', '.jsonl')))
+            yield from iter_sources(os.path.join(path, name) for name in names)
+        elif path.endswith('.jsonl'):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, 1):
+                    if line.strip():
+                        yield f"{path}:{line_number}", line
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                yield path, f.read()
+
+
+def check_source(source: Tuple[str, str]) -> List[Tuple[str, Optional[str], Any, List[str]]]:
+    """Parse and validate one source, returning (location, type, record, errors) per record"""
+    location, text = source
+    try:
+        parsed = json.loads(text)
+    except json.JSONDecodeError as e:
+        return [(location, None, None, [f"invalid JSON: {e}"])]
+    records = parsed if isinstance(parsed, list) else [parsed]
+    results = []
+    for position, record in enumerate(records):
+        record_location = f"{location}[{position}]" if isinstance(parsed, list) else location
+        assessment_type, errors = validate_assessment(record)
+        results.append((record_location, assessment_type, record, errors))
+    return results
+
+
+def check_file(path: str) -> List[Tuple[str, Optional[str], Any, List[str]]]:
+    """Read, parse and validate every record of one file (runs in a worker process)"""
+    try:
+        return [result for source in iter_sources([path]) for result in check_source(source)]
+    except OSError as e:
+        return [(path, None, None, [f"cannot read: {e}"])]
+
+
+def source_files(path: str) -> List[str]:
+    """Return the files to import for a path: the file itself, or a directory's *.json and *.jsonl files"""
+    if not os.path.isdir(path):
+        return [path]
+    names = sorted(name for name in os.listdir(path) if name.endswith(('.json', '.jsonl')))
+    return [os.path.join(path, name) for name in names]
+
+
+class ImportReport:
+    """Outcome of a bulk import: accepted assessments keyed by (idea_id, type) and rejects"""
+
+    def __init__(self):
+        self.accepted: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.locations: Dict[Tuple[str, str], str] = {}
+        self.rejects: List[Tuple[str, str]] = []
+        self.replaced: List[Tuple[str, str]] = []
+        self.written = 0
+
+    def counts(self) -> Dict[str, int]:
+        counts = {assessment_type: 0 for assessment_type in ASSESSMENT_FORMATS}
+        for _, assessment_type in self.accepted:
+            counts[assessment_type] += 1
+        return counts
+
+    def summary(self) -> str:
+        """Human-readable summary listing every rejected record"""
+        counts = self.counts()
+        lines = [f"Accepted {len(self.accepted)} assessments "
+                 f"({counts['trend']} trend, {counts['maturity']} maturity), "
+                 f"rejected {len(self.rejects)}"]
+        if self.replaced:
+            lines.append(f"{len(self.replaced)} duplicate records were superseded by later ones:")
+            lines.extend(f"  {location}: {reason}" for location, reason in self.replaced)
+        if self.rejects:
+            lines.append("Rejected:")
+            lines.extend(f"  {location}: {reason}" for location, reason in self.rejects)
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'accepted': [{'idea_id': idea_id, 'type': assessment_type, 'source': self.locations[(idea_id, assessment_type)]}
+                         for idea_id, assessment_type in self.accepted],
+            'rejected': [{'source': location, 'reason': reason} for location, reason in self.rejects],
+            'superseded': [{'source': location, 'reason': reason} for location, reason in self.replaced],
+            'written': self.written,
+        }
+
+
+def collect_assessments(paths: Iterable[str], known_ids: Optional[Set[str]] = None,
+                        workers: Optional[int] = None) -> ImportReport:
+    """Read and validate evaluator outputs across worker processes; later records win for the same (idea_id, type)"""
+    report = ImportReport()
+    files = []
+    for path in paths:
+        try:
+            files.extend(source_files(path))
+        except OSError as e:
+            report.rejects.append((path, f"cannot read: {e}"))
+
+    # Validation is pure Python, so threads would share one core; each worker reads and checks whole files
+    if workers == 1 or len(files) < PARALLEL_THRESHOLD:
+        file_results = map(check_file, files)
+    else:
+        # Spawned workers: the GUI calls this from a worker thread next to Tk, and forking a
+        # multithreaded process can deadlock or crash the children
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            # map() keeps the input order, so "last one wins" is deterministic
+            file_results = list(executor.map(check_file, files, chunksize=max(len(files) // 64, 1)))
+
+    for results in file_results:
+        for location, assessment_type, record, errors in results:
+            if not errors and known_ids is not None and record['idea_id'] not in known_ids:
+                errors = [f"unknown idea_id '{record['idea_id']}'"]
+            if errors:
+                report.rejects.append((location, "; ".join(errors)))
+                continue
+            key = (record['idea_id'], assessment_type)
+            if key in report.accepted:
+                report.replaced.append((report.locations[key], f"superseded by {location}"))
+            report.accepted[key] = record
+            report.locations[key] = location
+    return report
+
+
+def main(argv: Optional[List[str]] = None):
+    """Validate evaluator outputs and write them to evaluations/ (or the SQLite database)"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Bulk import trend and maturity assessments")
+    parser.add_argument("paths", nargs="+", help="directories, .json or .jsonl files of evaluator outputs")
+    parser.add_argument("--evaluations-dir", default="../data/evaluations")
+    parser.add_argument("--db", help="write into this SQLite database instead of evaluations/")
+    parser.add_argument("--repo-file", help="reject assessments for ideas missing from this repo.json")
+    parser.add_argument("--report", help="also write the report as JSON to this file")
+    parser.add_argument("--dry-run", action="store_true", help="validate only, write nothing")
+    parser.add_argument("--workers", type=int, help="validation processes (1 validates in-process)")
+    args = parser.parse_args(argv)
+
+    if args.db and not os.path.exists(args.db):
+        print(f"SQLite database not found: {args.db} (run 'sqlite_storage.py import' first)", file=sys.stderr)
+        return 1
+
+    known_ids = None
+    if args.repo_file:
+        from repo_storage import JsonFileStorage
+        known_ids = {idea.get('idea_id') for idea in JsonFileStorage(args.repo_file).load_ideas()}
+
+    report = collect_assessments(args.paths, known_ids, args.workers)
+    if not args.dry_run and report.accepted:
+        if args.db:
+            from sqlite_storage import SqliteStorage
+            storage = SqliteStorage(args.db)
+            try:
+                report.written = storage.save_assessments(report.accepted)
+            finally:
+                storage.close()
+        else:
+            from assessment_cache import AssessmentCache
+            os.makedirs(args.evaluations_dir, exist_ok=True)
+            cache = AssessmentCache(args.evaluations_dir)
+            # Record the existing files so put_many can skip assessments that are already stored
+            cache.scan()
+            report.written = cache.put_many(report.accepted)
+
+    print(report.summary())
+    if not args.dry_run:
+        print(f"Wrote {report.written} assessments")
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report.to_dict(), f, indent=2, ensure_ascii=False)
+    return 1 if report.rejects else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
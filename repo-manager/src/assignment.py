@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Assignment - Deterministic pre-assignment of weekly items to ideas by TF-IDF similarity
+"""
+
+import heapq
+import math
+import os
+import time
+from collections import Counter
+from collections.abc import Mapping
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+from search_index import tokenize
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Items of this section plan content about an idea; they are never proposed as new ideas
+CONTENT_SECTION = "content_ideas"
+# Title and tags say more about an idea than its description or linked items
+TITLE_WEIGHT = 2
+TAG_WEIGHT = 2
+
+
+def idea_terms(idea: Dict[str, Any], item_text: Optional[Callable[[str, str, str], Optional[str]]] = None) -> Counter:
+    """Weighted term counts of an idea: title, description, tags and (optionally) its linked item texts"""
+    terms = Counter(tokenize(str(idea.get('description', '') or '')))
+    for _ in range(TITLE_WEIGHT):
+        terms.update(tokenize(str(idea.get('title', '') or '')))
+    for tag in idea.get('tags', []) or []:
+        for _ in range(TAG_WEIGHT):
+            terms.update(tokenize(str(tag)))
+    if item_text is not None:
+        for item in idea.get('related_items', []) or []:
+            if isinstance(item, Mapping):
+                text = item_text(item.get('week'), item.get('section'), item.get('item_id'))
+                if text:
+                    terms.update(tokenize(text))
+    return terms
+
+
+class TfidfIndex:
+    """Sparse TF-IDF vectors for ideas with an inverted index for top-K cosine queries.
+
+    Documents get sublinear term frequencies (1 + log tf) times a smoothed
+    IDF and are L2-normalised, so a query's dot product with a document is
+    its cosine similarity. Queries only visit the postings of their own
+    terms. With NumPy the postings are packed into flat arrays and scored
+    with one bincount; without it a dict accumulates the same sums. Ties rank
+    by document order either way, so results are reproducible.
+    """
+
+    def __init__(self, use_numpy: bool = True):
+        # The NumPy path is only taken when NumPy is installed
+        self.use_numpy = use_numpy and numpy is not None
+        self.doc_ids: List[str] = []
+        self.idf: Dict[str, float] = {}
+        self.vectors: List[Dict[str, float]] = []
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+        self._arrays: Optional[Dict[str, Any]] = None
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def build(self, documents: List[Tuple[str, Counter]]):
+        """Index (doc_id, term counts) pairs, replacing anything indexed before"""
+        self.doc_ids = [doc_id for doc_id, _ in documents]
+        document_frequency: Counter = Counter()
+        for _, terms in documents:
+            document_frequency.update(terms.keys())
+        doc_count = len(documents)
+        self.idf = {term: math.log((1 + doc_count) / (1 + frequency)) + 1
+                    for term, frequency in document_frequency.items()}
+
+        self.vectors = []
+        self.postings = {}
+        for position, (_, terms) in enumerate(documents):
+            vector = self.weigh(terms)
+            self.vectors.append(vector)
+            for term, weight in vector.items():
+                self.postings.setdefault(term, []).append((position, weight))
+
+        self._arrays = None
+        if self.use_numpy and self.postings:
+            terms = sorted(self.postings)
+            offsets = [0]
+            for term in terms:
+                offsets.append(offsets[-1] + len(self.postings[term]))
+            self._arrays = {
+                'slots': {term: (offsets[i], offsets[i + 1]) for i, term in enumerate(terms)},
+                'docs': numpy.fromiter((doc for term in terms for doc, _ in self.postings[term]),
+                                       dtype=numpy.int64, count=offsets[-1]),
+                'weights': numpy.fromiter((weight for term in terms for _, weight in self.postings[term]),
+                                          dtype=numpy.float64, count=offsets[-1]),
+            }
+
+    def weigh(self, terms: Counter) -> Dict[str, float]:
+        """Unit-length TF-IDF vector for term counts; terms the index has never seen are dropped"""
+        vector = {term: (1 + math.log(count)) * self.idf[term] for term, count in terms.items()
+                  if count > 0 and term in self.idf}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        return {term: weight / norm for term, weight in vector.items()} if norm else {}
+
+    def query(self, terms: Counter, top_k: int = 5) -> List[Tuple[int, float]]:
+        """Return up to top_k (document position, cosine similarity) pairs, best first"""
+        vector = self.weigh(terms)
+        if not vector or top_k <= 0:
+            return []
+        if self._arrays is not None:
+            return self._query_numpy(vector, top_k)
+        scores: Dict[int, float] = {}
+        for term, query_weight in vector.items():
+            for position, weight in self.postings.get(term, ()):
+                scores[position] = scores.get(position, 0.0) + query_weight * weight
+        return heapq.nsmallest(top_k, scores.items(), key=lambda result: (-result[1], result[0]))
+
+    def _query_numpy(self, vector: Dict[str, float], top_k: int) -> List[Tuple[int, float]]:
+        arrays = self._arrays
+        docs, weights = [], []
+        for term, query_weight in vector.items():
+            start, end = arrays['slots'].get(term, (0, 0))
+            if end > start:
+                docs.append(arrays['docs'][start:end])
+                weights.append(arrays['weights'][start:end] * query_weight)
+        if not docs:
+            return []
+        scores = numpy.bincount(numpy.concatenate(docs), weights=numpy.concatenate(weights),
+                                minlength=len(self.doc_ids))
+        # A stable sort keeps equal scores in document order, as the dict path does
+        best = numpy.argsort(-scores, kind='stable')[:top_k]
+        return [(int(position), float(scores[position])) for position in best if scores[position] > 0]
+
+    def shared_terms(self, terms: Counter, position: int, limit: int = 5) -> List[str]:
+        """The terms that contribute most to a query's similarity with one document"""
+        vector = self.weigh(terms)
+        document = self.vectors[position]
+        contributions = [(-weight * document[term], term) for term, weight in vector.items() if term in document]
+        return [term for _, term in sorted(contributions)[:limit]]
+
+
+def build_idea_index(core, include_linked_text: bool = True, use_numpy: bool = True) -> TfidfIndex:
+    """TF-IDF index over every idea of a loaded RepoCore, optionally including the text of linked items"""
+    def linked_text(week, section, item_id):
+        try:
+            item_data = core.source_data.get_item(week, section, item_id)
+        except Exception:
+            return None
+        return item_data.get('text') if item_data else None
+
+    documents = []
+    for idea in core.repo_data:
+        # Sharded placeholders carry no description or related items; read the shard without keeping it
+        idea = core.storage.resolve(idea)
+        documents.append((idea.get('idea_id'), idea_terms(idea, linked_text if include_linked_text else None)))
+    index = TfidfIndex(use_numpy)
+    index.build(documents)
+    return index
+
+
+def suggest_assignments(core, weeks: List[str], index: Optional[TfidfIndex] = None, top_k: int = 3,
+                        min_score: float = 0.05) -> List[Dict[str, Any]]:
+    """Ranked candidate ideas for every item of the given weeks, skipping items an idea already links"""
+    if index is None:
+        index = build_idea_index(core)
+    link_index = core.get_link_index()
+    titles = {idea.get('idea_id'): idea.get('title', '') for idea in core.repo_data}
+    suggestions = []
+    for week in weeks:
+        for section, item_data in core.source_data.week_items(week):
+            item_id = item_data['id']
+            text = str(item_data.get('text', ''))
+            linked = link_index.ideas_for(week, section, item_id)
+            terms = Counter(tokenize(text))
+            candidates = []
+            if not linked:
+                for position, score in index.query(terms, top_k):
+                    if score < min_score:
+                        break
+                    idea_id = index.doc_ids[position]
+                    candidates.append({'idea_id': idea_id, 'title': titles.get(idea_id, ''),
+                                       'score': round(score, 4),
+                                       'shared_terms': index.shared_terms(terms, position)})
+            suggestions.append({'week': week, 'section': section, 'item_id': item_id, 'text': text,
+                                'linked_ideas': linked, 'candidates': candidates})
+    return suggestions
+
+
+def new_idea_id(week: str, item_id: str) -> str:
+    return f"I-NEW-{week}-{item_id}".upper()
+
+
+def build_repo_updates(suggestions: List[Dict[str, Any]], threshold: float = 0.2) -> Dict[str, Any]:
+    """Shape suggestions like the Repo-Archivist's repo_updates log.
+
+    Items whose best candidate reaches threshold extend that idea. Content
+    ideas always go to their best candidate, however weak, because they are
+    never ideas of their own. Everything else is proposed as a new idea.
+    Items that an idea already links are left out.
+    """
+    existing: Dict[str, Dict[str, Any]] = {}
+    new_ideas = []
+    content_assigned = []
+    for suggestion in suggestions:
+        if suggestion['linked_ideas']:
+            continue
+        reference = {'week': suggestion['week'], 'item_id': suggestion['item_id'], 'section': suggestion['section']}
+        best = suggestion['candidates'][0] if suggestion['candidates'] else None
+        if best is not None:
+            reason = (f"TF-IDF similarity {best['score']:.2f} with {best['idea_id']}"
+                      f" (shared terms: {', '.join(best['shared_terms']) or 'none'})")
+        if suggestion['section'] == CONTENT_SECTION:
+            if best is not None:
+                content_assigned.append({'content_item': reference, 'assigned_to_idea': best['idea_id'],
+                                         'reason': reason})
+            continue
+        if best is not None and best['score'] >= threshold:
+            entry = existing.setdefault(best['idea_id'], {'idea_id': best['idea_id'], 'title': best['title'],
+                                                          'items_added': []})
+            entry['items_added'].append({**reference, 'reason': reason})
+        else:
+            score = f"{best['score']:.2f}" if best is not None else "no match"
+            new_ideas.append({'idea_id': new_idea_id(suggestion['week'], suggestion['item_id']),
+                              'title': ' '.join(suggestion['text'].split()[:8]),
+                              'reason': f"No existing idea reaches similarity {threshold:.2f} (best: {score})",
+                              'source_item': reference})
+    return {'new_ideas_added': new_ideas, 'existing_ideas_updated': list(existing.values()),
+            'content_ideas_assigned': content_assigned}
+
+
+def suggestion_file_path(data_path: str) -> str:
+    """Timestamped file next to the Repo-Archivist transition logs"""
+    return os.path.join(data_path, "REPOSITORY", "transition_logs",
+                        time.strftime("%Y-%m-%d_%H%M%S") + "_weekly_to_repo_suggestions.json")
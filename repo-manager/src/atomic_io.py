@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Atomic IO - Crash-safe file writes (write to temp, fsync, atomic rename)
+"""
+
+import os
+import tempfile
+from typing import Any
+
+from json_codec import STORAGE_FORMAT, dumps_bytes
+
+
+def atomic_write_text(path: str, text: str):
+    """Replace a file with new text so readers only ever see the old or the new content"""
+    atomic_write_bytes(path, text.encode('utf-8'))
+
+
+def atomic_write_bytes(path: str, data: bytes):
+    """Replace a file with new bytes so readers only ever see the old or the new content"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    _fsync_directory(directory)
+
+
+def atomic_write_json(path: str, data: Any, indent: Any = STORAGE_FORMAT):
+    """Serialise data (in the configured storage format unless indent is given) and write it atomically to path"""
+    atomic_write_bytes(path, dumps_bytes(data, indent))
+
+
+def _fsync_directory(directory: str):
+    """Persist the rename itself; not supported on every platform"""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
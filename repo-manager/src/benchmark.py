@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Times the repo manager hot paths on synthetic data at growing sizes
+"""
+
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Any, Optional
+
+from atomic_io import atomic_write_json
+from idea_model import to_ideas
+from json_codec import BACKEND, STORAGE_FORMATS, dumps_bytes, load_file, loads
+from repo_core import RepoCore
+from synthetic_data import WORDS, generate_dataset, generate_idea
+
+
+DEFAULT_SCALES = [10, 100, 1000]
+# Dataset size at scale 1; scale N multiplies weeks and ideas by N
+BASE_WEEKS = 2
+BASE_IDEAS = 10
+SAMPLE_SIZE = 100
+
+
+def measure(function: Callable[[], int], repeats: int) -> Dict[str, Any]:
+    """Run function (which returns how many operations it did) and keep the best and median time"""
+    times = []
+    ops = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        ops = function()
+        times.append(time.perf_counter() - start)
+    best = min(times)
+    return {'seconds': best, 'median_seconds': statistics.median(times), 'ops': ops,
+            'per_op_seconds': best / ops if ops else None}
+
+
+def benchmark_dataset(data_path: str, repeats: int = 3, storage_mode: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Time every hot path against one data directory; read-only operations run before saves"""
+    results: Dict[str, Dict[str, Any]] = {}
+    queries = [WORDS[i] for i in range(0, len(WORDS), 4)] + ["sim", "fuel cell", "graph sea"]
+
+    def load_repo() -> int:
+        core = RepoCore(data_path, storage_mode=storage_mode)
+        count = len(core.load_repo_data())
+        core.close()
+        return count
+    results['load_repo'] = measure(load_repo, repeats)
+
+    def load_sources() -> int:
+        core = RepoCore(data_path, storage_mode=storage_mode)
+        core.load_source_data()
+        for week in core.source_data.weeks():
+            core.source_data.load_week(week)
+        core.close()
+        return len(core.source_data)
+    results['load_sources'] = measure(load_sources, repeats)
+
+    def index_markdown(cold: bool) -> int:
+        index_core = RepoCore(data_path, storage_mode=storage_mode)
+        index_core.load_source_data()
+        cache_path = index_core.source_data.md_indexes.cache_path
+        if cold and cache_path and os.path.exists(cache_path):
+            os.remove(cache_path)
+        count = index_core.source_data.index_markdown()
+        index_core.close()
+        return count
+    results['index_markdown'] = measure(lambda: index_markdown(True), repeats)
+    results['index_markdown_cached'] = measure(lambda: index_markdown(False), repeats)
+
+    core = RepoCore(data_path, storage_mode=storage_mode)
+    core.load_repo_data()
+    core.load_source_data()
+    for week in core.source_data.weeks():
+        core.source_data.load_week(week)
+    sample = [idea.get('idea_id') for idea in core.repo_data[:SAMPLE_SIZE]]
+
+    def build_index() -> int:
+        core.rebuild_search_index()
+        return len(core.repo_data)
+    results['build_search_index'] = measure(build_index, repeats)
+
+    def search() -> int:
+        for query in queries:
+            core.search_ideas(query, limit=1000)
+        return len(queries)
+    results['search'] = measure(search, repeats)
+
+    def source_report() -> int:
+        core.report_cache.clear()
+        for idea_id in sample:
+            core.get_source_information(core.find_idea(idea_id))
+        return len(sample)
+    results['source_report'] = measure(source_report, repeats)
+
+    def source_report_cached() -> int:
+        for idea_id in sample:
+            core.get_source_information(core.find_idea(idea_id))
+        return len(sample)
+    results['source_report_cached'] = measure(source_report_cached, repeats)
+
+    def assessment_lookup_cold() -> int:
+        lookup_core = RepoCore(data_path, storage_mode=storage_mode)
+        lookup_core.load_assessment_index()
+        for idea in core.repo_data:
+            for assessment_type in ("trend", "maturity"):
+                lookup_core.load_assessment(idea.get('idea_id'), assessment_type)
+        lookup_core.close()
+        return 2 * len(core.repo_data)
+    results['assessment_lookup_cold'] = measure(assessment_lookup_cold, repeats)
+
+    core.load_assessment_index()
+    def assessment_lookup_warm() -> int:
+        for idea_id in sample:
+            for assessment_type in ("trend", "maturity"):
+                core.load_assessment(idea_id, assessment_type)
+        return 2 * len(sample)
+    assessment_lookup_warm()
+    results['assessment_lookup_warm'] = measure(assessment_lookup_warm, repeats)
+
+    # Saves change the data; each repetition edits the titles again
+    def save_ideas() -> int:
+        for idea_id in sample:
+            idea = dict(core.find_idea(idea_id))
+            idea['title'] = f"{idea['title']} +"
+            core.put_idea(idea, idea_id)
+        return len(sample)
+    results['save_idea'] = measure(save_ideas, repeats)
+
+    def flush() -> int:
+        core.dirty_ideas.add(sample[0] if sample else "")
+        core.flush_repo_data()
+        return 1
+    results['flush_repo'] = measure(flush, repeats)
+
+    def save_assessments() -> int:
+        for position, idea_id in enumerate(sample):
+            core.save_assessment(idea_id, "trend", {"idea_id": idea_id, "trend_score": position % 10 + 1,
+                                                    "justification": f"run {time.perf_counter()}",
+                                                    "suggested_tags": []})
+        return len(sample)
+    results['save_assessment'] = measure(save_assessments, repeats)
+
+    core.close()
+    return results
+
+
+def benchmark_formats(data_path: str, repeats: int = 3) -> Dict[str, Dict[str, Any]]:
+    """Time saving and loading repo.json and the weekly logs in each on-disk JSON format, with their sizes"""
+    results: Dict[str, Dict[str, Any]] = {}
+    repo_data = load_file(os.path.join(data_path, "REPOSITORY", "repo.json"))
+    logs_path = os.path.join(data_path, "json-logs")
+    weeks = [load_file(os.path.join(logs_path, name)) for name in sorted(os.listdir(logs_path))]
+
+    for format_name, indent in STORAGE_FORMATS.items():
+        format_path = os.path.join(data_path, f"format-{format_name}")
+        repo_file = os.path.join(format_path, "repo.json")
+        week_files = [os.path.join(format_path, f"week-{index}.json") for index in range(len(weeks))]
+        for week_file, week_data in zip(week_files, weeks):
+            atomic_write_json(week_file, week_data, indent=indent)
+
+        def save_repo() -> int:
+            atomic_write_json(repo_file, repo_data, indent=indent)
+            return 1
+        results[f'save_repo_{format_name}'] = measure(save_repo, repeats)
+        results[f'save_repo_{format_name}']['bytes'] = os.path.getsize(repo_file)
+
+        def load_repo() -> int:
+            return len(load_file(repo_file))
+        results[f'load_repo_{format_name}'] = measure(load_repo, repeats)
+        results[f'load_repo_{format_name}']['bytes'] = os.path.getsize(repo_file)
+
+        def load_weeks() -> int:
+            for week_file in week_files:
+                load_file(week_file)
+            return len(week_files)
+        results[f'load_weeks_{format_name}'] = measure(load_weeks, repeats)
+        results[f'load_weeks_{format_name}']['bytes'] = sum(os.path.getsize(path) for path in week_files)
+    return results
+
+
+def benchmark_memory(ideas: int, weeks: int, related_per_idea: int = 5, seed: int = 0) -> Dict[str, Any]:
+    """Compare the memory held by an idea list parsed as plain dicts and as Idea records"""
+    rng = random.Random(seed)
+    text = dumps_bytes([generate_idea(rng, index, weeks, related_per_idea, 4) for index in range(ideas)])
+    result: Dict[str, Any] = {'ideas': ideas, 'weeks': weeks, 'related_per_idea': related_per_idea,
+                              'json_bytes': len(text)}
+    for label, convert in (('dicts', lambda data: data), ('records', to_ideas)):
+        tracemalloc.start()
+        start = time.perf_counter()
+        data = convert(loads(text))
+        result[f'{label}_seconds'] = time.perf_counter() - start
+        result[f'{label}_bytes'], result[f'{label}_peak_bytes'] = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del data
+    result['saved_fraction'] = 1 - result['records_bytes'] / result['dicts_bytes']
+    return result
+
+
+def prepare_storage(data_path: str, storage_mode: Optional[str]):
+    """Convert the generated repo.json into the storage format being benchmarked"""
+    if storage_mode == "sharded":
+        from repo_storage import ShardedStorage
+        ShardedStorage(os.path.join(data_path, "REPOSITORY", "ideas")).import_repo_json(
+            os.path.join(data_path, "REPOSITORY", "repo.json"))
+    elif storage_mode == "sqlite":
+        from sqlite_storage import SqliteStorage
+        storage = SqliteStorage(os.path.join(data_path, "echoforge.db"), mode="rwc")
+        try:
+            storage.import_directory(data_path)
+        finally:
+            storage.close()
+
+
+def run_benchmarks(scales: List[int], related_per_idea: int = 5, repeats: int = 3, seed: int = 0,
+                   storage_mode: Optional[str] = None, work_path: Optional[str] = None,
+                   progress=None) -> Dict[str, Any]:
+    """Generate a dataset per scale, benchmark it and return machine-readable results"""
+    report: Dict[str, Any] = {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'seed': seed,
+            'repeats': repeats,
+            'storage_mode': storage_mode or "auto",
+            'json_backend': BACKEND,
+            'base': {'weeks': BASE_WEEKS, 'ideas': BASE_IDEAS, 'related_per_idea': related_per_idea},
+            'timestamp': time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        'results': [],
+    }
+    root = tempfile.mkdtemp(prefix="echoforge-bench-", dir=work_path)
+    try:
+        for scale in scales:
+            size = {'weeks': BASE_WEEKS * scale, 'ideas': BASE_IDEAS * scale, 'related_per_idea': related_per_idea}
+            data_path = os.path.join(root, f"scale-{scale}")
+            if progress:
+                progress(f"Generating scale {scale}x: {size['weeks']} weeks, {size['ideas']} ideas")
+            generate_dataset(data_path, size['weeks'], size['ideas'], related_per_idea, seed=seed)
+            prepare_storage(data_path, storage_mode)
+            if progress:
+                progress(f"Benchmarking scale {scale}x")
+            timings = benchmark_dataset(data_path, repeats, storage_mode)
+            timings.update(benchmark_formats(data_path, repeats))
+            for operation, timing in timings.items():
+                report['results'].append({'scale': scale, **size, 'operation': operation, **timing})
+            shutil.rmtree(data_path, ignore_errors=True)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    return report
+
+
+def compare_results(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Return a line per (scale, operation) that got slower than threshold x the baseline"""
+    previous = {(result['scale'], result['operation']): result['seconds'] for result in baseline.get('results', [])}
+    regressions = []
+    for result in report['results']:
+        before = previous.get((result['scale'], result['operation']))
+        if before and result['seconds'] > before * threshold:
+            regressions.append(f"{result['operation']} at {result['scale']}x: "
+                               f"{before * 1000:.1f} ms -> {result['seconds'] * 1000:.1f} ms "
+                               f"({result['seconds'] / before:.1f}x)")
+    return regressions
+
+
+def format_results(report: Dict[str, Any]) -> str:
+    lines = [f"{'scale':>6}  {'operation':<24} {'best ms':>10} {'per op ms':>10} {'bytes':>12}"]
+    for result in report['results']:
+        per_op = result['per_op_seconds']
+        lines.append(f"{result['scale']:>5}x  {result['operation']:<24} {result['seconds'] * 1000:>10.2f} "
+                     f"{per_op * 1000 if per_op is not None else 0:>10.3f} {result.get('bytes', ''):>12}")
+    return "\n".join(lines)
+
+
+def main():
+    """Run the benchmark suite and write the results as JSON"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark load, source reports, save, search and assessments")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES,
+                        help=f"dataset multipliers of {BASE_WEEKS} weeks / {BASE_IDEAS} ideas")
+    parser.add_argument("--related", type=int, default=5, help="related items per idea")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--storage", choices=["single", "sharded", "sqlite"])
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--baseline", help="earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.5,
+                        help="fail when an operation is this many times slower than the baseline")
+    parser.add_argument("--memory", type=int, metavar="IDEAS",
+                        help="only compare the memory of IDEAS ideas held as dicts and as Idea records")
+    args = parser.parse_args()
+
+    if args.memory:
+        result = benchmark_memory(args.memory, max(1, args.memory // 200), args.related, args.seed)
+        for label in ('dicts', 'records'):
+            print(f"{label:<8} {result[f'{label}_bytes'] / 2**20:>9.1f} MB held "
+                  f"{result[f'{label}_peak_bytes'] / 2**20:>9.1f} MB peak {result[f'{label}_seconds']:>7.2f} s")
+        print(f"Idea records use {result['saved_fraction']:.0%} less memory for {args.memory} ideas")
+        return 0
+
+    report = run_benchmarks(args.scales, args.related, args.repeats, args.seed, args.storage,
+                            progress=lambda message: print(message, file=sys.stderr))
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(format_results(report))
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare_results(report, json.load(f), args.threshold)
+        if regressions:
+            print("Regressions:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("No regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Duplicates - Near-duplicate idea detection with MinHash signatures and locality-sensitive hashing
+"""
+
+import random
+import zlib
+from collections.abc import Mapping
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+from search_index import tokenize
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Mersenne prime for the (a * x + b) mod p permutations; 32-bit hashes keep a * x within 64 bits
+PRIME = (1 << 31) - 1
+# Final score: text shingles and shared related items, weighted when both ideas link items
+TEXT_WEIGHT = 0.7
+ITEM_WEIGHT = 0.3
+# LSH buckets larger than this (e.g. ideas with boilerplate text) are skipped rather than compared pairwise
+MAX_BUCKET_SIZE = 200
+
+
+def text_shingles(idea: Dict[str, Any]) -> Set[str]:
+    """Word pairs of the title and description plus single title words and tags"""
+    words = tokenize(f"{idea.get('title', '') or ''} {idea.get('description', '') or ''}")
+    shingles = {f"{first} {second}" for first, second in zip(words, words[1:])}
+    shingles.update(tokenize(str(idea.get('title', '') or '')))
+    shingles.update(f"tag:{tag}".lower() for tag in idea.get('tags', []) or [] if isinstance(tag, str))
+    return shingles
+
+
+def item_key(item: Mapping) -> str:
+    return f"item:{item.get('week')}/{item.get('section')}/{item.get('item_id')}"
+
+
+def item_keys(idea: Dict[str, Any]) -> Set[str]:
+    return {item_key(item) for item in idea.get('related_items', []) or [] if isinstance(item, Mapping)}
+
+
+def jaccard(first: Set[str], second: Set[str]) -> float:
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def overlap(first: Set[str], second: Set[str]) -> float:
+    """Share of the smaller set that the two have in common"""
+    if not first or not second:
+        return 0.0
+    return len(first & second) / min(len(first), len(second))
+
+
+class MinHasher:
+    """MinHash signatures from a fixed seed, so the same shingles always give the same signature"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1, use_numpy: bool = True):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.a = [rng.randrange(1, PRIME) for _ in range(num_perm)]
+        self.b = [rng.randrange(0, PRIME) for _ in range(num_perm)]
+        self.use_numpy = use_numpy and numpy is not None
+        if self.use_numpy:
+            self._a = numpy.array(self.a, dtype=numpy.uint64)[:, None]
+            self._b = numpy.array(self.b, dtype=numpy.uint64)[:, None]
+
+    def signature(self, shingles: Set[str]) -> Tuple[int, ...]:
+        hashes = [zlib.crc32(shingle.encode('utf-8')) & PRIME for shingle in shingles]
+        if not hashes:
+            return ()
+        if self.use_numpy:
+            values = (self._a * numpy.array(hashes, dtype=numpy.uint64)[None, :] + self._b) % PRIME
+            return tuple(int(value) for value in values.min(axis=1))
+        return tuple(min((a * value + b) % PRIME for value in hashes) for a, b in zip(self.a, self.b))
+
+
+class DuplicateDetector:
+    """Finds clusters of near-identical ideas in roughly linear time.
+
+    Every idea gets a MinHash signature over its text shingles and related
+    item keys. Signatures are cut into bands, and ideas that share a band
+    land in the same bucket. Only ideas that share a bucket are compared
+    exactly, so the work grows with the number of ideas, not with the number
+    of pairs. Pairs scoring at least threshold are joined into clusters.
+    """
+
+    def __init__(self, threshold: float = 0.5, bands: int = 16, rows: int = 4, seed: int = 1,
+                 use_numpy: bool = True):
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self.hasher = MinHasher(bands * rows, seed, use_numpy)
+
+    def score(self, first: Tuple[Set[str], Set[str]], second: Tuple[Set[str], Set[str]]) -> Dict[str, float]:
+        """Exact similarity of two ideas from their (text shingles, item keys)"""
+        text = jaccard(first[0], second[0])
+        items = overlap(first[1], second[1])
+        combined = TEXT_WEIGHT * text + ITEM_WEIGHT * items if first[1] and second[1] else text
+        return {'score': round(combined, 4), 'text_similarity': round(text, 4), 'item_overlap': round(items, 4)}
+
+    def candidate_pairs(self, signatures: List[Tuple[int, ...]]) -> Set[Tuple[int, int]]:
+        """Pairs of positions whose signatures agree on at least one band"""
+        pairs: Set[Tuple[int, int]] = set()
+        for band in range(self.bands):
+            start = band * self.rows
+            buckets: Dict[Tuple[int, ...], List[int]] = {}
+            for position, signature in enumerate(signatures):
+                if signature:
+                    buckets.setdefault(signature[start:start + self.rows], []).append(position)
+            for members in buckets.values():
+                if 1 < len(members) <= MAX_BUCKET_SIZE:
+                    for i, first in enumerate(members):
+                        for second in members[i + 1:]:
+                            pairs.add((first, second))
+        return pairs
+
+    def find(self, ideas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return clusters of near-duplicates, most similar first"""
+        features = [(text_shingles(idea), item_keys(idea)) for idea in ideas]
+        signatures = [self.hasher.signature(text | items) for text, items in features]
+
+        matches = []
+        for first, second in sorted(self.candidate_pairs(signatures)):
+            similarity = self.score(features[first], features[second])
+            if similarity['score'] >= self.threshold:
+                matches.append((first, second, similarity))
+
+        # Union-find over the matching pairs; the lowest position becomes each cluster's root
+        parent = list(range(len(ideas)))
+
+        def root(position: int) -> int:
+            while parent[position] != position:
+                parent[position] = parent[parent[position]]
+                position = parent[position]
+            return position
+
+        for first, second, _ in matches:
+            first_root, second_root = root(first), root(second)
+            if first_root != second_root:
+                parent[max(first_root, second_root)] = min(first_root, second_root)
+
+        clusters: Dict[int, Dict[str, Any]] = {}
+        for first, second, similarity in matches:
+            cluster = clusters.setdefault(root(first), {'positions': set(), 'pairs': []})
+            cluster['positions'].update((first, second))
+            cluster['pairs'].append({'idea_ids': [ideas[first].get('idea_id'), ideas[second].get('idea_id')],
+                                     **similarity})
+        report = []
+        for cluster in clusters.values():
+            positions = sorted(cluster['positions'])
+            pairs = sorted(cluster['pairs'], key=lambda pair: -pair['score'])
+            report.append({'idea_ids': [ideas[position].get('idea_id') for position in positions],
+                           'titles': [ideas[position].get('title', '') for position in positions],
+                           'score': pairs[0]['score'], 'pairs': pairs})
+        report.sort(key=lambda cluster: (-cluster['score'], cluster['idea_ids']))
+        return report
+
+
+def merge_ideas(target: Dict[str, Any], others: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return target with the related items and tags of the others added (first occurrence order, no repeats)"""
+    merged = dict(target)
+    related_items = list(target.get('related_items', []) or [])
+    seen = item_keys({'related_items': related_items})
+    tags = list(target.get('tags', []) or [])
+    for other in others:
+        for item in other.get('related_items', []) or []:
+            if not isinstance(item, Mapping):
+                continue
+            key = item_key(item)
+            if key not in seen:
+                seen.add(key)
+                related_items.append(dict(item))
+        for tag in other.get('tags', []) or []:
+            if tag not in tags:
+                tags.append(tag)
+    merged['related_items'] = related_items
+    merged['tags'] = tags
+    return merged
+
+
+def format_clusters(clusters: List[Dict[str, Any]], limit: Optional[int] = None) -> str:
+    if not clusters:
+        return "No near-duplicate ideas found"
+    lines = [f"{len(clusters)} clusters of near-duplicate ideas", ""]
+    for cluster in clusters[:limit]:
+        lines.append(f"## score {cluster['score']:.2f}")
+        for idea_id, title in zip(cluster['idea_ids'], cluster['titles']):
+            lines.append(f"- {idea_id}: {title}")
+        for pair in cluster['pairs']:
+            lines.append(f"  {pair['idea_ids'][0]} ~ {pair['idea_ids'][1]}: {pair['score']:.2f} "
+                         f"(text {pair['text_similarity']:.2f}, items {pair['item_overlap']:.2f})")
+        lines.append("")
+    return "\n".join(lines)
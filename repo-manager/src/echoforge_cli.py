@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+EchoForge CLI - Fast command-line access to ideas and their sources (no GUI imports)
+"""
+
+import os
+import sys
+from typing import Dict, Any
+
+from atomic_io import atomic_write_json
+from json_codec import dumps
+from repo_core import RepoCore
+
+
+DEFAULT_DATA_PATH = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'data'))
+
+
+def format_idea_line(idea: Dict[str, Any]) -> str:
+    """One tab-separated line per idea: ID, title, maturity, interest, trend, tags"""
+    return "\t".join([str(idea.get('idea_id', 'N/A')), str(idea.get('title', 'No Title')),
+                      str(idea.get('maturity_score', '')), str(idea.get('personal_interest_score', '')),
+                      str(idea.get('trend_score', '')), ', '.join(idea.get('tags', []) or [])])
+
+
+def print_json(data: Any):
+    print(dumps(data, indent=2))
+
+
+def cmd_ideas_list(core: RepoCore, args) -> int:
+    core.load_repo_data(validate=False)
+    ideas = core.repo_data
+    if args.tag:
+        ideas = [idea for idea in ideas if args.tag in (idea.get('tags') or [])]
+    if args.json:
+        print_json([dict(idea) for idea in ideas])
+    else:
+        for idea in ideas:
+            print(format_idea_line(idea))
+    return 0
+
+
+def cmd_ideas_show(core: RepoCore, args) -> int:
+    core.load_repo_data(validate=False)
+    idea = core.find_idea(args.idea_id)
+    if idea is None:
+        print(f"Idea not found: {args.idea_id}", file=sys.stderr)
+        return 1
+    idea = dict(idea)
+    if args.assessments:
+        core.load_assessment_index()
+        idea['assessments'] = {assessment_type: core.load_assessment(args.idea_id, assessment_type)
+                               for assessment_type in ('trend', 'maturity')}
+    print_json(idea)
+    return 0
+
+
+def cmd_ideas_search(core: RepoCore, args) -> int:
+    core.load_repo_data(validate=False)
+    if args.with_sources:
+        # Linked weekly item text only becomes searchable once its week is parsed
+        core.load_source_data()
+        for week in core.source_data.weeks():
+            core.source_data.load_week(week)
+    core.rebuild_search_index()
+    results = core.search_ideas(args.query, limit=args.limit)
+    if args.json:
+        print_json([{'score': round(score, 4), **idea} for idea, score in results])
+    else:
+        for idea, score in results:
+            print(f"{score:.3f}\t{format_idea_line(idea)}")
+    return 0
+
+
+def cmd_sources(core: RepoCore, args) -> int:
+    core.load_repo_data(validate=False)
+    idea = core.find_idea(args.idea_id)
+    if idea is None:
+        print(f"Idea not found: {args.idea_id}", file=sys.stderr)
+        return 1
+    core.load_source_data()
+    print(core.get_source_information(idea))
+    unresolved = core.find_unresolved_related_items(idea.get('related_items', []) or [])
+    return 2 if unresolved else 0
+
+
+def cmd_links(core: RepoCore, args) -> int:
+    core.load_repo_data(validate=False)
+    core.load_source_data()
+    if args.week not in core.source_data and args.week not in core.get_link_index().linked_weeks():
+        print(f"Week not found: {args.week}", file=sys.stderr)
+        return 1
+    rows = core.get_week_links(args.week)
+    if args.json:
+        print_json(rows)
+    else:
+        for row in rows:
+            missing = "" if row['found'] else " (missing)"
+            print(f"{row['section']}\t{row['item_id']}{missing}\t{', '.join(row['idea_ids'])}")
+    return 0
+
+
+def cmd_orphans(core: RepoCore, args) -> int:
+    core.load_repo_data(validate=False)
+    core.load_source_data()
+    orphans = core.find_orphan_items(args.weeks or None)
+    if args.json:
+        print_json(orphans)
+    else:
+        print(core.format_orphan_report(orphans))
+    return 0
+
+
+def cmd_suggest(core: RepoCore, args) -> int:
+    from assignment import build_idea_index, build_repo_updates, suggest_assignments, suggestion_file_path
+
+    core.load_repo_data(validate=False)
+    core.load_source_data()
+    missing = [week for week in args.weeks if week not in core.source_data]
+    if missing:
+        print(f"Week not found: {', '.join(missing)}", file=sys.stderr)
+        return 1
+    index = build_idea_index(core, include_linked_text=not args.no_linked_text)
+    suggestions = suggest_assignments(core, args.weeks, index, top_k=args.top, min_score=args.min_score)
+    report = {'repo_updates': build_repo_updates(suggestions, args.threshold), 'suggestions': suggestions}
+    if args.output == "-":
+        print_json(report)
+        return 0
+    output = args.output or suggestion_file_path(core.data_path)
+    atomic_write_json(output, report, indent=2)
+    updates = report['repo_updates']
+    print(f"{len(suggestions)} items: {sum(len(entry['items_added']) for entry in updates['existing_ideas_updated'])} "
+          f"to existing ideas, {len(updates['content_ideas_assigned'])} content ideas assigned, "
+          f"{len(updates['new_ideas_added'])} proposed as new ideas", file=sys.stderr)
+    print(f"Suggestions written to {output}", file=sys.stderr)
+    return 0
+
+
+def cmd_duplicates(core: RepoCore, args) -> int:
+    from duplicates import format_clusters
+
+    core.load_repo_data(validate=False)
+    clusters = core.find_duplicate_ideas(args.threshold)
+    if args.json:
+        print_json(clusters)
+    else:
+        print(format_clusters(clusters, args.limit))
+    return 0
+
+
+def cmd_validate(core: RepoCore, args) -> int:
+    from schema_validation import format_error
+
+    errors = core.validate_data(workers=args.workers)
+    if args.json:
+        print_json(errors)
+    else:
+        for error in errors:
+            print(format_error(error))
+    files = len({error['file'] for error in errors})
+    print(f"{len(errors)} schema errors in {files} files", file=sys.stderr)
+    return 1 if errors else 0
+
+
+def cmd_export(core: RepoCore, args) -> int:
+    core.load_repo_data(validate=False)
+    count = core.export_pretty(args.output)
+    print(f"Exported {count} ideas to {args.output}", file=sys.stderr)
+    return 0
+
+
+def main(argv=None) -> int:
+    """Query ideas and their weekly sources from the command line"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="echoforge", description="Query the EchoForge idea repository")
+    parser.add_argument("--data-dir", default=os.environ.get("ECHOFORGE_DATA", DEFAULT_DATA_PATH),
+                        help="data directory (default: $ECHOFORGE_DATA or the repository's data/)")
+    parser.add_argument("--storage", choices=["single", "sharded", "sqlite"],
+                        help="storage mode (default: auto-detect)")
+    parser.add_argument("--metrics", help="trace the data paths and write timings to this JSON/CSV file")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ideas_parser = subparsers.add_parser("ideas", help="list, show or search ideas")
+    ideas_subparsers = ideas_parser.add_subparsers(dest="ideas_command", required=True)
+
+    list_parser = ideas_subparsers.add_parser("list", help="list all ideas")
+    list_parser.add_argument("--tag", help="only ideas with this tag")
+    list_parser.add_argument("--json", action="store_true", help="print JSON instead of tab-separated lines")
+    list_parser.set_defaults(handler=cmd_ideas_list)
+
+    show_parser = ideas_subparsers.add_parser("show", help="print one idea as JSON")
+    show_parser.add_argument("idea_id")
+    show_parser.add_argument("--assessments", action="store_true", help="include trend and maturity assessments")
+    show_parser.set_defaults(handler=cmd_ideas_show)
+
+    search_parser = ideas_subparsers.add_parser("search", help="full-text search over ideas")
+    search_parser.add_argument("query")
+    search_parser.add_argument("--limit", type=int, default=20)
+    search_parser.add_argument("--with-sources", action="store_true",
+                               help="also match the text of linked weekly items (slower)")
+    search_parser.add_argument("--json", action="store_true", help="print JSON instead of tab-separated lines")
+    search_parser.set_defaults(handler=cmd_ideas_search)
+
+    sources_parser = subparsers.add_parser("sources", help="print the weekly sources linked to an idea")
+    sources_parser.add_argument("idea_id")
+    sources_parser.set_defaults(handler=cmd_sources)
+
+    links_parser = subparsers.add_parser("links", help="list a week's items with the ideas linked to each")
+    links_parser.add_argument("week", help="week label, e.g. 2025-W29")
+    links_parser.add_argument("--json", action="store_true", help="print JSON instead of tab-separated lines")
+    links_parser.set_defaults(handler=cmd_links)
+
+    orphans_parser = subparsers.add_parser("orphans", help="list weekly items not linked to any idea")
+    orphans_parser.add_argument("weeks", nargs="*", help="weeks to check (default: all)")
+    orphans_parser.add_argument("--json", action="store_true", help="print week -> section -> item IDs as JSON")
+    orphans_parser.set_defaults(handler=cmd_orphans)
+
+    suggest_parser = subparsers.add_parser("suggest", help="propose ideas for the unlinked items of new weeks")
+    suggest_parser.add_argument("weeks", nargs="+", help="weeks to assign, e.g. 2025-W29")
+    suggest_parser.add_argument("--top", type=int, default=3, help="candidate ideas kept per item")
+    suggest_parser.add_argument("--min-score", type=float, default=0.05, help="drop candidates below this similarity")
+    suggest_parser.add_argument("--threshold", type=float, default=0.2,
+                                help="similarity needed to add an item to an existing idea")
+    suggest_parser.add_argument("--no-linked-text", action="store_true",
+                                help="describe ideas by title, description and tags only (skips reading every week)")
+    suggest_parser.add_argument("--output", help="file to write, '-' for stdout "
+                                "(default: REPOSITORY/transition_logs/<timestamp>_weekly_to_repo_suggestions.json)")
+    suggest_parser.set_defaults(handler=cmd_suggest)
+
+    duplicates_parser = subparsers.add_parser("duplicates", help="report clusters of near-duplicate ideas")
+    duplicates_parser.add_argument("--threshold", type=float, default=0.5, help="minimum similarity (0-1)")
+    duplicates_parser.add_argument("--limit", type=int, help="clusters to print (default: all)")
+    duplicates_parser.add_argument("--json", action="store_true", help="print the clusters as JSON")
+    duplicates_parser.set_defaults(handler=cmd_duplicates)
+
+    validate_parser = subparsers.add_parser("validate", help="check repo.json and the weekly logs against the schemas")
+    validate_parser.add_argument("--workers", type=int, help="worker processes (default: one per core)")
+    validate_parser.add_argument("--json", action="store_true", help="print the errors as JSON")
+    validate_parser.set_defaults(handler=cmd_validate)
+
+    export_parser = subparsers.add_parser("export", help="write all ideas as indented JSON for reading")
+    export_parser.add_argument("output", help="file to write")
+    export_parser.set_defaults(handler=cmd_export)
+
+    args = parser.parse_args(argv)
+    # The CLI never changes ideas: the storage is opened read-only and schema checks
+    # only run for the explicit validate command
+    core = RepoCore(args.data_dir, storage_mode=args.storage, read_only=True)
+    core.validate_schemas = args.handler is cmd_validate
+    if args.metrics:
+        core.tracer.enable()
+    try:
+        return args.handler(core, args)
+    finally:
+        core.close()
+        if args.metrics:
+            core.tracer.export(args.metrics)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+File Watcher - Polling, dependency-free change detection for data directories
+"""
+
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+Snapshot = Dict[str, Tuple[int, int]]
+
+
+class FileChanges:
+    """Paths added, modified and removed under one watched target"""
+
+    def __init__(self):
+        self.added: List[str] = []
+        self.modified: List[str] = []
+        self.removed: List[str] = []
+
+    def changed(self) -> List[str]:
+        """Paths whose current content should be (re)read"""
+        return self.added + self.modified
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.modified) + len(self.removed)
+
+    def __repr__(self) -> str:
+        return f"FileChanges(added={self.added}, modified={self.modified}, removed={self.removed})"
+
+
+class PollingWatcher:
+    """Detects file changes by comparing (mtime, size) snapshots taken with os.scandir.
+
+    Targets are named directories (filtered by extension) or single files.
+    poll() is meant to be called periodically; it only reports once a burst of
+    changes has been quiet for settle_seconds, and then reports everything that
+    changed since the previous report as one batch.
+    """
+
+    def __init__(self, settle_seconds: float = 0.5, clock=time.monotonic):
+        self.settle_seconds = settle_seconds
+        self.clock = clock
+        self.targets: Dict[str, Tuple[str, Optional[Tuple[str, ...]]]] = {}
+        self._reported: Dict[str, Snapshot] = {}
+        self._latest: Dict[str, Snapshot] = {}
+        self._last_change: Optional[float] = None
+
+    def watch_directory(self, name: str, path: str, extensions: Tuple[str, ...]):
+        """Watch the files of a directory that end with one of the extensions"""
+        self.targets[name] = (path, extensions)
+        self._reported[name] = self._latest[name] = self._snapshot(name)
+
+    def watch_file(self, name: str, path: str):
+        """Watch a single file"""
+        self.targets[name] = (path, None)
+        self._reported[name] = self._latest[name] = self._snapshot(name)
+
+    def _snapshot(self, name: str) -> Snapshot:
+        path, extensions = self.targets[name]
+        snapshot: Snapshot = {}
+        if extensions is None:
+            try:
+                stat_info = os.stat(path)
+            except OSError:
+                return snapshot
+            snapshot[path] = (stat_info.st_mtime_ns, stat_info.st_size)
+            return snapshot
+        if not os.path.isdir(path):
+            return snapshot
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.endswith(extensions) and entry.is_file():
+                    stat_info = entry.stat()
+                    snapshot[entry.path] = (stat_info.st_mtime_ns, stat_info.st_size)
+        return snapshot
+
+    def poll(self) -> Dict[str, FileChanges]:
+        """Rescan all targets; return the settled changes per target name (empty while a burst is ongoing)"""
+        now = self.clock()
+        for name in self.targets:
+            try:
+                snapshot = self._snapshot(name)
+            except OSError:
+                continue
+            if snapshot != self._latest[name]:
+                self._latest[name] = snapshot
+                self._last_change = now
+
+        if self._last_change is None or now - self._last_change < self.settle_seconds:
+            return {}
+        self._last_change = None
+
+        changes: Dict[str, FileChanges] = {}
+        for name in self.targets:
+            before, after = self._reported[name], self._latest[name]
+            if before == after:
+                continue
+            target_changes = FileChanges()
+            for path, signature in after.items():
+                if path not in before:
+                    target_changes.added.append(path)
+                elif before[path] != signature:
+                    target_changes.modified.append(path)
+            target_changes.removed = [path for path in before if path not in after]
+            self._reported[name] = after
+            if target_changes:
+                changes[name] = target_changes
+        return changes
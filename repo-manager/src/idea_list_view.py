@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Idea List View - Virtualized ttk.Treeview that only materialises the visible rows
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Optional, Sequence, Tuple
+
+
+class VirtualTreeview(ttk.Frame):
+    """Table view over a logical list of rows that may be far larger than the screen.
+
+    Only as many Treeview items as fit in the widget are ever created. Scrolling
+    moves a window (offset) over the logical rows and re-fills those items from
+    get_values(row), so refreshing or editing the list costs a handful of Tk
+    calls regardless of how many rows there are.
+    """
+
+    def __init__(self, master, columns: Sequence[Tuple[str, str, int]],
+                 get_values: Callable[[int], Sequence], on_select: Callable[[int], None],
+                 on_sort: Optional[Callable[[str], None]] = None, row_height: int = 20):
+        super().__init__(master)
+        self.get_values = get_values
+        self.on_select = on_select
+        self.on_sort = on_sort
+        self.row_height = row_height
+        self.row_count = 0
+        self.offset = 0
+        self.visible_count = 1
+        self.selected_row: Optional[int] = None
+        self.column_titles = {name: title for name, title, _ in columns}
+        self._header_height = row_height + 4
+        # Item selected programmatically; its (queued) <<TreeviewSelect>> must not count as a click
+        self._synced_slot: Optional[str] = None
+
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        style = ttk.Style(self)
+        style.configure('Virtual.Treeview', rowheight=row_height)
+
+        self.tree = ttk.Treeview(self, columns=[name for name, _, _ in columns], show='headings',
+                                 selectmode='browse', style='Virtual.Treeview')
+        for name, title, width in columns:
+            self.tree.heading(name, text=title, command=lambda name=name: self._sort(name))
+            self.tree.column(name, width=width)
+        self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+
+        self.tree.bind('<Configure>', self._on_configure)
+        self.tree.bind('<<TreeviewSelect>>', self._on_tree_select)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda event: self.scroll(-3))
+        self.tree.bind('<Button-5>', lambda event: self.scroll(3))
+        self.tree.bind('<Up>', lambda event: self._move_selection(-1))
+        self.tree.bind('<Down>', lambda event: self._move_selection(1))
+        self.tree.bind('<Prior>', lambda event: self._move_selection(-self.visible_count))
+        self.tree.bind('<Next>', lambda event: self._move_selection(self.visible_count))
+        self.tree.bind('<Home>', lambda event: self._move_selection(-self.row_count))
+        self.tree.bind('<End>', lambda event: self._move_selection(self.row_count))
+
+    # Public API
+
+    def set_row_count(self, row_count: int, scroll_to_top: bool = False):
+        """Change the number of logical rows and re-render the visible window"""
+        self.row_count = row_count
+        if self.selected_row is not None and self.selected_row >= row_count:
+            self.selected_row = None
+        self.offset = self._clamp_offset(0 if scroll_to_top else self.offset)
+        self.refresh()
+
+    def refresh(self):
+        """Re-fill every visible row from get_values"""
+        wanted = min(self.visible_count, max(self.row_count - self.offset, 0))
+        children = self.tree.get_children()
+        for slot in range(len(children), wanted):
+            self.tree.insert('', tk.END, iid=str(slot))
+        for slot in range(wanted, len(children)):
+            self.tree.delete(str(slot))
+        for slot in range(wanted):
+            self.tree.item(str(slot), values=list(self.get_values(self.offset + slot)))
+        self._sync_selection()
+        self._update_scrollbar()
+
+    def refresh_row(self, row: int):
+        """Re-fill a single logical row if it is currently visible"""
+        slot = row - self.offset
+        if 0 <= slot < self.visible_count and self.tree.exists(str(slot)):
+            self.tree.item(str(slot), values=list(self.get_values(row)))
+
+    def select(self, row: Optional[int]):
+        """Select a logical row without notifying on_select"""
+        self.selected_row = row
+        self._sync_selection()
+
+    def clear_selection(self):
+        self.select(None)
+
+    def see(self, row: int):
+        """Scroll so that a logical row is visible"""
+        if row < self.offset:
+            self.scroll_to(row)
+        elif row >= self.offset + self.visible_count:
+            self.scroll_to(row - self.visible_count + 1)
+
+    def scroll_to(self, offset: int):
+        offset = self._clamp_offset(offset)
+        if offset != self.offset:
+            self.offset = offset
+            self.refresh()
+
+    def scroll(self, rows: int):
+        self.scroll_to(self.offset + rows)
+        return "break"
+
+    def set_sort_indicator(self, column: Optional[str], descending: bool = False):
+        """Show an arrow on the column the list is sorted by"""
+        for name, title in self.column_titles.items():
+            if name == column:
+                title = f"{title} {'▼' if descending else '▲'}"
+            self.tree.heading(name, text=title)
+
+    # Internals
+
+    def _clamp_offset(self, offset: int) -> int:
+        return max(0, min(offset, self.row_count - self.visible_count))
+
+    def _sync_selection(self):
+        slot = None if self.selected_row is None else self.selected_row - self.offset
+        if slot is not None and 0 <= slot < self.visible_count and self.tree.exists(str(slot)):
+            self._synced_slot = str(slot)
+            if self.tree.selection() != (str(slot),):
+                self.tree.selection_set(str(slot))
+            self.tree.focus(str(slot))
+        else:
+            self._synced_slot = None
+            if self.tree.selection():
+                self.tree.selection_remove(*self.tree.selection())
+
+    def _update_scrollbar(self):
+        if self.row_count <= 0:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        first = self.offset / self.row_count
+        last = min(self.offset + self.visible_count, self.row_count) / self.row_count
+        self.scrollbar.set(first, last)
+
+    def _on_configure(self, event):
+        children = self.tree.get_children()
+        if children:
+            bbox = self.tree.bbox(children[0])
+            if bbox:
+                self._header_height = bbox[1]
+        visible_count = max(1, (event.height - self._header_height) // self.row_height)
+        if visible_count != self.visible_count:
+            self.visible_count = visible_count
+            self.offset = self._clamp_offset(self.offset)
+            self.refresh()
+
+    def _on_scrollbar(self, *args):
+        if args[0] == 'moveto':
+            self.scroll_to(int(round(float(args[1]) * self.row_count)))
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            self.scroll(amount * self.visible_count if args[2] == 'pages' else amount)
+
+    def _on_mousewheel(self, event):
+        # Windows reports multiples of 120, macOS reports small deltas
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self.scroll(-3 * delta)
+
+    def _on_tree_select(self, event):
+        selection = self.tree.selection()
+        if not selection or selection[0] == self._synced_slot:
+            return
+        self._synced_slot = selection[0]
+        self.selected_row = self.offset + int(selection[0])
+        self.on_select(self.selected_row)
+
+    def _move_selection(self, step: int):
+        if self.row_count == 0:
+            return "break"
+        current = self.selected_row if self.selected_row is not None else (self.offset - 1 if step > 0 else self.offset)
+        row = max(0, min(current + step, self.row_count - 1))
+        self.see(row)
+        if row != self.selected_row:
+            self.select(row)
+            self.on_select(row)
+        return "break"
+
+    def _sort(self, column: str):
+        if self.on_sort is not None:
+            self.on_sort(column)
+
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Idea Model - Compact in-memory records for ideas and their related items
+"""
+
+import sys
+from collections.abc import Mapping, MutableMapping
+from typing import Dict, List, Any, Iterator, Tuple
+
+
+IDEA_FIELDS = ('idea_id', 'title', 'description', 'related_items', 'maturity_score',
+               'personal_interest_score', 'trend_score', 'tags')
+RELATED_ITEM_FIELDS = ('week', 'item_id', 'section')
+_MISSING = object()
+# One tuple object per distinct key order, shared by every record that has it
+_key_orders: Dict[Tuple[str, ...], Tuple[str, ...]] = {RELATED_ITEM_FIELDS: RELATED_ITEM_FIELDS}
+
+
+def shared_keys(keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    return _key_orders.setdefault(keys, keys)
+
+
+def intern_string(value: Any) -> Any:
+    """Share one copy of repeated strings (weeks, sections, item ids, tags)"""
+    return sys.intern(value) if type(value) is str else value
+
+
+class Record(MutableMapping):
+    """Dict-compatible record with a slot per schema field.
+
+    Fields outside the schema go to a side dict and the original key order is
+    kept in a shared tuple, so absent fields stay absent and to_dict()
+    reproduces the JSON object the record was built from exactly. Records
+    compare equal to dicts with the same content.
+    """
+
+    __slots__ = ('_keys', '_extra')
+    FIELDS: Tuple[str, ...] = ()
+    FIELD_SET = frozenset()
+
+    def __init__(self, data: Mapping = ()):
+        pairs = data.items() if type(data) is dict or isinstance(data, Mapping) else list(data)
+        fields = self.FIELD_SET
+        convert = self.convert
+        extra = None
+        for key, value in pairs:
+            if key in fields:
+                object.__setattr__(self, key, convert(key, value))
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        self._extra = extra
+        self._keys = shared_keys(tuple(key for key, _ in pairs))
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Record":
+        return data if type(data) is cls else cls(data)
+
+    @staticmethod
+    def convert(key: str, value: Any) -> Any:
+        """Compact representation of a field value (overridden per record type)"""
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.FIELD_SET:
+            value = getattr(self, key, _MISSING)
+        elif self._extra is not None:
+            value = self._extra.get(key, _MISSING)
+        else:
+            value = _MISSING
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.FIELD_SET:
+            return getattr(self, key, default)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self.FIELD_SET:
+            object.__setattr__(self, key, self.convert(key, value))
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+        if key not in self._keys:
+            self._keys = shared_keys(self._keys + (key,))
+
+    def __delitem__(self, key: str):
+        if key not in self._keys:
+            raise KeyError(key)
+        if key in self.FIELD_SET:
+            object.__delattr__(self, key)
+        else:
+            del self._extra[key]
+            if not self._extra:
+                self._extra = None
+        self._keys = shared_keys(tuple(name for name in self._keys if name != key))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        if len(other) != len(self._keys):
+            return False
+        for key in self._keys:
+            if other.get(key, _MISSING) != self[key]:
+                return False
+        return True
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def copy(self) -> Dict[str, Any]:
+        return self.to_dict()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain JSON-ready dict with the original key order"""
+        return {key: self[key] for key in self._keys}
+
+
+class RelatedItem(Record):
+    """A (week, item_id, section) reference from an idea to a weekly log item"""
+
+    __slots__ = RELATED_ITEM_FIELDS
+    FIELDS = RELATED_ITEM_FIELDS
+    FIELD_SET = frozenset(RELATED_ITEM_FIELDS)
+
+    @staticmethod
+    def convert(key: str, value: Any) -> Any:
+        return intern_string(value)
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "RelatedItem":
+        if type(data) is cls:
+            return data
+        # Fast path for the usual exact {week, item_id, section} shape
+        if type(data) is dict and tuple(data) == RELATED_ITEM_FIELDS:
+            week, item_id, section = data.values()
+            item = object.__new__(cls)
+            item.week = sys.intern(week) if type(week) is str else week
+            item.item_id = sys.intern(item_id) if type(item_id) is str else item_id
+            item.section = sys.intern(section) if type(section) is str else section
+            item._keys = RELATED_ITEM_FIELDS
+            item._extra = None
+            return item
+        return cls(data)
+
+
+def to_related_items(value: Any) -> Any:
+    """Turn related item dicts into RelatedItem records; anything malformed is kept as it is"""
+    if type(value) is not list:
+        return value
+    from_dict = RelatedItem.from_dict
+    return [from_dict(item) if type(item) is dict or isinstance(item, Mapping) else item for item in value]
+
+
+class Idea(Record):
+    """One idea from the repository (see repo.schema.json)"""
+
+    __slots__ = IDEA_FIELDS
+    FIELDS = IDEA_FIELDS
+    FIELD_SET = frozenset(IDEA_FIELDS)
+
+    @staticmethod
+    def convert(key: str, value: Any) -> Any:
+        if key == 'related_items':
+            return to_related_items(value)
+        if key == 'tags' and type(value) is list:
+            return [sys.intern(tag) if type(tag) is str else tag for tag in value]
+        return value
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {key: self[key] for key in self._keys}
+        related_items = data.get('related_items')
+        if isinstance(related_items, list):
+            data['related_items'] = [item.to_dict() if isinstance(item, RelatedItem) else item
+                                     for item in related_items]
+        return data
+
+
+def to_ideas(repo_data: List[Any]) -> List[Any]:
+    """Convert plain idea dicts to Idea records in place (dropping each dict as it goes); other entries are kept"""
+    for position, idea in enumerate(repo_data):
+        if type(idea) is dict:
+            repo_data[position] = Idea(idea)
+    return repo_data
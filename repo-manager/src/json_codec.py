@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+JSON Codec - Fast JSON parsing and serialisation (orjson when installed, stdlib otherwise) with a configurable on-disk format
+"""
+
+import json
+import os
+import sys
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# ECHOFORGE_JSON_BACKEND=json forces the standard library even when orjson is installed
+BACKEND = "orjson" if orjson is not None and os.environ.get("ECHOFORGE_JSON_BACKEND") != "json" else "json"
+# On-disk formats: indented for reading by eye, or compact (smaller, faster to parse)
+STORAGE_FORMATS = {'pretty': 2, 'compact': None}
+# Passed as indent to mean "whatever the configured storage format is"
+STORAGE_FORMAT = object()
+
+_storage_format = os.environ.get("ECHOFORGE_JSON_FORMAT", "pretty")
+if _storage_format not in STORAGE_FORMATS:
+    _storage_format = "pretty"
+
+
+def set_storage_format(name: str):
+    """Choose how data files are written from now on: 'pretty' or 'compact'"""
+    global _storage_format
+    if name not in STORAGE_FORMATS:
+        raise ValueError(f"Unknown JSON storage format: {name} (expected one of {', '.join(STORAGE_FORMATS)})")
+    _storage_format = name
+
+
+def storage_format() -> str:
+    return _storage_format
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document; errors are json.JSONDecodeError with either backend"""
+    if BACKEND == "orjson":
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+
+def to_json_value(value: Any) -> Any:
+    """Fallback for objects neither encoder knows, such as Idea records (anything with to_dict())"""
+    to_dict = getattr(value, 'to_dict', None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def dumps_bytes(data: Any, indent: Any = None) -> bytes:
+    """Serialise to UTF-8 bytes; indent is None (compact), 2, or STORAGE_FORMAT"""
+    if indent is STORAGE_FORMAT:
+        indent = STORAGE_FORMATS[_storage_format]
+    if BACKEND == "orjson" and indent in (None, 2):
+        try:
+            return orjson.dumps(data, default=to_json_value, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            # Values orjson refuses (e.g. non-string keys) still serialise the stdlib way
+            pass
+    if indent is None:
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=to_json_value).encode('utf-8')
+    return json.dumps(data, indent=indent, ensure_ascii=False, default=to_json_value).encode('utf-8')
+
+
+def dumps(data: Any, indent: Any = None) -> str:
+    return dumps_bytes(data, indent).decode('utf-8')
+
+
+def load_file(path: str) -> Any:
+    """Read and parse a JSON file in one go"""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def reformat_file(path: str, indent: Optional[int]) -> bool:
+    """Rewrite a JSON file in another format; returns False when it already is in that format"""
+    from atomic_io import atomic_write_bytes
+
+    with open(path, 'rb') as f:
+        original = f.read()
+    formatted = dumps_bytes(loads(original), indent)
+    if formatted == original:
+        return False
+    atomic_write_bytes(path, formatted)
+    return True
+
+
+def main():
+    """Rewrite JSON data files in the compact or pretty format"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert EchoForge JSON files between compact and pretty formats")
+    parser.add_argument("paths", nargs="+", help="JSON files or directories (searched recursively)")
+    parser.add_argument("--format", choices=list(STORAGE_FORMATS), required=True)
+    args = parser.parse_args()
+
+    indent = STORAGE_FORMATS[args.format]
+    rewritten = total = 0
+    for path in args.paths:
+        if os.path.isdir(path):
+            files = [os.path.join(directory, name) for directory, _, names in os.walk(path)
+                     for name in sorted(names) if name.endswith('.json')]
+        else:
+            files = [path]
+        for file_path in files:
+            total += 1
+            try:
+                rewritten += reformat_file(file_path, indent)
+            except (OSError, ValueError) as e:
+                print(f"Skipped {file_path}: {e}", file=sys.stderr)
+    print(f"Rewrote {rewritten} of {total} JSON files as {args.format} (backend: {BACKEND})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
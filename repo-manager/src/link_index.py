@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Link Index - Reverse index from weekly log items to the ideas that reference them
+"""
+
+from collections.abc import Mapping
+from typing import Dict, List, Any, Iterable, Tuple
+
+
+# (week, section, item_id), the same key SourceStore.item_index uses
+ItemKey = Tuple[str, str, str]
+
+
+class LinkIndex:
+    """Which ideas reference each weekly item, updated one idea at a time.
+
+    Links are grouped per week as week -> (section, item_id) -> idea ids (an
+    insertion-ordered dict used as a set), so a week's links can be listed
+    without scanning the other weeks. Each idea remembers the keys it added,
+    which makes replacing or removing an idea touch only its own items.
+    """
+
+    def __init__(self):
+        self.weeks: Dict[str, Dict[Tuple[str, str], Dict[str, None]]] = {}
+        self.idea_keys: Dict[str, List[ItemKey]] = {}
+
+    def __len__(self) -> int:
+        """Number of distinct weekly items linked to at least one idea"""
+        return sum(len(links) for links in self.weeks.values())
+
+    def __contains__(self, idea_id: object) -> bool:
+        return idea_id in self.idea_keys
+
+    @staticmethod
+    def item_keys(related_items: Any) -> List[ItemKey]:
+        """Keys of the well-formed related items, in order and without repeats"""
+        keys: Dict[ItemKey, None] = {}
+        if isinstance(related_items, list):
+            for item in related_items:
+                if isinstance(item, Mapping):
+                    week, section, item_id = item.get('week'), item.get('section'), item.get('item_id')
+                    if isinstance(week, str) and isinstance(section, str) and isinstance(item_id, str):
+                        keys[(week, section, item_id)] = None
+        return list(keys)
+
+    def add(self, idea_id: str, related_items: Any):
+        """Index an idea's related items, replacing any previous version of the idea"""
+        if idea_id in self.idea_keys:
+            self.remove(idea_id)
+        keys = self.item_keys(related_items)
+        for week, section, item_id in keys:
+            self.weeks.setdefault(week, {}).setdefault((section, item_id), {})[idea_id] = None
+        self.idea_keys[idea_id] = keys
+
+    def remove(self, idea_id: str):
+        """Drop an idea's links"""
+        for week, section, item_id in self.idea_keys.pop(idea_id, []):
+            links = self.weeks.get(week)
+            if links is None:
+                continue
+            ideas = links.get((section, item_id))
+            if ideas is not None:
+                ideas.pop(idea_id, None)
+                if not ideas:
+                    del links[(section, item_id)]
+                    if not links:
+                        del self.weeks[week]
+
+    def clear(self):
+        self.weeks.clear()
+        self.idea_keys.clear()
+
+    def ideas_for(self, week: str, section: str, item_id: str) -> List[str]:
+        """IDs of the ideas that reference one weekly item"""
+        return list(self.weeks.get(week, {}).get((section, item_id), ()))
+
+    def week_links(self, week: str) -> Dict[Tuple[str, str], List[str]]:
+        """(section, item_id) -> idea IDs for every linked item of a week"""
+        return {key: list(ideas) for key, ideas in self.weeks.get(week, {}).items()}
+
+    def linked_weeks(self) -> List[str]:
+        return sorted(self.weeks)
+
+    def is_linked(self, week: str, section: str, item_id: str) -> bool:
+        return (section, item_id) in self.weeks.get(week, ())
+
+    def unlinked(self, week: str, items: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """The (section, item_id) pairs of a week that no idea references"""
+        links = self.weeks.get(week, {})
+        return [key for key in items if key not in links]
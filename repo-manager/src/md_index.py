@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Markdown Index - Heading and bullet byte offsets of the weekly markdown logs, read lazily through mmap
+"""
+
+import hashlib
+import mmap
+import os
+import re
+from typing import Dict, List, Any, Optional, Tuple
+
+from atomic_io import atomic_write_json
+from json_codec import load_file
+
+
+# Bump when the layout of an index entry changes so old cache files are rebuilt
+INDEX_VERSION = 1
+
+HEADING = re.compile(rb'^(#{1,6})[ \t]+(.*?)[ \t#]*$')
+BULLET = re.compile(rb'^(?:[-*+]|\d+[.)])[ \t]')
+FENCE = re.compile(rb'^(?:```|~~~)')
+ITEM_NUMBER = re.compile(r'(\d+)$')
+
+
+def section_key(title: str) -> str:
+    """Weekly log section name for a heading, e.g. "Experiments & Research" -> experiments_and_research"""
+    words = re.findall(r'[a-z0-9]+', title.lower().replace('&', ' and '))
+    return '_'.join(words)
+
+
+def cache_directory() -> str:
+    """Directory for the tool's own caches: $ECHOFORGE_CACHE_DIR, else the per-user cache directory"""
+    override = os.environ.get('ECHOFORGE_CACHE_DIR')
+    if override:
+        return override
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'echoforge')
+
+
+def default_cache_path(md_logs_path: str) -> str:
+    """Offset cache file for a markdown log directory, kept outside the data tree"""
+    digest = hashlib.blake2s(os.path.realpath(md_logs_path).encode('utf-8'), digest_size=8).hexdigest()
+    return os.path.join(cache_directory(), 'md-index', digest + '.json')
+
+
+def index_markdown(data: bytes) -> List[List[Any]]:
+    """Return [level, title, start, end, [[bullet_start, bullet_end], ...]] for every heading in a markdown log.
+
+    A section runs from its heading line to the next heading of the same or a
+    higher level. Bullets are the top-level list entries directly under the
+    heading, each running until the next bullet or heading with trailing blank
+    lines left out. Headings inside fenced code blocks are ignored.
+    """
+    sections: List[List[Any]] = []
+    open_sections: List[List[Any]] = []
+    bullet: Optional[List[int]] = None
+    in_fence = False
+    content_end = 0
+    position = 0
+
+    def close_bullet():
+        if bullet is not None:
+            bullet[1] = max(content_end, bullet[0])
+
+    for line in data.splitlines(keepends=True):
+        start = position
+        position += len(line)
+        text = line.rstrip(b'\r\n')
+        if FENCE.match(text):
+            in_fence = not in_fence
+        heading = None if in_fence else HEADING.match(text)
+        if heading:
+            close_bullet()
+            bullet = None
+            level = len(heading.group(1))
+            while open_sections and open_sections[-1][0] >= level:
+                open_sections.pop()[3] = start
+            section = [level, heading.group(2).decode('utf-8', 'replace'), start, len(data), []]
+            sections.append(section)
+            open_sections.append(section)
+        elif not in_fence and open_sections and BULLET.match(text):
+            close_bullet()
+            bullet = [start, position]
+            open_sections[-1][4].append(bullet)
+        if text.strip():
+            content_end = start + len(text)
+    close_bullet()
+    return sections
+
+
+class MarkdownIndex:
+    """Section offsets of one markdown log; text is only read from the file when a range is asked for"""
+
+    def __init__(self, path: str, size: int, mtime: float, sections: List[List[Any]]):
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.sections = sections
+        self._by_key: Dict[str, List[Any]] = {}
+        for section in sections:
+            self._by_key.setdefault(section_key(section[1]), section)
+
+    @classmethod
+    def build(cls, path: str, size: Optional[int] = None, mtime: Optional[float] = None) -> "MarkdownIndex":
+        """Index a log in one pass; size and mtime default to the file's current ones"""
+        if size is None or mtime is None:
+            stat_info = os.stat(path)
+            size, mtime = stat_info.st_size, stat_info.st_mtime
+        with open(path, 'rb') as f:
+            data = f.read()
+        return cls(path, size, mtime, index_markdown(data))
+
+    def headings(self) -> List[Tuple[int, str]]:
+        return [(section[0], section[1]) for section in self.sections]
+
+    def section(self, key: str) -> Optional[List[Any]]:
+        """First section whose heading matches a weekly log section name"""
+        return self._by_key.get(key)
+
+    def read(self, start: int, end: int) -> str:
+        """Decode a byte range of the log through a read-only memory map"""
+        if end <= start:
+            return ""
+        with open(self.path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return mapped[start:end].decode('utf-8', 'replace')
+
+    def item_range(self, section: str, item_id: Optional[str] = None) -> Optional[Tuple[int, int]]:
+        """Byte range of an item's bullet, or of the whole section when the bullet cannot be placed.
+
+        Item IDs end in their position within the section (e1, e2, ...), as
+        the Weekly Archivist numbers the bullets in order.
+        """
+        entry = self.section(section)
+        if entry is None:
+            return None
+        match = ITEM_NUMBER.search(item_id or '')
+        if match:
+            number = int(match.group(1))
+            if 1 <= number <= len(entry[4]):
+                return tuple(entry[4][number - 1])
+        return entry[2], entry[3]
+
+    def item_text(self, section: str, item_id: Optional[str] = None) -> Optional[str]:
+        found = self.item_range(section, item_id)
+        if found is None:
+            return None
+        return self.read(*found).rstrip()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'size': self.size, 'mtime': self.mtime, 'sections': self.sections}
+
+
+class MarkdownIndexStore:
+    """Markdown indexes per week, persisted to one JSON file and rebuilt only for logs whose size or mtime changed
+
+    Without a cache_path, or once writing it has failed, the offsets are only kept in memory.
+    """
+
+    def __init__(self, cache_path: Optional[str]):
+        self.cache_path = cache_path
+        self._indexes: Dict[str, MarkdownIndex] = {}
+        self._stored: Optional[Dict[str, Any]] = None
+        self._dirty = False
+        self.built = 0
+
+    def _load_stored(self) -> Dict[str, Any]:
+        if self._stored is None:
+            self._stored = {}
+            try:
+                cached = load_file(self.cache_path) if self.cache_path else None
+            except (OSError, ValueError):
+                cached = None
+            if isinstance(cached, dict) and cached.get('version') == INDEX_VERSION:
+                self._stored = cached.get('weeks') or {}
+        return self._stored
+
+    def get(self, week: str, path: str, size: int, mtime: float) -> MarkdownIndex:
+        """Return the index of a week's log, reusing the cached offsets while size and mtime match"""
+        index = self._indexes.get(week)
+        if index is not None and index.path == path and (index.size, index.mtime) == (size, mtime):
+            return index
+        stored = self._load_stored().get(week)
+        if isinstance(stored, dict) and (stored.get('size'), stored.get('mtime')) == (size, mtime):
+            index = MarkdownIndex(path, size, mtime, stored.get('sections') or [])
+        else:
+            index = MarkdownIndex.build(path, size, mtime)
+            self._stored[week] = index.to_dict()
+            self._dirty = True
+            self.built += 1
+        self._indexes[week] = index
+        return index
+
+    def forget(self, week: str):
+        self._indexes.pop(week, None)
+
+    def prune(self, weeks):
+        """Drop the cached offsets of logs that no longer exist, once the cache file has been read"""
+        stored = self._stored or {}
+        for week in list(stored):
+            if week not in weeks:
+                del stored[week]
+                self._indexes.pop(week, None)
+                self._dirty = True
+
+    def save(self) -> bool:
+        """Write the offsets to disk if any index was built or dropped since the last save"""
+        if not self._dirty or not self.cache_path:
+            return False
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            atomic_write_json(self.cache_path, {'version': INDEX_VERSION, 'weeks': self._stored}, indent=None)
+        except OSError:
+            # An unwritable cache directory is not an error; keep the offsets in memory for this session
+            self.cache_path = None
+            return False
+        self._dirty = False
+        return True
@@ -0,0 +1,647 @@
+#!/usr/bin/env python3
+"""
+Repo Core - GUI-free loading, indexing, querying and saving of ideas, sources and assessments
+"""
+
+import json
+import os
+from collections.abc import Mapping
+from typing import Dict, List, Any, Iterator, Optional, Set, Tuple
+
+from assessment_cache import AssessmentCache
+from atomic_io import atomic_write_json
+from idea_model import Idea, to_ideas
+from json_codec import dumps
+from link_index import LinkIndex
+from repo_storage import RepoStorage, JsonFileStorage, ShardedStorage
+from search_index import SearchIndex, idea_document
+from source_store import SourceStore
+from tracing import Tracer, CORE_METRICS
+
+
+class RepoCore:
+    """Repository state and operations shared by the GUI, the CLI and scripts.
+
+    Nothing is read in the constructor; callers load only what they need
+    (load_repo_data, load_source_data, load_assessment_index,
+    rebuild_search_index). Errors are raised, never shown, so front ends
+    decide how to report them.
+    """
+
+    SORT_KEYS = {
+        'idea_id': lambda idea: str(idea.get('idea_id', '')).lower(),
+        'title': lambda idea: str(idea.get('title', '')).lower(),
+        'maturity': lambda idea: idea.get('maturity_score') or 0,
+        'interest': lambda idea: idea.get('personal_interest_score') or 0,
+        'trend': lambda idea: idea.get('trend_score') or 0,
+        'tags': lambda idea: ', '.join(idea.get('tags', []) or []).lower(),
+    }
+
+    def __init__(self, data_path: str = "../data", storage_mode: Optional[str] = None,
+                 max_cached_weeks: Optional[int] = None, read_only: bool = False):
+        # Data storage
+        self.data_path = data_path
+        self.repo_data: List[Dict[str, Any]] = []
+        self.repo_file_path = os.path.join(data_path, "REPOSITORY", "repo.json")
+        self.ideas_path = os.path.join(data_path, "REPOSITORY", "ideas")
+        self.db_path = os.path.join(data_path, "echoforge.db")
+        # "single" (repo.json + journal), "sharded" (one file per idea), "sqlite" or None to auto-detect
+        self.storage_mode = storage_mode
+        # Front ends that never change ideas open the storage without write access (SQLite in "ro" mode)
+        self.read_only = read_only
+        # Ideas changed since repo.json was last written
+        self.dirty_ideas: Set[str] = set()
+        
+        # Full-text search over ideas and idea_id -> repo_data position
+        self.search_index = SearchIndex()
+        self.idea_positions: Optional[Dict[str, int]] = None
+        # Idea list sort keys per column, aligned with repo_data positions; built on first use
+        self.sort_keys: Dict[str, List[Any]] = {}
+        # Weekly item -> IDs of the ideas that reference it; built on first use, then updated on every change
+        self.link_index: Optional[LinkIndex] = None
+        
+        # Source data paths
+        self.json_logs_path = os.path.join(data_path, "json-logs")
+        self.md_logs_path = os.path.join(data_path, "md-logs")
+        self.evaluations_path = os.path.join(data_path, "evaluations")
+        # Repository storage backend (ideas, and assessments for backends that hold them)
+        self.storage = self.open_storage()
+        # Parsed assessment files keyed by (idea_id, type), checked against file mtimes
+        self.max_cached_assessments = 512
+        self.assessment_cache = AssessmentCache(self.evaluations_path, self.max_cached_assessments)
+        # Maximum number of parsed weeks kept in memory (None = unlimited)
+        self.max_cached_weeks = max_cached_weeks
+        self.source_data = SourceStore(self.json_logs_path, self.md_logs_path, self.max_cached_weeks)
+        # Rendered source reports of recently viewed ideas, checked against the idea and its weeks' files
+        self.max_cached_reports = 64
+        self._report_cache = None
+        # Schema violations found as ideas are loaded or saved (idea_id -> messages); weeks keep theirs in source_data
+        self.validate_schemas = True
+        self.idea_errors: Dict[str, List[str]] = {}
+        self.source_data.validate_week = self.validate_week
+        # Spans for the data paths; methods are only wrapped while tracer.enable() is in effect
+        self.tracer = Tracer()
+        self.tracer.instrument(self, CORE_METRICS)
+
+    # Loading
+
+    def open_storage(self) -> RepoStorage:
+        """Create the repository storage backend for the configured mode"""
+        mode = self.storage_mode
+        if mode is None:
+            mode = "single"
+            if os.path.exists(self.db_path):
+                # Only a database filled by 'sqlite_storage.py import' is picked, so an empty one never hides repo.json
+                from sqlite_storage import SqliteStorage
+                if SqliteStorage.is_imported(self.db_path):
+                    mode = "sqlite"
+            if mode == "single" and os.path.exists(os.path.join(self.ideas_path, "index.json")):
+                mode = "sharded"
+        if mode == "sqlite":
+            from sqlite_storage import SqliteStorage
+            return SqliteStorage(self.db_path, mode="ro" if self.read_only else "rw")
+        if mode == "sharded":
+            return ShardedStorage(self.ideas_path)
+        return JsonFileStorage(self.repo_file_path)
+
+    def load_repo_data(self, validate: bool = True) -> List[Dict[str, Any]]:
+        """Load repository data from the storage backend, checking each idea against repo.schema.json"""
+        self.repo_data = to_ideas(self.storage.load_ideas())
+        self.idea_positions = None
+        self.sort_keys = {}
+        self.link_index = None
+        self.idea_errors = {}
+        if validate:
+            for idea in self.repo_data:
+                self.validate_idea(idea)
+        return self.repo_data
+
+    def load_source_data(self) -> int:
+        """Index the JSON and markdown logs; week payloads are parsed on first access"""
+        if self._report_cache is None:
+            # No report rendered yet, so nothing to invalidate
+            return self.source_data.scan()
+        previous = {week: self.source_data.week_signature(week) for week in self.source_data.manifest}
+        count = self.source_data.scan()
+        # Drop the cached reports of weeks whose files changed since the last scan
+        for week in set(previous) | set(self.source_data.manifest):
+            if self.source_data.week_signature(week) != previous.get(week):
+                self._report_cache.invalidate_week(week)
+        return count
+
+    def load_assessment_index(self):
+        """Record which assessment files exist with a single scan of the evaluations directory"""
+        if not self.storage.stores_assessments:
+            self.assessment_cache.scan()
+
+    def reload_repo_data(self) -> int:
+        """Re-read the repository after an outside change, re-indexing only the ideas that differ"""
+        repo_data = to_ideas(self.storage.load_ideas())
+        previous = {idea.get('idea_id'): idea for idea in self.repo_data}
+        changed = 0
+        for idea in repo_data:
+            if previous.pop(idea.get('idea_id'), None) != idea:
+                self.index_idea(idea)
+                self.link_idea(idea)
+                self.report_cache.invalidate_idea(idea.get('idea_id'))
+                self.validate_idea(idea)
+                changed += 1
+        for idea_id in previous:
+            self.search_index.remove(idea_id)
+            if self.link_index is not None:
+                self.link_index.remove(idea_id)
+            self.report_cache.invalidate_idea(idea_id)
+            self.idea_errors.pop(idea_id, None)
+            changed += 1
+        if changed == 0 and len(repo_data) == len(self.repo_data):
+            return 0
+        
+        self.repo_data = repo_data
+        self.idea_positions = None
+        return changed
+
+    def close(self):
+        self.storage.close()
+
+    # Indexing and querying
+
+    def indexed_item_text(self, week: str, section: str, item_id: str) -> Optional[str]:
+        """Return the text of a weekly item if its week is already parsed"""
+        item_data = self.source_data.item_index.get((week, section, item_id))
+        return item_data.get('text') if item_data else None
+
+    def index_idea(self, idea: Dict[str, Any]):
+        """Add or refresh one idea in the search index"""
+        self.search_index.add(idea.get('idea_id'), idea_document(idea, self.indexed_item_text))
+
+    def rebuild_search_index(self):
+        """Index every idea from scratch (used after a full load)"""
+        self.search_index.clear()
+        for idea in self.repo_data:
+            self.index_idea(idea)
+        self.idea_positions = None
+
+    def get_idea_positions(self) -> Dict[str, int]:
+        """Return idea_id -> position in repo_data, rebuilt after the list changes"""
+        if self.idea_positions is None:
+            self.idea_positions = {idea.get('idea_id'): i for i, idea in enumerate(self.repo_data)}
+        return self.idea_positions
+
+    def get_sort_keys(self, column: str) -> List[Any]:
+        """Return the precomputed sort keys of a column, one per repo_data position"""
+        keys = self.sort_keys.get(column)
+        if keys is None:
+            key = self.SORT_KEYS[column]
+            keys = self.sort_keys[column] = [key(idea) for idea in self.repo_data]
+        return keys
+
+    def get_link_index(self) -> LinkIndex:
+        """Return the weekly item -> ideas index, building it from repo_data on first use"""
+        if self.link_index is None:
+            link_index = LinkIndex()
+            for idea in self.repo_data:
+                # Sharded placeholders carry no related_items; read the shard without keeping it
+                link_index.add(idea.get('idea_id'), self.storage.resolve(idea).get('related_items'))
+            self.link_index = link_index
+        return self.link_index
+
+    def link_idea(self, idea: Dict[str, Any]):
+        """Refresh one idea in the link index if the index has been built"""
+        if self.link_index is not None:
+            self.link_index.add(idea.get('idea_id'), idea.get('related_items'))
+
+    def ideas_linked_to(self, week: str, section: str, item_id: str) -> List[str]:
+        """IDs of the ideas whose related_items include a weekly item"""
+        return self.get_link_index().ideas_for(week, section, item_id)
+
+    def get_week_links(self, week: str) -> List[Dict[str, Any]]:
+        """Every item of a week with the ideas linked to it, then links to items missing from the log"""
+        links = self.get_link_index().week_links(week)
+        rows = []
+        if week in self.source_data:
+            for section, item_data in self.source_data.week_items(week):
+                rows.append({'section': section, 'item_id': item_data['id'], 'text': item_data.get('text', ''),
+                             'idea_ids': links.pop((section, item_data['id']), []), 'found': True})
+        for (section, item_id), idea_ids in links.items():
+            rows.append({'section': section, 'item_id': item_id, 'text': '', 'idea_ids': idea_ids, 'found': False})
+        return rows
+
+    def find_orphan_items(self, weeks: Optional[List[str]] = None) -> Dict[str, Dict[str, List[str]]]:
+        """Return week -> section -> IDs of the weekly items no idea references (all weeks by default)"""
+        link_index = self.get_link_index()
+        orphans: Dict[str, Dict[str, List[str]]] = {}
+        for week in (self.source_data.weeks() if weeks is None else weeks):
+            if week not in self.source_data:
+                continue
+            items = [(section, item_data['id']) for section, item_data in self.source_data.week_items(week)]
+            sections: Dict[str, List[str]] = {}
+            for section, item_id in link_index.unlinked(week, items):
+                sections.setdefault(section, []).append(item_id)
+            if sections:
+                orphans[week] = sections
+        return orphans
+
+    def format_orphan_report(self, orphans: Dict[str, Dict[str, List[str]]]) -> str:
+        """Readable list of unassigned items per week and section"""
+        if not orphans:
+            return "Every weekly item is linked to at least one idea"
+        total = sum(len(item_ids) for sections in orphans.values() for item_ids in sections.values())
+        lines = [f"# Unassigned weekly items: {total} in {len(orphans)} weeks", ""]
+        for week, sections in orphans.items():
+            lines.append(f"## {week} ({sum(len(item_ids) for item_ids in sections.values())} items)")
+            for section, item_ids in sections.items():
+                lines.append(f"- {section}: {', '.join(item_ids)}")
+            lines.append("")
+        return "\n".join(lines)
+
+    def get_full_idea(self, index: int) -> Dict[str, Any]:
+        """Return the full record at a list position, reading its shard if only the index entry is loaded"""
+        idea = self.repo_data[index]
+        if self.storage.is_partial(idea):
+            idea = self.storage.resolve(idea)
+            if type(idea) is dict:
+                idea = Idea(idea)
+            self.repo_data[index] = idea
+        return idea
+
+    def find_idea(self, idea_id: str) -> Optional[Dict[str, Any]]:
+        """Return the full record of an idea by ID"""
+        position = self.get_idea_positions().get(idea_id)
+        return self.get_full_idea(position) if position is not None else None
+
+    def search_ideas(self, query: str, limit: Optional[int] = None) -> List[Tuple[Dict[str, Any], float]]:
+        """Return (idea, score) pairs for a search query, best match first"""
+        positions = self.get_idea_positions()
+        return [(self.repo_data[positions[idea_id]], score)
+                for idea_id, score in self.search_index.search(query, limit=limit) if idea_id in positions]
+
+    # Saving
+
+    def record_change(self, idea: Optional[Dict[str, Any]] = None, previous_id: Optional[str] = None,
+                      deleted_id: Optional[str] = None) -> bool:
+        """Persist an idea upsert or delete through the storage backend"""
+        if deleted_id is not None:
+            self.storage.delete_idea(deleted_id)
+            self.dirty_ideas.add(deleted_id)
+        else:
+            self.storage.save_idea(idea, previous_id)
+            self.dirty_ideas.add(idea.get('idea_id'))
+            if previous_id:
+                self.dirty_ideas.add(previous_id)
+        if self.storage.maintain(self.repo_data):
+            # Every change so far is already persisted in its final form
+            self.dirty_ideas.clear()
+        return True
+
+    def put_idea(self, idea: Dict[str, Any], previous_id: Optional[str] = None) -> Tuple[Optional[int], bool]:
+        """Add an idea or replace previous_id with it; returns (repo_data position, whether it was added)
+
+        Raises ValueError if another idea already has the ID. When the storage backend does not
+        accept the change, repo_data is left as it was and (None, False) is returned.
+        """
+        idea = Idea.from_dict(idea)
+        idea_id = idea.get('idea_id')
+        positions = self.get_idea_positions()
+        if idea_id in positions and idea_id != previous_id:
+            raise ValueError(f"Idea ID already exists: {idea_id}")
+        position = positions.get(previous_id) if previous_id else None
+        replaced = None
+        if position is None:
+            self.repo_data.append(idea)
+            position = len(self.repo_data) - 1
+        else:
+            replaced = self.repo_data[position]
+            self.repo_data[position] = idea
+            del positions[previous_id]
+        positions[idea_id] = position
+        
+        # repo_data is updated first because storage housekeeping (journal compaction) writes it out
+        try:
+            recorded = self.record_change(idea, previous_id)
+        except Exception:
+            self.undo_put_idea(position, replaced)
+            raise
+        if not recorded:
+            self.undo_put_idea(position, replaced)
+            return None, False
+        
+        # Update the search index, item links, cached source reports and schema errors incrementally
+        if previous_id:
+            self.report_cache.invalidate_idea(previous_id)
+        if previous_id and previous_id != idea_id:
+            self.search_index.remove(previous_id)
+            if self.link_index is not None:
+                self.link_index.remove(previous_id)
+            self.idea_errors.pop(previous_id, None)
+        self.index_idea(idea)
+        self.link_idea(idea)
+        self.validate_idea(idea)
+        return position, replaced is None
+
+    def undo_put_idea(self, position: int, replaced: Optional[Dict[str, Any]]):
+        """Take back the in-memory part of a put_idea whose change the storage backend rejected"""
+        if replaced is None:
+            self.repo_data.pop(position)
+        else:
+            self.repo_data[position] = replaced
+        self.idea_positions = None
+
+    def remove_idea(self, idea_id: str):
+        """Delete an idea from the repository, the search index and the link index"""
+        self.repo_data = [idea for idea in self.repo_data if idea.get('idea_id') != idea_id]
+        self.record_change(deleted_id=idea_id)
+        self.search_index.remove(idea_id)
+        if self.link_index is not None:
+            self.link_index.remove(idea_id)
+        self.report_cache.invalidate_idea(idea_id)
+        self.idea_errors.pop(idea_id, None)
+        self.idea_positions = None
+
+    def find_duplicate_ideas(self, threshold: float = 0.5) -> List[Dict[str, Any]]:
+        """Clusters of near-identical ideas with their pairwise similarity scores"""
+        from duplicates import DuplicateDetector
+
+        # Sharded placeholders carry no description or related items; read the shards without keeping them
+        return DuplicateDetector(threshold).find([self.storage.resolve(idea) for idea in self.repo_data])
+
+    def merge_duplicate_ideas(self, keep_id: str, merge_ids: List[str]) -> Dict[str, Any]:
+        """Add the related items and tags of merge_ids to keep_id, then delete the merged ideas"""
+        from duplicates import merge_ideas
+
+        target = self.find_idea(keep_id)
+        if target is None:
+            raise KeyError(f"Idea not found: {keep_id}")
+        others = []
+        for idea_id in merge_ids:
+            if idea_id == keep_id:
+                continue
+            other = self.find_idea(idea_id)
+            if other is None:
+                raise KeyError(f"Idea not found: {idea_id}")
+            others.append(other)
+        if self.put_idea(merge_ideas(target, others), keep_id)[0] is None:
+            # Keep the other ideas when the merged record could not be stored
+            raise RuntimeError(f"Failed to store the merged idea: {keep_id}")
+        for other in others:
+            self.remove_idea(other.get('idea_id'))
+        return self.find_idea(keep_id)
+
+    def flush_repo_data(self) -> bool:
+        """Write pending changes in their final form; returns False when there was nothing to write"""
+        if not self.dirty_ideas and not self.storage.has_pending_changes():
+            return False
+        self.storage.flush(self.repo_data)
+        self.dirty_ideas.clear()
+        return True
+
+    def export_pretty(self, path: str) -> int:
+        """Write every idea (full records, whatever the storage backend) to an indented JSON file for reading"""
+        ideas = [self.get_full_idea(position) for position in range(len(self.repo_data))]
+        atomic_write_json(path, ideas, indent=2)
+        return len(ideas)
+
+    # Validation
+
+    def validate_idea(self, idea: Dict[str, Any]) -> List[str]:
+        """Check one idea against repo.schema.json and record the result; returns the violations"""
+        if not self.validate_schemas or self.storage.is_partial(idea):
+            return []
+        # Imported on first use so read-only front ends never pay for the validator
+        from schema_validation import load_schema, format_path
+        schema = load_schema('repo')
+        if schema is None:
+            return []
+        errors = [f"{format_path(path)}: {message}" for path, message in schema.validate_item(idea)]
+        if errors:
+            self.idea_errors[idea.get('idea_id')] = errors
+        else:
+            self.idea_errors.pop(idea.get('idea_id'), None)
+        return errors
+
+    def validate_week(self, week_data: Dict[str, Any]) -> List[str]:
+        """Check a parsed weekly log against weekly.schema.json (called by the source store as weeks load)"""
+        # Weeks with only a markdown log parse to an empty payload
+        if not self.validate_schemas or not week_data:
+            return []
+        from schema_validation import load_schema, format_path
+        schema = load_schema('weekly')
+        if schema is None:
+            return []
+        return [f"{format_path(path)}: {message}" for path, message in schema.validate(week_data)]
+
+    def validate_data(self, workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Validate the stored ideas and every weekly log on disk, with file and line where there is one
+
+        repo.json is checked as a file while it holds every idea. Journal entries not yet compacted
+        into it, and ideas in sharded or SQLite storage, are checked idea by idea after loading.
+        """
+        from schema_validation import data_files, format_path, load_schema, validate_files
+        files = data_files(self.data_path)
+        if isinstance(self.storage, JsonFileStorage) and not self.storage.journal.has_pending_changes():
+            return validate_files(files, workers)
+        try:
+            ideas = self.storage.load_ideas()
+        except ValueError:
+            # repo.json does not parse; the file check reports where
+            return validate_files(files, workers)
+        errors = validate_files([(path, kind) for path, kind in files if kind != 'repo'], workers)
+        schema = load_schema('repo')
+        if schema is None:
+            return errors
+        for idea in ideas:
+            # Sharded placeholders only carry the index fields; check the full shard
+            idea = self.storage.resolve(idea)
+            errors.extend({'file': f"idea {idea.get('idea_id')}", 'line': None, 'path': format_path(path),
+                           'message': message} for path, message in schema.validate_item(idea))
+        return errors
+
+    # Sources
+
+    def get_source_information(self, idea: Dict[str, Any]) -> str:
+        """Get all source information for a given idea"""
+        return "\n".join(self.source_sections(idea))
+
+    @property
+    def report_cache(self):
+        """LRU of rendered source reports (a report_cache.ReportCache), created with the first report"""
+        if self._report_cache is None:
+            from report_cache import ReportCache
+            self._report_cache = ReportCache(self.max_cached_reports)
+        return self._report_cache
+
+    def report_key(self, idea: Dict[str, Any]) -> Tuple[str, Tuple[Tuple[str, Any], ...], bool]:
+        """Cache key of an idea's source report: what it shows of the idea, plus its weeks' file signatures"""
+        # Deferred like the cache itself; only needed once a report is shown
+        import hashlib
+
+        related_items = idea.get('related_items', []) or []
+        content = dumps([idea.get('idea_id'), idea.get('title'), related_items])
+        weeks = sorted({item.get('week', 'Unknown') for item in related_items if isinstance(item, Mapping)}, key=str)
+        return (hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest(),
+                tuple((week, self.source_data.week_signature(week)) for week in weeks), self.validate_schemas)
+
+    def source_sections(self, idea: Dict[str, Any]) -> Iterator[str]:
+        """Yield the source report of an idea section by section, replaying it from the report cache when unchanged"""
+        if not idea or not idea.get('related_items'):
+            yield from self.render_source_sections(idea)
+            return
+        idea_id = idea.get('idea_id')
+        key = self.report_key(idea)
+        cached = self.report_cache.get(idea_id, key)
+        if cached is not None:
+            yield from cached
+            return
+        sections = []
+        for section in self.render_source_sections(idea):
+            sections.append(section)
+            yield section
+        # Only reports that were rendered to the end are kept
+        self.report_cache.put(idea_id, key, sections)
+
+    def render_source_sections(self, idea: Dict[str, Any]) -> Iterator[str]:
+        """Format the source report of an idea section by section: the header, then each week"""
+        if not idea:
+            yield "No idea selected"
+            return
+        
+        related_items = idea.get('related_items', [])
+        if not related_items:
+            yield f"No source information found for idea: {idea.get('idea_id', 'Unknown')}"
+            return
+        
+        source_info = []
+        source_info.append(f"# Source Information for: {idea.get('title', 'Unknown Idea')}")
+        source_info.append(f"Idea ID: {idea.get('idea_id', 'Unknown')}")
+        source_info.append("=" * 60)
+        source_info.append("")
+        yield "\n".join(source_info)
+        
+        # Group items by week to avoid repetition
+        weeks_data = {}
+        for item in related_items:
+            week = item.get('week', 'Unknown')
+            if week not in weeks_data:
+                weeks_data[week] = []
+            weeks_data[week].append(item)
+        
+        for week, items in weeks_data.items():
+            source_info = []
+            source_info.append(f"## Week: {week}")
+            source_info.append("")
+            
+            week_data = None
+            markdown_index = None
+            if week in self.source_data:
+                try:
+                    week_data = self.source_data[week]
+                except Exception as e:
+                    source_info.append(f"⚠️ Failed to load source data for week {week}: {str(e)}")
+                    source_info.append("")
+                try:
+                    markdown_index = self.source_data.markdown_index(week)
+                except OSError as e:
+                    source_info.append(f"⚠️ Failed to index the markdown log for week {week}: {str(e)}")
+                    source_info.append("")
+            
+            if week_data is not None:
+                week_errors = self.source_data.week_errors.get(week)
+                if week_errors:
+                    source_info.append(f"⚠️ Week {week} does not match weekly.schema.json:")
+                    source_info.extend(f"- {error}" for error in week_errors[:10])
+                    source_info.append("")
+                
+                # Add metadata once per week
+                if 'metadata' in week_data:
+                    source_info.append("### Week Metadata:")
+                    source_info.append(f"- Tools Used: {', '.join(week_data['metadata'].get('tools_used', []))}")
+                    source_info.append(f"- Tags: {', '.join(week_data['metadata'].get('tags', []))}")
+                    source_info.append(f"- Generated: {week_data['metadata'].get('generated_at', 'Unknown')}")
+                    source_info.append("")
+                
+                # Add all JSON sources for this week
+                source_info.append("### JSON Sources:")
+                source_info.append("")
+                
+                for item in items:
+                    item_id = item.get('item_id', 'Unknown')
+                    section = item.get('section', 'Unknown')
+                    
+                    source_info.append(f"**Item: {item_id} | Section: {section}**")
+                    
+                    # Look up the specific item in the item index
+                    item_data = self.source_data.get_item(week, section, item_id)
+                    if item_data is not None:
+                        source_info.append("```json")
+                        source_info.append(json.dumps(item_data, indent=2, ensure_ascii=False))
+                        source_info.append("```")
+                        source_info.append("")
+                    else:
+                        source_info.append(f"⚠️ Item {item_id} not found in section {section}")
+                        source_info.append("")
+                    
+                    # The matching part of the markdown log, read from its indexed byte range
+                    if markdown_index is not None:
+                        try:
+                            markdown = markdown_index.item_text(section, item_id)
+                        except (OSError, ValueError) as e:
+                            markdown = f"⚠️ Failed to read the markdown log: {str(e)}"
+                        if markdown is not None:
+                            source_info.append("```markdown")
+                            source_info.append(markdown)
+                            source_info.append("```")
+                        else:
+                            source_info.append(f"⚠️ No heading for section {section} in the markdown log")
+                        source_info.append("")
+            elif week not in self.source_data:
+                source_info.append(f"⚠️ No source data found for week: {week}")
+                source_info.append("")
+            
+            source_info.append("-" * 40)
+            source_info.append("")
+            yield "\n".join(source_info)
+
+    def find_unresolved_related_items(self, related_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return the related items that do not resolve to an item in the weekly logs"""
+        unresolved = []
+        for item in related_items:
+            if not isinstance(item, Mapping):
+                unresolved.append(item)
+                continue
+            try:
+                item_data = self.source_data.get_item(item.get('week'), item.get('section'), item.get('item_id'))
+            except Exception:
+                item_data = None
+            if item_data is None:
+                unresolved.append(item)
+        return unresolved
+
+    # Assessments
+
+    def get_assessment_file_path(self, idea_id: str, assessment_type: str) -> str:
+        """Get the file path for an assessment file"""
+        return self.assessment_cache.path(idea_id, assessment_type)
+
+    def load_assessment(self, idea_id: str, assessment_type: str) -> Optional[Dict[str, Any]]:
+        """Load an assessment for an idea"""
+        if self.storage.stores_assessments:
+            return self.storage.load_assessment(idea_id, assessment_type)
+        return self.assessment_cache.get(idea_id, assessment_type)
+
+    def save_assessment(self, idea_id: str, assessment_type: str, assessment_data: Dict[str, Any]) -> bool:
+        """Save an assessment for an idea; returns False when the stored one is already identical"""
+        if self.load_assessment(idea_id, assessment_type) == assessment_data:
+            return False
+        if self.storage.stores_assessments:
+            self.storage.save_assessment(idea_id, assessment_type, assessment_data)
+        else:
+            self.assessment_cache.put(idea_id, assessment_type, assessment_data)
+        return True
+
+    def save_assessments(self, assessments: Dict[Tuple[str, str], Dict[str, Any]]) -> int:
+        """Write a batch of assessments keyed by (idea_id, type); returns the number written"""
+        if not assessments:
+            return 0
+        if self.storage.stores_assessments:
+            return self.storage.save_assessments(assessments)
+        os.makedirs(self.evaluations_path, exist_ok=True)
+        return self.assessment_cache.put_many(assessments)
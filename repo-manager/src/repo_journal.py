@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Repo Journal - Append-only change log for repo.json with background compaction
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Any, Optional
+
+from atomic_io import atomic_write_json
+from json_codec import dumps, loads
+
+
+class RepoJournal:
+    """Records idea upserts and deletes next to repo.json instead of rewriting it.
+
+    Each change is one JSON line in ``<repo.json>.journal``. Loading replays the
+    journal over the base file, and compaction folds it back into repo.json once
+    the journal grows past a size or age threshold.
+    """
+
+    def __init__(self, repo_file_path: str, max_bytes: int = 1024 * 1024, max_age_seconds: float = 3600):
+        self.repo_file_path = repo_file_path
+        self.path = repo_file_path + ".journal"
+        # Journal being folded into repo.json by a compaction that has not finished yet
+        self.compacting_path = repo_file_path + ".journal.compacting"
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.first_entry_at: Optional[float] = None
+        self.last_error: Optional[Exception] = None
+        self._lock = threading.Lock()
+        self._compaction: Optional[threading.Thread] = None
+
+    def append_upsert(self, idea: Dict[str, Any], previous_id: Optional[str] = None):
+        """Record that an idea was added or replaced (possibly under a new idea_id)"""
+        entry = {'op': 'upsert', 'idea': idea}
+        if previous_id and previous_id != idea.get('idea_id'):
+            entry['previous_id'] = previous_id
+        self._append(entry)
+
+    def append_delete(self, idea_id: str):
+        """Record that an idea was deleted"""
+        self._append({'op': 'delete', 'idea_id': idea_id})
+
+    def _append(self, entry: Dict[str, Any]):
+        entry['ts'] = time.time()
+        line = dumps(entry) + "\n"
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            if self.first_entry_at is None:
+                self.first_entry_at = entry['ts']
+
+    def replay(self, repo_data: List[Dict[str, Any]]) -> int:
+        """Apply journalled changes to repo_data in place and return how many were applied"""
+        positions = {idea.get('idea_id'): i for i, idea in enumerate(repo_data)}
+        applied = 0
+        for path in (self.compacting_path, self.path):
+            for entry in self._read_entries(path):
+                if self._apply(repo_data, positions, entry):
+                    applied += 1
+                if path == self.path and self.first_entry_at is None:
+                    self.first_entry_at = entry.get('ts', time.time())
+
+        # Deletes leave holes so positions stay valid during replay
+        repo_data[:] = [idea for idea in repo_data if idea is not None]
+        return applied
+
+    @staticmethod
+    def _read_entries(path: str):
+        """Yield journal entries, ignoring a torn last line left by a crash"""
+        if not os.path.exists(path):
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    @staticmethod
+    def _apply(repo_data: List[Optional[Dict[str, Any]]], positions: Dict[str, int], entry: Dict[str, Any]) -> bool:
+        op = entry.get('op')
+        if op == 'upsert':
+            idea = entry.get('idea') or {}
+            idea_id = idea.get('idea_id')
+            previous_id = entry.get('previous_id', idea_id)
+            index = positions.pop(previous_id, None)
+            if index is None:
+                index = positions.get(idea_id)
+            if index is None:
+                repo_data.append(idea)
+                index = len(repo_data) - 1
+            else:
+                repo_data[index] = idea
+            positions[idea_id] = index
+            return True
+        if op == 'delete':
+            index = positions.pop(entry.get('idea_id'), None)
+            if index is not None:
+                repo_data[index] = None
+                return True
+        return False
+
+    def size(self) -> int:
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def needs_compaction(self) -> bool:
+        """Return True when the journal is larger or older than the configured thresholds"""
+        if self.size() >= self.max_bytes:
+            return True
+        return self.first_entry_at is not None and time.time() - self.first_entry_at >= self.max_age_seconds
+
+    def is_compacting(self) -> bool:
+        return self._compaction is not None and self._compaction.is_alive()
+
+    def maybe_compact(self, repo_data: List[Dict[str, Any]]) -> bool:
+        """Start a background compaction if the journal crossed a threshold"""
+        if self.is_compacting() or not self.needs_compaction():
+            return False
+        self.compact(repo_data, background=True)
+        return True
+
+    def compact(self, repo_data: List[Dict[str, Any]], background: bool = False):
+        """Fold the journal into repo.json, optionally on a background thread"""
+        self.wait()
+        with self._lock:
+            # New changes go to a fresh journal while this snapshot is written
+            if os.path.exists(self.path) and not os.path.exists(self.compacting_path):
+                os.replace(self.path, self.compacting_path)
+            self.first_entry_at = None
+        # Ideas are replaced rather than mutated on save, so a shallow copy is a stable snapshot
+        snapshot = list(repo_data)
+        if background:
+            self._compaction = threading.Thread(target=self._write_base, args=(snapshot,),
+                                                name="repo-journal-compaction", daemon=False)
+            self._compaction.start()
+        else:
+            self._write_base(snapshot)
+            if self.last_error is not None:
+                raise self.last_error
+
+    def _write_base(self, snapshot: List[Dict[str, Any]]):
+        try:
+            atomic_write_json(self.repo_file_path, snapshot)
+            if os.path.exists(self.compacting_path):
+                os.remove(self.compacting_path)
+            self.last_error = None
+        except Exception as e:
+            self.last_error = e
+
+    def wait(self):
+        """Block until a running background compaction has finished"""
+        if self._compaction is not None:
+            self._compaction.join()
+            self._compaction = None
+
+    def has_pending_changes(self) -> bool:
+        """Return True if there are journalled changes not yet folded into repo.json"""
+        return os.path.exists(self.path) or os.path.exists(self.compacting_path)
@@ -7,168 +7,382 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 import json
 import os
-import glob
-from typing import Dict, List, Any, Optional, Tuple
+import queue
+import time
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime
 
+from assessment_import import collect_assessments
+from file_watcher import PollingWatcher
+from json_codec import STORAGE_FORMATS, dumps, set_storage_format
+from repo_core import RepoCore
+from startup_profile import StartupProfiler
+from repo_storage import JsonFileStorage
+from idea_list_view import VirtualTreeview
+from source_store import SourceStore
 
-class RepoManager:
-    def __init__(self, root: tk.Tk):
+
+class RepoManager(RepoCore):
+    # Idea list columns (name, title, width); every name is sortable through RepoCore.SORT_KEYS
+    IDEA_COLUMNS = [('idea_id', 'ID', 150), ('title', 'Title', 220), ('maturity', 'Mat.', 45),
+                    ('interest', 'Int.', 45), ('trend', 'Trend', 50), ('tags', 'Tags', 150)]
+
+    def __init__(self, root: tk.Tk, profiler: Optional[StartupProfiler] = None):
+        # Repository data, storage, search index, source store and assessment cache
+        super().__init__("../data")
+        
         self.root = root
         self.root.title("EchoForge Repo Manager")
         self.root.geometry("1200x800")
         
-        # Data storage
-        self.repo_data: List[Dict[str, Any]] = []
         self.current_idea: Optional[Dict[str, Any]] = None
-        self.repo_file_path = "../data/REPOSITORY/repo.json"
         
-        # Source data paths
-        self.json_logs_path = "../data/json-logs"
-        self.md_logs_path = "../data/md-logs"
-        self.evaluations_path = "../data/evaluations"
-        self.source_data: Dict[str, Dict[str, Any]] = {}
+        # Idea list rows currently shown (repo_data positions)
+        self.visible_indices: List[int] = []
+        self.search_result_limit = 1000
+        
+        # Idea list sorting (the per-column key arrays live in the core)
+        self.sort_column: Optional[str] = None
+        self.sort_descending = False
+        
+        # Background source loading state
+        self.source_loader_workers: Optional[int] = None
+        self.source_loader_poll_ms = 50
+        self.source_executor: Optional[ThreadPoolExecutor] = None
+        self.source_results: "queue.Queue[Tuple[str, Optional[Dict[str, Any]], Optional[Exception]]]" = queue.Queue()
+        self.source_total = 0
+        self.source_pending = 0
+        self.source_loaded = 0
+        self.source_failed: List[str] = []
+        
+        # Bulk assessment import running off the Tk thread
+        self.assessment_import: Optional[Future] = None
+        self.assessment_import_poll_ms = 50
+        
+        # Polling watcher that picks up files written by other tools while the app runs
+        self.watch_interval_ms = 1000
+        self.file_watcher: Optional[PollingWatcher] = None
+        self.watch_job: Optional[str] = None
+        
+        # Startup phase timings (run.py --profile-startup) and work still running after first paint
+        self.profiler = profiler
+        self.startup_pending = {"search index", "source load"}
+        self.index_chunk_size = 500
+        
+        # Tk-side work traced next to the core data paths (see Diagnostics)
+        self.tracer.instrument(self, {'refresh_idea_list': None, 'load_idea_to_form': None,
+                                      'show_source_information': None})
+        self.diagnostics_refresh_ms = 1000
+        
+        # The source viewer formats weeks for up to this long per Tk callback before yielding to the event loop
+        self.source_chunk_seconds = 0.02
+        
+        # Create the window skeleton only; data and the detail form follow once it has painted
+        self.create_widgets()
+        self.mark_startup("widget build")
+        self.status_var.set("Loading ideas...")
+        self.root.after_idle(self.load_initial_data)
+
+    def mark_startup(self, phase: str):
+        """Record the end of a startup phase when profiling"""
+        if self.profiler is not None:
+            self.profiler.mark(phase)
+
+    def startup_task_done(self, task: str):
+        """Print the startup profile once the deferred startup work has finished"""
+        if task in self.startup_pending:
+            self.startup_pending.discard(task)
+            self.mark_startup(task)
+            if not self.startup_pending and self.profiler is not None:
+                self.profiler.report()
+
+    def load_initial_data(self):
+        """Fill in the painted window: ideas first, then the detail form, search index and sources"""
+        self.root.wait_visibility()
+        self.root.update_idletasks()
+        self.mark_startup("first paint")
         
-        # Load data
         self.load_repo_data()
+        self.sort_keys = {}
+        self.mark_startup("repo load")
+        self.refresh_idea_list()
+        self.root.update_idletasks()
+        self.mark_startup("idea list (interactive)")
+        
+        self.root.after_idle(self.load_secondary_data)
+
+    def load_secondary_data(self):
+        """Build the detail form and start the search index and source loading"""
+        self.create_details_panel()
+        self.mark_startup("detail form")
+        self.start_search_indexing()
         self.load_source_data()
+        self.load_assessment_index()
+        self.mark_startup("source scan")
+        self.start_source_loading()
+        self.start_watching()
+
+    def start_search_indexing(self):
+        """Index ideas in chunks from the event loop so the list stays responsive"""
+        self.search_index.clear()
+        self.index_search_chunk([idea.get('idea_id') for idea in self.repo_data], 0)
+
+    def index_search_chunk(self, idea_ids: List[str], start: int):
+        # Index and schema-check the current version of each idea; ideas deleted meanwhile are skipped
+        positions = self.get_idea_positions()
+        for idea_id in idea_ids[start:start + self.index_chunk_size]:
+            position = positions.get(idea_id)
+            if position is not None:
+                self.index_idea(self.repo_data[position])
+                self.validate_idea(self.repo_data[position])
+        start += self.index_chunk_size
+        if start < len(idea_ids):
+            self.root.after(1, self.index_search_chunk, idea_ids, start)
+            return
+        if self.search_var.get().strip():
+            self.refresh_idea_list()
+        self.startup_task_done("search index")
+
+    def load_assessment_index(self):
+        """Record which assessment files exist with a single scan of the evaluations directory"""
+        try:
+            super().load_assessment_index()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to scan assessments: {str(e)}")
+
+    def start_source_loading(self):
+        """Parse weekly logs on a thread pool and hand the results back to the Tk main loop"""
+        weeks = self.source_data.weeks()
+        # With a cache limit only the most recent weeks are worth prefetching
+        if self.max_cached_weeks is not None:
+            weeks = weeks[-self.max_cached_weeks:] if self.max_cached_weeks > 0 else []
+        weeks = [week for week in weeks if not self.source_data.is_loaded(week)]
+        
+        self.source_total = len(weeks)
+        self.source_pending = len(weeks)
+        self.source_loaded = 0
+        self.source_failed = []
+        if not weeks:
+            self.finish_source_loading()
+            return
         
-        # Create GUI
-        self.create_widgets()
-        self.refresh_idea_list()
+        self.source_executor = ThreadPoolExecutor(max_workers=self.source_loader_workers,
+                                                  thread_name_prefix="source-loader")
+        for week in weeks:
+            entry = dict(self.source_data.manifest[week])
+            future = self.source_executor.submit(SourceStore.parse_week, entry)
+            future.add_done_callback(lambda f, week=week: self.queue_source_result(week, f))
         
-        # Update status with source data info
-        source_weeks = len(self.source_data)
-        self.status_var.set(f"Ready - Loaded {len(self.repo_data)} ideas and {source_weeks} weeks of source data")
+        self.status_var.set(f"Loaded {len(self.repo_data)} ideas - Loading source data 0/{self.source_total} weeks...")
+        self.root.after(self.source_loader_poll_ms, self.poll_source_loading)
+
+    def queue_source_result(self, week: str, future):
+        """Pass a finished parse job to the main thread (called from worker threads)"""
+        if future.cancelled():
+            self.source_results.put((week, None, None))
+        elif future.exception() is not None:
+            self.source_results.put((week, None, future.exception()))
+        else:
+            self.source_results.put((week, future.result(), None))
+
+    def poll_source_loading(self):
+        """Install parsed weeks delivered by the worker threads and update progress"""
+        try:
+            while True:
+                week, week_data, error = self.source_results.get_nowait()
+                self.source_pending -= 1
+                if error is not None or week_data is None:
+                    self.source_failed.append(week)
+                elif not self.source_data.is_loaded(week):
+                    self.source_data.install(week, week_data)
+                    self.source_loaded += 1
+                else:
+                    self.source_loaded += 1
+        except queue.Empty:
+            pass
+        
+        if self.source_pending > 0:
+            self.status_var.set(f"Loaded {self.source_loaded}/{self.source_total} weeks")
+            self.root.after(self.source_loader_poll_ms, self.poll_source_loading)
+        else:
+            self.finish_source_loading()
+
+    def finish_source_loading(self):
+        """Release the loader thread pool and report the final source data status"""
+        if self.source_executor is not None:
+            self.source_executor.shutdown(wait=False)
+            self.source_executor = None
+        
+        # Linked weekly item text is searchable once its week has been parsed
+        for idea in self.repo_data:
+            if idea.get('related_items'):
+                self.index_idea(idea)
+        
+        self.startup_task_done("source load")
+        status = f"Ready - Loaded {len(self.repo_data)} ideas and {len(self.source_data)} weeks of source data"
+        if self.source_failed:
+            status += f" ({len(self.source_failed)} failed: {', '.join(sorted(self.source_failed))})"
+        if self.idea_errors or self.source_data.week_errors:
+            status += (f" - {len(self.idea_errors)} ideas and {len(self.source_data.week_errors)} weeks"
+                       f" do not match the schemas")
+        self.status_var.set(status)
+
+    def stop_source_loading(self):
+        """Cancel any outstanding background parsing"""
+        if self.source_executor is not None:
+            self.source_executor.shutdown(wait=False, cancel_futures=True)
+            self.source_executor = None
+        self.source_pending = 0
+
+    def start_watching(self):
+        """Start polling the logs, evaluations and repo.json for outside changes"""
+        watcher = PollingWatcher()
+        watcher.watch_directory("json-logs", self.json_logs_path, (".json",))
+        watcher.watch_directory("md-logs", self.md_logs_path, (".md",))
+        if not self.storage.stores_assessments:
+            watcher.watch_directory("evaluations", self.evaluations_path, (".json",))
+        if isinstance(self.storage, JsonFileStorage):
+            watcher.watch_file("repo", self.repo_file_path)
+        self.file_watcher = watcher
+        self.watch_job = self.root.after(self.watch_interval_ms, self.poll_file_changes)
+
+    def stop_watching(self):
+        """Stop polling for outside changes"""
+        if self.watch_job is not None:
+            self.root.after_cancel(self.watch_job)
+            self.watch_job = None
+        self.file_watcher = None
+
+    def poll_file_changes(self):
+        """Apply one settled batch of outside changes, then schedule the next poll"""
+        try:
+            changes = self.file_watcher.poll()
+            if changes:
+                self.apply_file_changes(changes)
+        except Exception as e:
+            self.status_var.set(f"Failed to reload changed files: {str(e)}")
+        self.watch_job = self.root.after(self.watch_interval_ms, self.poll_file_changes)
+
+    def apply_file_changes(self, changes):
+        """Patch source data, assessments and the idea list for the files that changed"""
+        summary = []
+        
+        weeks: Set[str] = set()
+        for name in ("json-logs", "md-logs"):
+            if name in changes:
+                for path in changes[name].changed() + changes[name].removed:
+                    weeks.add(os.path.splitext(os.path.basename(path))[0])
+        if weeks:
+            was_loaded = {week for week in weeks if self.source_data.is_loaded(week)}
+            # The rescan forgets exactly the parsed weeks whose files changed
+            self.source_data.scan()
+            for week in weeks:
+                self.report_cache.invalidate_week(week)
+            for week in sorted(weeks):
+                if week in self.source_data and (week in was_loaded or self.max_cached_weeks is None):
+                    try:
+                        self.source_data.load_week(week)
+                    except Exception:
+                        self.source_failed.append(week)
+            for idea in self.repo_data:
+                if any(isinstance(item, Mapping) and item.get('week') in weeks
+                       for item in idea.get('related_items', []) or []):
+                    self.index_idea(idea)
+            invalid_weeks = [week for week in weeks if week in self.source_data.week_errors]
+            summary.append(f"{len(weeks)} weeks ({len(invalid_weeks)} not matching weekly.schema.json)"
+                           if invalid_weeks else f"{len(weeks)} weeks")
+        
+        if "evaluations" in changes:
+            evaluation_changes = changes["evaluations"]
+            keys = {self.assessment_cache.refresh_file(os.path.basename(path))
+                    for path in evaluation_changes.changed() + evaluation_changes.removed}
+            keys.discard(None)
+            if self.current_idea and any(idea_id == self.current_idea.get('idea_id') for idea_id, _ in keys):
+                self.show_assessment_scores(self.current_idea.get('idea_id'))
+            summary.append(f"{len(keys)} assessments")
+        
+        # Our own journal compaction also rewrites repo.json; that reloads to no changes
+        changed_ideas = self.reload_repo_data() if "repo" in changes else 0
+        if changed_ideas:
+            summary.append(f"{changed_ideas} ideas")
+        elif weeks and self.search_var.get().strip():
+            self.refresh_idea_list()
+        
+        if summary:
+            self.status_var.set(f"Reloaded changes from disk: {', '.join(summary)}")
+
+    def reload_repo_data(self) -> int:
+        """Re-read the repository after an outside change and refresh the idea list"""
+        changed = super().reload_repo_data()
+        if changed:
+            self.sort_keys = {}
+            self.refresh_idea_list()
+        return changed
 
     def load_repo_data(self):
-        """Load repository data from JSON file"""
+        """Load repository data from the storage backend"""
         try:
-            if os.path.exists(self.repo_file_path):
-                with open(self.repo_file_path, 'r', encoding='utf-8') as f:
-                    self.repo_data = json.load(f)
-            else:
-                self.repo_data = []
+            if not self.storage.exists():
                 messagebox.showwarning("Warning", f"Repository file not found: {self.repo_file_path}")
+            # Schema checks run with the chunked search indexing, after the list is shown
+            super().load_repo_data(validate=False)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load repository data: {str(e)}")
             self.repo_data = []
 
+    def rebuild_search_index(self):
+        """Index every idea from scratch (used after a full load)"""
+        super().rebuild_search_index()
+        self.sort_keys = {}
+
     def save_repo_data(self):
-        """Save repository data to JSON file"""
+        """Persist any changes not yet written in their final form (folds the journal into repo.json)"""
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.repo_file_path), exist_ok=True)
-            
-            with open(self.repo_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.repo_data, f, indent=2, ensure_ascii=False)
+            if not self.flush_repo_data():
+                self.status_var.set("No changes to save")
+                return
             messagebox.showinfo("Success", "Repository data saved successfully!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save repository data: {str(e)}")
 
-    def load_source_data(self):
-        """Load source data from JSON logs and markdown files"""
+    def export_pretty_json(self):
+        """Export all ideas as indented JSON, whatever format the data files use"""
+        path = filedialog.asksaveasfilename(
+            title="Export Ideas as JSON",
+            defaultextension=".json",
+            initialfile="repo-export.json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        if not path:
+            return
         try:
-            # Load JSON logs
-            json_files = glob.glob(os.path.join(self.json_logs_path, "*.json"))
-            for json_file in json_files:
-                week = os.path.basename(json_file).replace('.json', '')
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    self.source_data[week] = json.load(f)
-            
-            # Load markdown logs
-            md_files = glob.glob(os.path.join(self.md_logs_path, "*.md"))
-            for md_file in md_files:
-                week = os.path.basename(md_file).replace('.md', '')
-                if week not in self.source_data:
-                    self.source_data[week] = {}
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    self.source_data[week]['markdown'] = f.read()
-                    
+            count = self.export_pretty(path)
+            self.status_var.set(f"Exported {count} ideas to {path}")
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load source data: {str(e)}")
+            messagebox.showerror("Error", f"Failed to export ideas: {str(e)}")
 
-    def get_source_information(self, idea: Dict[str, Any]) -> str:
-        """Get all source information for a given idea"""
-        if not idea:
-            return "No idea selected"
-        
-        related_items = idea.get('related_items', [])
-        if not related_items:
-            return f"No source information found for idea: {idea.get('idea_id', 'Unknown')}"
-        
-        source_info = []
-        source_info.append(f"# Source Information for: {idea.get('title', 'Unknown Idea')}")
-        source_info.append(f"Idea ID: {idea.get('idea_id', 'Unknown')}")
-        source_info.append("=" * 60)
-        source_info.append("")
-        
-        # Group items by week to avoid repetition
-        weeks_data = {}
-        for item in related_items:
-            week = item.get('week', 'Unknown')
-            if week not in weeks_data:
-                weeks_data[week] = []
-            weeks_data[week].append(item)
-        
-        for week, items in weeks_data.items():
-            source_info.append(f"## Week: {week}")
-            source_info.append("")
-            
-            if week in self.source_data:
-                week_data = self.source_data[week]
-                
-                # Add metadata once per week
-                if 'metadata' in week_data:
-                    source_info.append("### Week Metadata:")
-                    source_info.append(f"- Tools Used: {', '.join(week_data['metadata'].get('tools_used', []))}")
-                    source_info.append(f"- Tags: {', '.join(week_data['metadata'].get('tags', []))}")
-                    source_info.append(f"- Generated: {week_data['metadata'].get('generated_at', 'Unknown')}")
-                    source_info.append("")
-                
-                # Add all JSON sources for this week
-                source_info.append("### JSON Sources:")
-                source_info.append("")
-                
-                for item in items:
-                    item_id = item.get('item_id', 'Unknown')
-                    section = item.get('section', 'Unknown')
-                    
-                    source_info.append(f"**Item: {item_id} | Section: {section}**")
-                    
-                    # Find the specific item in JSON data
-                    if 'items' in week_data and section in week_data['items']:
-                        items_data = week_data['items'][section]
-                        for item_data in items_data:
-                            if item_data.get('id') == item_id:
-                                source_info.append("```json")
-                                source_info.append(json.dumps(item_data, indent=2, ensure_ascii=False))
-                                source_info.append("```")
-                                source_info.append("")
-                                break
-                    else:
-                        source_info.append(f"⚠️ Item {item_id} not found in section {section}")
-                        source_info.append("")
-            else:
-                source_info.append(f"⚠️ No source data found for week: {week}")
-                source_info.append("")
-            
-            source_info.append("-" * 40)
-            source_info.append("")
-        
-        return "\n".join(source_info)
+    def record_change(self, idea: Optional[Dict[str, Any]] = None, previous_id: Optional[str] = None,
+                      deleted_id: Optional[str] = None) -> bool:
+        """Persist an idea upsert or delete through the storage backend"""
+        try:
+            return super().record_change(idea, previous_id, deleted_id)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to record change: {str(e)}")
+            return False
 
-    def get_assessment_file_path(self, idea_id: str, assessment_type: str) -> str:
-        """Get the file path for an assessment file"""
-        return os.path.join(self.evaluations_path, f"{idea_id}_{assessment_type}.json")
+    def load_source_data(self):
+        """Index the JSON and markdown logs; week payloads are parsed on first access"""
+        try:
+            super().load_source_data()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load source data: {str(e)}")
 
     def load_assessment(self, idea_id: str, assessment_type: str) -> Optional[Dict[str, Any]]:
         """Load an assessment file for an idea"""
-        file_path = self.get_assessment_file_path(idea_id, assessment_type)
         try:
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            return super().load_assessment(idea_id, assessment_type)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load {assessment_type} assessment: {str(e)}")
         return None
@@ -176,12 +390,9 @@ class RepoManager:
     def save_assessment(self, idea_id: str, assessment_type: str, assessment_data: Dict[str, Any]):
         """Save an assessment file for an idea"""
         try:
-            # Ensure directory exists
-            os.makedirs(self.evaluations_path, exist_ok=True)
-            
-            file_path = self.get_assessment_file_path(idea_id, assessment_type)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(assessment_data, f, indent=2, ensure_ascii=False)
+            if not super().save_assessment(idea_id, assessment_type, assessment_data):
+                self.status_var.set(f"{assessment_type.title()} assessment unchanged for {idea_id}")
+                return
             
             messagebox.showinfo("Success", f"{assessment_type.title()} assessment saved successfully!")
         except Exception as e:
@@ -201,6 +412,313 @@ class RepoManager:
         # Create assessment input dialog
         self.show_assessment_input_dialog(idea_id, assessment_type)
 
+    def import_assessments(self):
+        """Bulk import evaluator outputs from JSON/JSONL files and report any rejects"""
+        paths = filedialog.askopenfilenames(
+            title="Select Assessment Files",
+            filetypes=[("JSON / JSONL files", "*.json *.jsonl"), ("All files", "*.*")]
+        )
+        if not paths:
+            return
+        
+        if self.assessment_import is not None:
+            messagebox.showwarning("Warning", "An assessment import is already running!")
+            return
+        
+        self.status_var.set(f"Validating assessments from {len(paths)} files...")
+        known_ids = {idea.get('idea_id') for idea in self.repo_data}
+        # Files are read and validated in the background; the batch is saved here once it is done
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="assessment-import")
+        self.assessment_import = executor.submit(collect_assessments, paths, known_ids)
+        executor.shutdown(wait=False)
+        self.root.after(self.assessment_import_poll_ms, self.poll_assessment_import)
+
+    def poll_assessment_import(self):
+        """Save and report a bulk import once its background validation has finished"""
+        future = self.assessment_import
+        if future is None:
+            return
+        if not future.done():
+            self.root.after(self.assessment_import_poll_ms, self.poll_assessment_import)
+            return
+        self.assessment_import = None
+        
+        try:
+            report = future.result()
+        except Exception as e:
+            self.status_var.set("Assessment import failed")
+            messagebox.showerror("Error", f"Failed to read assessments: {str(e)}")
+            return
+        
+        try:
+            report.written = self.save_assessments(report.accepted)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save assessments: {str(e)}")
+        
+        # Keep the open idea's sliders in step with what was just imported
+        if self.current_idea:
+            self.show_assessment_scores(self.current_idea.get('idea_id'))
+        
+        self.status_var.set(f"Imported {report.written} assessments, rejected {len(report.rejects)}")
+        self.show_import_report(report.summary())
+
+    def show_import_report(self, summary: str):
+        """Show the summary of a bulk assessment import"""
+        self.show_text_report("Assessment Import Report", summary)
+
+    def show_text_report(self, title: str, text: str):
+        """Show read-only text in its own window"""
+        report_window = tk.Toplevel(self.root)
+        report_window.title(title)
+        report_window.geometry("700x400")
+        report_window.columnconfigure(0, weight=1)
+        report_window.rowconfigure(0, weight=1)
+        
+        text_widget = scrolledtext.ScrolledText(report_window, wrap=tk.WORD, font=("Consolas", 10))
+        text_widget.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=10, pady=10)
+        text_widget.insert(tk.END, text)
+        text_widget.config(state=tk.DISABLED)
+        
+        ttk.Button(report_window, text="Close", command=report_window.destroy).grid(row=1, column=0, pady=(0, 10))
+
+    def show_linked_ideas(self):
+        """Show the items of a week with the ideas that reference each of them"""
+        weeks = sorted(set(self.source_data.weeks()) | set(self.get_link_index().linked_weeks()))
+        if not weeks:
+            messagebox.showwarning("Warning", "No weekly logs or linked items found!")
+            return
+        # Start from the open idea's first week, otherwise the latest week
+        related_weeks = [item.get('week') for item in (self.current_idea or {}).get('related_items', []) or []
+                         if isinstance(item, Mapping) and item.get('week') in weeks]
+        
+        window = tk.Toplevel(self.root)
+        window.title("Linked Ideas")
+        window.geometry("1000x500")
+        window.columnconfigure(0, weight=1)
+        window.rowconfigure(1, weight=1)
+        
+        controls = ttk.Frame(window, padding="10 10 10 0")
+        controls.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        ttk.Label(controls, text="Week:").pack(side=tk.LEFT, padx=(0, 5))
+        week_var = tk.StringVar(value=related_weeks[0] if related_weeks else weeks[-1])
+        week_box = ttk.Combobox(controls, textvariable=week_var, values=weeks, state="readonly", width=12)
+        week_box.pack(side=tk.LEFT, padx=(0, 10))
+        unassigned_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(controls, text="Only unassigned", variable=unassigned_var,
+                        command=lambda: refresh()).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(controls, text="Orphan Report", command=self.show_orphan_report).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(controls, text="Close", command=window.destroy).pack(side=tk.LEFT)
+        
+        columns = [('item', 'Item', 110), ('ideas', 'Linked ideas', 260), ('text', 'Text', 460)]
+        tree = ttk.Treeview(window, columns=[name for name, _, _ in columns])
+        tree.heading('#0', text='Section')
+        tree.column('#0', width=120)
+        for name, heading, width in columns:
+            tree.heading(name, text=heading)
+            tree.column(name, width=width)
+        tree.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=10, pady=10)
+        
+        status_label = ttk.Label(window, text="")
+        status_label.grid(row=2, column=0, sticky=tk.W, padx=10, pady=(0, 10))
+        row_ideas: Dict[str, List[str]] = {}
+        
+        def refresh():
+            tree.delete(*tree.get_children())
+            row_ideas.clear()
+            try:
+                rows = self.get_week_links(week_var.get())
+            except Exception as e:
+                status_label.config(text=f"Failed to load week {week_var.get()}: {str(e)}")
+                return
+            linked = sum(1 for row in rows if row['idea_ids'])
+            for row in rows:
+                if unassigned_var.get() and row['idea_ids']:
+                    continue
+                item_text = row['item_id'] if row['found'] else f"{row['item_id']} (missing)"
+                text = ' '.join(row['text'].split())
+                node = tree.insert('', tk.END, text=row['section'],
+                                   values=(item_text, ', '.join(row['idea_ids']), text[:200]))
+                row_ideas[node] = row['idea_ids']
+            status_label.config(text=f"{len(rows)} items, {linked} linked, {len(rows) - linked} unassigned "
+                                     f"- double-click an item to open its first linked idea")
+        
+        def open_linked_idea(event):
+            idea_ids = row_ideas.get(tree.focus())
+            if not idea_ids:
+                return
+            try:
+                idea = self.find_idea(idea_ids[0])
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to load idea: {str(e)}")
+                return
+            if idea is not None:
+                self.current_idea = idea
+                self.load_idea_to_form(idea)
+                self.select_idea_in_list(idea_ids[0])
+        
+        week_box.bind('<<ComboboxSelected>>', lambda event: refresh())
+        tree.bind('<Double-1>', open_linked_idea)
+        refresh()
+
+    def show_duplicates(self):
+        """List clusters of near-duplicate ideas and merge a cluster into one of its ideas"""
+        try:
+            clusters = self.find_duplicate_ideas()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to look for duplicates: {str(e)}")
+            return
+        
+        window = tk.Toplevel(self.root)
+        window.title("Near-Duplicate Ideas")
+        window.geometry("900x500")
+        window.columnconfigure(0, weight=1)
+        window.rowconfigure(0, weight=1)
+        
+        columns = [('title', 'Title', 420), ('score', 'Score', 70), ('text', 'Text', 70), ('items', 'Items', 70)]
+        tree = ttk.Treeview(window, columns=[name for name, _, _ in columns])
+        tree.heading('#0', text='Idea')
+        tree.column('#0', width=220)
+        for name, heading, width in columns:
+            tree.heading(name, text=heading)
+            tree.column(name, width=width, anchor=tk.W if name == 'title' else tk.E)
+        tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=10, pady=10)
+        
+        # Node -> (cluster idea IDs, idea ID of the row or None for the cluster row)
+        nodes: Dict[str, Tuple[List[str], Optional[str]]] = {}
+        for cluster in clusters:
+            parent = tree.insert('', tk.END, text=f"{len(cluster['idea_ids'])} ideas", open=True,
+                                 values=(cluster['titles'][0], f"{cluster['score']:.2f}", "", ""))
+            nodes[parent] = (cluster['idea_ids'], None)
+            for idea_id, title in zip(cluster['idea_ids'], cluster['titles']):
+                # Show the idea's strongest pair within the cluster
+                pair = next(pair for pair in cluster['pairs'] if idea_id in pair['idea_ids'])
+                node = tree.insert(parent, tk.END, text=idea_id, values=(
+                    title, f"{pair['score']:.2f}", f"{pair['text_similarity']:.2f}", f"{pair['item_overlap']:.2f}"))
+                nodes[node] = (cluster['idea_ids'], idea_id)
+        
+        def merge_selected():
+            focus = tree.focus()
+            selection = nodes.get(focus)
+            if selection is None:
+                messagebox.showwarning("Warning", "Select a cluster, or the idea to keep within one", parent=window)
+                return
+            idea_ids, keep_id = selection
+            cluster_node = focus if keep_id is None else tree.parent(focus)
+            keep_id = keep_id or idea_ids[0]
+            merge_ids = [idea_id for idea_id in idea_ids if idea_id != keep_id]
+            if not messagebox.askyesno("Confirm Merge", f"Merge {', '.join(merge_ids)} into {keep_id}?\n\n"
+                                       "Their related items and tags are added to it and they are deleted.",
+                                       parent=window):
+                return
+            try:
+                merged = self.merge_duplicate_ideas(keep_id, merge_ids)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to merge ideas: {str(e)}", parent=window)
+                return
+            for node in (cluster_node, *tree.get_children(cluster_node)):
+                nodes.pop(node, None)
+            tree.delete(cluster_node)
+            self.sort_keys = {}
+            self.refresh_idea_list()
+            self.current_idea = merged
+            self.load_idea_to_form(merged)
+            self.select_idea_in_list(keep_id)
+            self.status_var.set(f"Merged {len(merge_ids)} ideas into {keep_id}")
+        
+        buttons = ttk.Frame(window)
+        buttons.grid(row=1, column=0, pady=(0, 10))
+        ttk.Button(buttons, text="Merge Into Selected", command=merge_selected).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(buttons, text="Close", command=window.destroy).pack(side=tk.LEFT)
+        ttk.Label(window, text=f"{len(clusters)} clusters - select the idea to keep (or a cluster to keep its first idea)"
+                  ).grid(row=2, column=0, sticky=tk.W, padx=10, pady=(0, 10))
+
+    def show_orphan_report(self):
+        """List the weekly items that are not linked to any idea, per week and section"""
+        try:
+            report = self.format_orphan_report(self.find_orphan_items())
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to build the orphan report: {str(e)}")
+            return
+        self.show_text_report("Unassigned Weekly Items", report)
+
+    def show_diagnostics(self):
+        """Show traced timings, bytes and counts per operation, refreshed while the window is open"""
+        window = tk.Toplevel(self.root)
+        window.title("Diagnostics")
+        window.geometry("900x400")
+        window.columnconfigure(0, weight=1)
+        window.rowconfigure(1, weight=1)
+        
+        # Tracing toggle and actions
+        controls = ttk.Frame(window, padding="10 10 10 0")
+        controls.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        enabled_var = tk.BooleanVar(value=self.tracer.enabled)
+        
+        def toggle_tracing():
+            if enabled_var.get():
+                self.tracer.enable()
+            else:
+                self.tracer.disable()
+        
+        ttk.Checkbutton(controls, text="Record traces", variable=enabled_var,
+                        command=toggle_tracing).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(controls, text="Reset", command=self.tracer.reset).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(controls, text="Export...", command=self.export_metrics).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(controls, text="Close", command=window.destroy).pack(side=tk.LEFT)
+        
+        # One row per traced operation
+        columns = [('calls', 'Calls', 60), ('total', 'Total ms', 90), ('mean', 'Mean ms', 80),
+                   ('p95', 'p95 ms', 80), ('max', 'Max ms', 80), ('bytes', 'Bytes', 100),
+                   ('count', 'Items', 70), ('errors', 'Errors', 60)]
+        tree = ttk.Treeview(window, columns=[name for name, _, _ in columns])
+        tree.heading('#0', text='Operation')
+        tree.column('#0', width=200)
+        for name, heading, width in columns:
+            tree.heading(name, text=heading)
+            tree.column(name, width=width, anchor=tk.E)
+        tree.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=10, pady=10)
+        
+        # Cache effectiveness (counted whether or not traces are recorded)
+        cache_label = ttk.Label(window, text="")
+        cache_label.grid(row=2, column=0, sticky=tk.W, padx=10, pady=(0, 10))
+        
+        def milliseconds(seconds):
+            return f"{seconds * 1000:.2f}" if seconds is not None else ""
+        
+        def refresh():
+            if not window.winfo_exists():
+                return
+            tree.delete(*tree.get_children())
+            for row in self.tracer.summary():
+                tree.insert('', tk.END, text=row['name'], values=(
+                    row['calls'], milliseconds(row['seconds']), milliseconds(row['mean_seconds']),
+                    milliseconds(row['p95_seconds']), milliseconds(row['max_seconds']),
+                    row['bytes'], row['count'], row['errors']))
+            reports = self.report_cache.stats()
+            assessments = self.assessment_cache
+            cache_label.config(text=f"Source report cache: {reports['hits']} hits, {reports['misses']} misses, "
+                                    f"{reports['invalidations']} invalidated, "
+                                    f"{reports['entries']}/{reports['max_entries']} reports    "
+                                    f"Assessment cache: {assessments.hits} hits, {assessments.misses} misses")
+            window.after(self.diagnostics_refresh_ms, refresh)
+        
+        refresh()
+
+    def export_metrics(self):
+        """Write the traced metrics to a JSON or CSV file"""
+        path = filedialog.asksaveasfilename(
+            title="Export Metrics",
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("CSV files", "*.csv")]
+        )
+        if not path:
+            return
+        try:
+            self.tracer.export(path)
+            self.status_var.set(f"Metrics written to {path}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export metrics: {str(e)}")
+
     def show_assessment_input_dialog(self, idea_id: str, assessment_type: str):
         """Show dialog for assessment input (file upload or paste)"""
         # Create dialog window
@@ -424,7 +942,7 @@ Required fields for {assessment_type} assessment:
         left_frame = ttk.LabelFrame(main_frame, text="Ideas", padding="10")
         left_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 10))
         left_frame.columnconfigure(0, weight=1)
-        left_frame.rowconfigure(1, weight=1)
+        left_frame.rowconfigure(2, weight=1)
         
         # Idea list controls
         controls_frame = ttk.Frame(left_frame)
@@ -432,22 +950,51 @@ Required fields for {assessment_type} assessment:
         
         ttk.Button(controls_frame, text="New Idea", command=self.new_idea).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(controls_frame, text="Delete", command=self.delete_idea).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(controls_frame, text="Refresh", command=self.refresh_idea_list).pack(side=tk.LEFT)
-        
-        # Idea listbox
-        self.idea_listbox = tk.Listbox(left_frame, width=40)
-        self.idea_listbox.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        self.idea_listbox.bind('<<ListboxSelect>>', self.on_idea_select)
-        
-        # Scrollbar for idea list
-        idea_scrollbar = ttk.Scrollbar(left_frame, orient=tk.VERTICAL, command=self.idea_listbox.yview)
-        idea_scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
-        self.idea_listbox.configure(yscrollcommand=idea_scrollbar.set)
+        ttk.Button(controls_frame, text="Refresh", command=self.refresh_idea_list).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(controls_frame, text="Import Assessments", command=self.import_assessments).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(controls_frame, text="Linked Ideas", command=self.show_linked_ideas).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(controls_frame, text="Duplicates", command=self.show_duplicates).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(controls_frame, text="Diagnostics", command=self.show_diagnostics).pack(side=tk.LEFT)
+        
+        # Search box - filters the list on every keystroke
+        search_frame = ttk.Frame(left_frame)
+        search_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 5))
+        search_frame.columnconfigure(1, weight=1)
+        ttk.Label(search_frame, text="Search:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
+        self.search_entry.grid(row=0, column=1, sticky=(tk.W, tk.E))
+        self.search_var.trace_add('write', lambda *args: self.refresh_idea_list(scroll_to_top=True))
+        
+        # Idea list - virtualized, only the visible rows exist as Treeview items
+        self.idea_list = VirtualTreeview(
+            left_frame,
+            columns=self.IDEA_COLUMNS,
+            get_values=self.get_idea_row_values,
+            on_select=self.on_idea_select,
+            on_sort=self.sort_idea_list)
+        self.idea_list.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Right panel - Idea details
         right_frame = ttk.LabelFrame(main_frame, text="Idea Details", padding="10")
         right_frame.grid(row=1, column=1, sticky=(tk.W, tk.E, tk.N, tk.S))
         right_frame.columnconfigure(1, weight=1)
+        # Its fields are built after the first paint (create_details_panel)
+        self.details_frame = right_frame
+        self.details_built = False
+        
+        # Status bar
+        self.status_var = tk.StringVar()
+        self.status_var.set("Ready")
+        status_bar = ttk.Label(main_frame, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
+        status_bar.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+
+    def create_details_panel(self):
+        """Build the idea detail form (entries, score scales and action buttons)"""
+        if self.details_built:
+            return
+        self.details_built = True
+        right_frame = self.details_frame
         
         # Idea ID
         ttk.Label(right_frame, text="Idea ID:").grid(row=0, column=0, sticky=tk.W, pady=2)
@@ -538,13 +1085,8 @@ Required fields for {assessment_type} assessment:
         ttk.Button(buttons_frame, text="Save Changes", command=self.save_idea).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(buttons_frame, text="Clear Form", command=self.clear_form).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(buttons_frame, text="Save to File", command=self.save_repo_data).pack(side=tk.LEFT, padx=(0, 10))
-        ttk.Button(buttons_frame, text="View Sources", command=self.show_source_information).pack(side=tk.LEFT)
-        
-        # Status bar
-        self.status_var = tk.StringVar()
-        self.status_var.set("Ready")
-        status_bar = ttk.Label(main_frame, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
-        status_bar.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+        ttk.Button(buttons_frame, text="Export JSON...", command=self.export_pretty_json).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(buttons_frame, text="View Sources", command=lambda: self.show_source_information()).pack(side=tk.LEFT)
 
     def update_maturity_label(self, value):
         self.maturity_label.config(text=str(int(float(value))))
@@ -555,24 +1097,97 @@ Required fields for {assessment_type} assessment:
     def update_trend_label(self, value):
         self.trend_label.config(text=str(int(float(value))))
 
-    def refresh_idea_list(self):
-        """Refresh the idea listbox"""
-        self.idea_listbox.delete(0, tk.END)
-        for idea in self.repo_data:
-            display_text = f"{idea.get('idea_id', 'N/A')}: {idea.get('title', 'No Title')}"
-            self.idea_listbox.insert(tk.END, display_text)
-        self.status_var.set(f"Loaded {len(self.repo_data)} ideas")
-
-    def on_idea_select(self, event):
-        """Handle idea selection from listbox"""
-        selection = self.idea_listbox.curselection()
-        if selection:
-            index = selection[0]
-            self.current_idea = self.repo_data[index]
+    def get_idea_row_values(self, row: int) -> Tuple:
+        """Return the column values of a row of the idea list"""
+        idea = self.repo_data[self.visible_indices[row]]
+        return (idea.get('idea_id', 'N/A'), idea.get('title', 'No Title'),
+                idea.get('maturity_score', ''), idea.get('personal_interest_score', ''),
+                idea.get('trend_score', ''), ', '.join(idea.get('tags', []) or []))
+
+    def sort_idea_list(self, column: str):
+        """Cycle a column between ascending, descending and unsorted"""
+        if self.sort_column != column:
+            self.sort_column, self.sort_descending = column, False
+        elif not self.sort_descending:
+            self.sort_descending = True
+        else:
+            self.sort_column, self.sort_descending = None, False
+        self.idea_list.set_sort_indicator(self.sort_column, self.sort_descending)
+        self.refresh_idea_list(scroll_to_top=True)
+
+    def refresh_idea_list(self, scroll_to_top: bool = False):
+        """Refresh the idea list, showing ranked search results when a query is entered"""
+        query = self.search_var.get().strip()
+        if query:
+            positions = self.get_idea_positions()
+            results = self.search_index.search(query, limit=self.search_result_limit)
+            self.visible_indices = [positions[idea_id] for idea_id, _ in results if idea_id in positions]
+        else:
+            self.visible_indices = list(range(len(self.repo_data)))
+        
+        if self.sort_column:
+            keys = self.get_sort_keys(self.sort_column)
+            self.visible_indices.sort(key=keys.__getitem__, reverse=self.sort_descending)
+        
+        self.idea_list.set_row_count(len(self.visible_indices), scroll_to_top=scroll_to_top)
+        # Keep the idea being edited highlighted if it is still listed
+        self.select_idea_in_list(self.current_idea.get('idea_id') if self.current_idea else None, scroll=False)
+        
+        if query:
+            self.status_var.set(f"{len(self.visible_indices)} of {len(self.repo_data)} ideas match '{query}'")
+        else:
+            self.status_var.set(f"Loaded {len(self.repo_data)} ideas")
+
+    def update_idea_row(self, position: int, added: bool = False):
+        """Reflect an edited or appended idea in the list without rebuilding it"""
+        idea = self.repo_data[position]
+        for column, keys in self.sort_keys.items():
+            if added:
+                keys.append(self.SORT_KEYS[column](idea))
+            else:
+                keys[position] = self.SORT_KEYS[column](idea)
+        
+        if self.search_var.get().strip() or self.sort_column:
+            # Rank or sort order may have changed
+            self.refresh_idea_list()
+        elif added:
+            self.visible_indices.append(position)
+            self.idea_list.set_row_count(len(self.visible_indices))
+        else:
+            self.idea_list.refresh_row(position)
+
+    def select_idea_in_list(self, idea_id: Optional[str], scroll: bool = True):
+        """Select (and optionally scroll to) an idea if it is in the current list"""
+        position = self.get_idea_positions().get(idea_id)
+        if position is None:
+            self.idea_list.clear_selection()
+            return
+        # Unfiltered, unsorted lists map rows to positions one-to-one
+        if self.visible_indices[position:position + 1] == [position]:
+            row = position
+        elif position in self.visible_indices:
+            row = self.visible_indices.index(position)
+        else:
+            self.idea_list.clear_selection()
+            return
+        if scroll:
+            self.idea_list.see(row)
+        self.idea_list.select(row)
+
+    def on_idea_select(self, row: int):
+        """Handle idea selection from the idea list"""
+        if 0 <= row < len(self.visible_indices):
+            index = self.visible_indices[row]
+            try:
+                self.current_idea = self.get_full_idea(index)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to load idea: {str(e)}")
+                return
             self.load_idea_to_form(self.current_idea)
 
     def load_idea_to_form(self, idea: Dict[str, Any]):
         """Load idea data into the form"""
+        self.create_details_panel()
         self.idea_id_var.set(idea.get('idea_id', ''))
         self.title_var.set(idea.get('title', ''))
         
@@ -597,10 +1212,15 @@ Required fields for {assessment_type} assessment:
         # Set related items
         self.related_items_text.delete(1.0, tk.END)
         related_items = idea.get('related_items', [])
-        self.related_items_text.insert(1.0, json.dumps(related_items, indent=2))
+        self.related_items_text.insert(1.0, dumps(related_items, indent=2))
         
         # Load existing assessments if available
         idea_id = idea.get('idea_id', '')
+        if idea_id:
+            self.show_assessment_scores(idea_id)
+
+    def show_assessment_scores(self, idea_id: str):
+        """Show the scores of an idea's stored assessments in the form"""
         if idea_id:
             # Check for maturity assessment
             maturity_assessment = self.load_assessment(idea_id, "maturity")
@@ -616,6 +1236,7 @@ Required fields for {assessment_type} assessment:
 
     def clear_form(self):
         """Clear all form fields"""
+        self.create_details_panel()
         self.current_idea = None
         self.idea_id_var.set('')
         self.title_var.set('')
@@ -632,7 +1253,7 @@ Required fields for {assessment_type} assessment:
         self.trend_label.config(text="1")
         
         # Clear selection
-        self.idea_listbox.selection_clear(0, tk.END)
+        self.idea_list.clear_selection()
 
     def new_idea(self):
         """Create a new idea"""
@@ -680,29 +1301,37 @@ Required fields for {assessment_type} assessment:
             'related_items': related_items
         }
         
-        # Update or add to repo data
-        if self.current_idea:
-            # Update existing idea
-            for i, idea in enumerate(self.repo_data):
-                if idea.get('idea_id') == self.current_idea.get('idea_id'):
-                    self.repo_data[i] = idea_data
-                    break
-            self.status_var.set(f"Updated idea: {idea_id}")
-        else:
-            # Add new idea
-            self.repo_data.append(idea_data)
-            self.status_var.set(f"Added new idea: {idea_id}")
+        # Nothing to record if the idea is unchanged
+        if self.current_idea == idea_data:
+            self.status_var.set(f"No changes to idea: {idea_id}")
+            return
         
-        # Refresh list and select the current idea
-        self.refresh_idea_list()
-        self.current_idea = idea_data
+        # Update or add to repo data, storage and the search index
+        previous_id = self.current_idea.get('idea_id') if self.current_idea else None
+        try:
+            position, added = self.put_idea(idea_data, previous_id)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        if position is None:
+            # record_change has already shown why the storage backend rejected the change
+            self.status_var.set(f"Idea not saved: {idea_id}")
+            return
+        status = f"Updated idea: {idea_id}" if previous_id else f"Added new idea: {idea_id}"
         
-        # Select the idea in the list
-        for i, idea in enumerate(self.repo_data):
-            if idea.get('idea_id') == idea_id:
-                self.idea_listbox.selection_set(i)
-                self.idea_listbox.see(i)
-                break
+        # Update only the affected row and select the current idea
+        self.current_idea = idea_data
+        self.update_idea_row(position, added=added)
+        self.select_idea_in_list(idea_id)
+        self.status_var.set(status)
+        
+        # Warn about related items that do not resolve to a weekly log item
+        unresolved = self.find_unresolved_related_items(related_items) if isinstance(related_items, list) else []
+        if unresolved:
+            self.status_var.set(f"Saved idea: {idea_id} - {len(unresolved)} related item(s) not found in source data")
+        schema_errors = self.idea_errors.get(idea_id)
+        if schema_errors:
+            self.status_var.set(f"Saved idea: {idea_id} - does not match repo.schema.json: {schema_errors[0]}")
 
     def delete_idea(self):
         """Delete the currently selected idea"""
@@ -712,7 +1341,8 @@ Required fields for {assessment_type} assessment:
         
         idea_id = self.current_idea.get('idea_id')
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete idea '{idea_id}'?"):
-            self.repo_data = [idea for idea in self.repo_data if idea.get('idea_id') != idea_id]
+            self.remove_idea(idea_id)
+            self.sort_keys = {}
             self.clear_form()
             self.refresh_idea_list()
             self.status_var.set(f"Deleted idea: {idea_id}")
@@ -752,38 +1382,116 @@ Required fields for {assessment_type} assessment:
         text_widget = scrolledtext.ScrolledText(text_frame, wrap=tk.WORD, font=("Consolas", 10))
         text_widget.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
-        # Get source information
-        source_text = self.get_source_information(self.current_idea)
-        text_widget.insert(tk.END, source_text)
         text_widget.config(state=tk.DISABLED)  # Make read-only
         
         # Buttons frame
         buttons_frame = ttk.Frame(main_frame)
         buttons_frame.grid(row=2, column=0, pady=(10, 0))
         
-        # Copy button
+        # Status
+        idea_id = self.current_idea.get('idea_id')
+        status_label = ttk.Label(main_frame, text=f"Loading source information for: {idea_id}...")
+        status_label.grid(row=3, column=0, pady=(10, 0))
+        
+        # Stream the report: weeks are formatted and inserted a few at a time from after() callbacks,
+        # so the first week shows immediately and closing the window stops the rest
+        sections = self.source_sections(self.current_idea)
+        chunks: List[str] = []
+        state = {'job': None, 'done': False, 'seconds': 0.0}
+        
+        def append(section: str):
+            text_widget.config(state=tk.NORMAL)
+            text_widget.insert(tk.END, section if not chunks else "\n" + section)
+            text_widget.config(state=tk.DISABLED)
+            chunks.append(section)
+        
+        def finish():
+            state['done'] = True
+            status_label.config(text=f"Showing source information for: {idea_id}")
+            if self.tracer.enabled:
+                self.tracer.record('render_source_report', state['seconds'],
+                                   len("\n".join(chunks).encode('utf-8')), len(chunks))
+        
+        def insert_next():
+            state['job'] = None
+            if not source_window.winfo_exists():
+                return
+            start = time.perf_counter()
+            try:
+                # At least one section per callback, then more until the time slice is used up
+                while True:
+                    append(next(sections))
+                    if time.perf_counter() - start >= self.source_chunk_seconds:
+                        break
+            except StopIteration:
+                state['seconds'] += time.perf_counter() - start
+                finish()
+                return
+            state['seconds'] += time.perf_counter() - start
+            state['job'] = source_window.after(1, insert_next)
+        
+        def cancel(event):
+            if event.widget is source_window and state['job'] is not None:
+                source_window.after_cancel(state['job'])
+                state['job'] = None
+                sections.close()
+        
+        source_window.bind('<Destroy>', cancel)
+        insert_next()
+        
+        # Copy button (formats whatever is still pending first)
         def copy_to_clipboard():
+            if not state['done']:
+                if state['job'] is not None:
+                    source_window.after_cancel(state['job'])
+                    state['job'] = None
+                for section in sections:
+                    append(section)
+                finish()
             source_window.clipboard_clear()
-            source_window.clipboard_append(source_text)
+            source_window.clipboard_append("\n".join(chunks))
             messagebox.showinfo("Copied", "Source information copied to clipboard!")
         
         ttk.Button(buttons_frame, text="Copy to Clipboard", command=copy_to_clipboard).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(buttons_frame, text="Close", command=source_window.destroy).pack(side=tk.LEFT)
-        
-        # Status
-        status_label = ttk.Label(main_frame, text=f"Showing source information for: {self.current_idea.get('idea_id')}")
-        status_label.grid(row=3, column=0, pady=(10, 0))
 
 
-def main():
+def main(argv=None):
     """Main function to run the application"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="EchoForge Repo Manager")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print how long each startup phase takes")
+    parser.add_argument("--trace", action="store_true",
+                        help="record data-path timings from startup (see Diagnostics)")
+    parser.add_argument("--metrics", help="write the traced metrics to this JSON/CSV file on exit (implies --trace)")
+    parser.add_argument("--json-format", choices=list(STORAGE_FORMATS),
+                        help="how data files are written (default: $ECHOFORGE_JSON_FORMAT or pretty)")
+    args = parser.parse_args(argv)
+    if args.json_format:
+        set_storage_format(args.json_format)
+    
+    profiler = None
+    if args.profile_startup or os.environ.get("ECHOFORGE_PROFILE_STARTUP"):
+        profiler = StartupProfiler()
+        profiler.mark("imports")
+    
     root = tk.Tk()
-    app = RepoManager(root)
+    if profiler is not None:
+        profiler.mark("tk init")
+    app = RepoManager(root, profiler)
+    if args.trace or args.metrics or os.environ.get("ECHOFORGE_TRACE"):
+        app.tracer.enable()
     
     # Configure window close behavior
     def on_closing():
-        if messagebox.askokcancel("Quit", "Do you want to save changes before quitting?"):
-            app.save_repo_data()
+        # Edits are already persisted; only wait for background storage work
+        app.stop_watching()
+        app.stop_source_loading()
+        app.storage.close()
+        if args.metrics:
+            app.tracer.export(args.metrics)
         root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Repo Storage - Storage backends for the idea repository
+"""
+
+import os
+import re
+import sys
+from typing import Dict, List, Any, Optional
+
+from atomic_io import atomic_write_json
+from json_codec import load_file
+from repo_journal import RepoJournal
+
+
+# Fields kept in the sharded index so the idea list can be filled without opening shards
+INDEX_FIELDS = ('idea_id', 'title', 'maturity_score', 'personal_interest_score', 'trend_score', 'tags')
+
+
+class IdeaSummary(dict):
+    """Index entry standing in for an idea whose shard has not been read yet"""
+
+
+class RepoStorage:
+    """Interface shared by the repository storage backends"""
+
+    # Backends that also hold assessments implement load_assessment/save_assessment
+    stores_assessments = False
+
+    def exists(self) -> bool:
+        """Return True if the backing files exist"""
+        raise NotImplementedError
+
+    def load_ideas(self) -> List[Dict[str, Any]]:
+        """Return all ideas in repository order (possibly as IdeaSummary placeholders)"""
+        raise NotImplementedError
+
+    def load_idea(self, idea_id: str) -> Optional[Dict[str, Any]]:
+        """Return the full record of a single idea"""
+        raise NotImplementedError
+
+    def save_idea(self, idea: Dict[str, Any], previous_id: Optional[str] = None):
+        """Persist a new or changed idea (renamed from previous_id if given)"""
+        raise NotImplementedError
+
+    def delete_idea(self, idea_id: str):
+        """Persist the deletion of an idea"""
+        raise NotImplementedError
+
+    def maintain(self, repo_data: List[Dict[str, Any]]) -> bool:
+        """Run housekeeping after a change; return True if repo_data was fully persisted"""
+        return False
+
+    def flush(self, repo_data: List[Dict[str, Any]]):
+        """Write out anything not yet persisted in its final form"""
+
+    def has_pending_changes(self) -> bool:
+        """Return True if flush would have work to do"""
+        return False
+
+    def close(self):
+        """Wait for background work before the application exits"""
+
+    def is_partial(self, idea: Dict[str, Any]) -> bool:
+        return isinstance(idea, IdeaSummary)
+
+    def resolve(self, idea: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the full record for an idea that may be a placeholder"""
+        if not self.is_partial(idea):
+            return idea
+        return self.load_idea(idea.get('idea_id')) or idea
+
+
+class JsonFileStorage(RepoStorage):
+    """Single repo.json array with an append-only change journal"""
+
+    def __init__(self, repo_file_path: str):
+        self.repo_file_path = repo_file_path
+        self.journal = RepoJournal(repo_file_path)
+        self._ideas: List[Dict[str, Any]] = []
+
+    def exists(self) -> bool:
+        return os.path.exists(self.repo_file_path) or self.journal.has_pending_changes()
+
+    def load_ideas(self) -> List[Dict[str, Any]]:
+        repo_data: List[Dict[str, Any]] = []
+        if os.path.exists(self.repo_file_path):
+            repo_data = load_file(self.repo_file_path)
+        # Replay changes journalled since the last compaction
+        self.journal.replay(repo_data)
+        self._ideas = repo_data
+        return repo_data
+
+    def load_idea(self, idea_id: str) -> Optional[Dict[str, Any]]:
+        for idea in self._ideas:
+            if idea.get('idea_id') == idea_id:
+                return idea
+        return None
+
+    def save_idea(self, idea: Dict[str, Any], previous_id: Optional[str] = None):
+        self.journal.append_upsert(idea, previous_id)
+
+    def delete_idea(self, idea_id: str):
+        self.journal.append_delete(idea_id)
+
+    def maintain(self, repo_data: List[Dict[str, Any]]) -> bool:
+        self._ideas = repo_data
+        return self.journal.maybe_compact(repo_data)
+
+    def flush(self, repo_data: List[Dict[str, Any]]):
+        self._ideas = repo_data
+        self.journal.compact(repo_data)
+
+    def has_pending_changes(self) -> bool:
+        return self.journal.has_pending_changes()
+
+    def close(self):
+        self.journal.wait()
+
+
+class ShardedStorage(RepoStorage):
+    """One JSON file per idea under ideas/, plus a compact index.json for listing"""
+
+    def __init__(self, ideas_path: str):
+        self.ideas_path = ideas_path
+        self.index_path = os.path.join(ideas_path, "index.json")
+        self._index: List[Dict[str, Any]] = []
+        self._positions: Dict[str, int] = {}
+
+    @staticmethod
+    def shard_name(idea_id: str) -> str:
+        """Return a filesystem-safe shard file name for an idea_id"""
+        name = re.sub(r'[^A-Za-z0-9._-]', '_', idea_id)
+        if name != idea_id:
+            # Replacing characters is lossy ("I/A" and "I_A"), so tell such IDs apart by a hash of the raw ID
+            import hashlib
+            name += "-" + hashlib.blake2s(idea_id.encode('utf-8'), digest_size=4).hexdigest()
+        return name + ".json"
+
+    @staticmethod
+    def summarize(idea: Dict[str, Any], shard: str) -> Dict[str, Any]:
+        summary = {field: idea[field] for field in INDEX_FIELDS if field in idea}
+        summary['file'] = shard
+        return summary
+
+    def exists(self) -> bool:
+        return os.path.exists(self.index_path)
+
+    def _load_index(self):
+        self._index = []
+        if os.path.exists(self.index_path):
+            self._index = load_file(self.index_path).get('ideas', [])
+        self._positions = {entry.get('idea_id'): i for i, entry in enumerate(self._index)}
+
+    def _write_index(self):
+        atomic_write_json(self.index_path, {'version': 1, 'ideas': self._index}, indent=None)
+
+    def load_ideas(self) -> List[Dict[str, Any]]:
+        self._load_index()
+        return [IdeaSummary({k: v for k, v in entry.items() if k != 'file'}) for entry in self._index]
+
+    def load_idea(self, idea_id: str) -> Optional[Dict[str, Any]]:
+        if not self._positions:
+            self._load_index()
+        position = self._positions.get(idea_id)
+        if position is None:
+            return None
+        return load_file(os.path.join(self.ideas_path, self._index[position]['file']))
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        """Read every shard in index order"""
+        self._load_index()
+        return [self.load_idea(entry.get('idea_id')) for entry in self._index]
+
+    def save_idea(self, idea: Dict[str, Any], previous_id: Optional[str] = None):
+        idea_id = idea.get('idea_id')
+        shard = self.shard_name(idea_id)
+        atomic_write_json(os.path.join(self.ideas_path, shard), idea)
+
+        summary = self.summarize(idea, shard)
+        position = self._positions.pop(previous_id, None) if previous_id else None
+        if position is None:
+            position = self._positions.get(idea_id)
+        if position is None:
+            self._index.append(summary)
+            position = len(self._index) - 1
+        elif self._index[position] == summary:
+            # Only the shard changed; the index still lists the same fields
+            self._positions[idea_id] = position
+            return
+        else:
+            old_shard = self._index[position].get('file')
+            self._index[position] = summary
+            if old_shard and old_shard != shard:
+                self._remove_shard(old_shard)
+        self._positions[idea_id] = position
+        self._write_index()
+
+    def delete_idea(self, idea_id: str):
+        position = self._positions.get(idea_id)
+        if position is None:
+            return
+        shard = self._index.pop(position).get('file')
+        self._positions = {entry.get('idea_id'): i for i, entry in enumerate(self._index)}
+        self._write_index()
+        if shard:
+            self._remove_shard(shard)
+
+    def maintain(self, repo_data: List[Dict[str, Any]]) -> bool:
+        # Shards and index are written on every change
+        return True
+
+    def _remove_shard(self, shard: str):
+        try:
+            os.remove(os.path.join(self.ideas_path, shard))
+        except FileNotFoundError:
+            pass
+
+    def import_repo_json(self, repo_file_path: str) -> int:
+        """Replace the sharded repository with the contents of a single-file repo.json"""
+        repo_data = load_file(repo_file_path)
+        # Include changes still sitting in the single-file journal
+        RepoJournal(repo_file_path).replay(repo_data)
+
+        os.makedirs(self.ideas_path, exist_ok=True)
+        old_shards = {name for name in os.listdir(self.ideas_path)
+                      if name.endswith('.json') and name != os.path.basename(self.index_path)}
+        self._index = []
+        for idea in repo_data:
+            shard = self.shard_name(idea.get('idea_id', ''))
+            atomic_write_json(os.path.join(self.ideas_path, shard), idea)
+            self._index.append(self.summarize(idea, shard))
+            old_shards.discard(shard)
+        self._positions = {entry.get('idea_id'): i for i, entry in enumerate(self._index)}
+        self._write_index()
+        for shard in old_shards:
+            self._remove_shard(shard)
+        return len(repo_data)
+
+    def export_repo_json(self, repo_file_path: str) -> int:
+        """Write all shards to a single-file repo.json array"""
+        repo_data = self.load_all()
+        atomic_write_json(repo_file_path, repo_data)
+        # The exported file supersedes any journal left by single-file mode
+        journal = RepoJournal(repo_file_path)
+        for path in (journal.path, journal.compacting_path):
+            if os.path.exists(path):
+                os.remove(path)
+        return len(repo_data)
+
+
+def main():
+    """Convert between single-file and sharded repository storage"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert between repo.json and sharded idea storage")
+    parser.add_argument("command", choices=["import", "export"],
+                        help="import: repo.json -> shards, export: shards -> repo.json")
+    parser.add_argument("--repo-file", default="../data/REPOSITORY/repo.json")
+    parser.add_argument("--ideas-dir", default="../data/REPOSITORY/ideas")
+    args = parser.parse_args()
+
+    storage = ShardedStorage(args.ideas_dir)
+    if args.command == "import":
+        count = storage.import_repo_json(args.repo_file)
+        print(f"Imported {count} ideas from {args.repo_file} into {args.ideas_dir}")
+    else:
+        count = storage.export_repo_json(args.repo_file)
+        print(f"Exported {count} ideas from {args.ideas_dir} to {args.repo_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
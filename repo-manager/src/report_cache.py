@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Report Cache - Bounded LRU of rendered source reports, keyed by idea content and weekly file signatures
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+
+# (digest of the idea fields the report shows, ((week, file signature), ...), schema checks on)
+ReportKey = Tuple[str, Tuple[Tuple[str, Any], ...], bool]
+
+
+class ReportCache:
+    """Keeps the rendered sections of the most recently viewed source reports.
+
+    There is one entry per idea, stored with the key it was rendered under.
+    A lookup with a different key is a miss and drops the stale entry. The
+    key changes when the idea's related items or title change, or when any
+    referenced weekly file changes size or mtime. invalidate_idea and
+    invalidate_week drop entries as soon as a change is known, without
+    waiting for the next lookup. At most max_entries reports are kept, and
+    the least recently used are dropped first.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[ReportKey, List[str]]]" = OrderedDict()
+        self._week_ideas: Dict[str, Set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, idea_id: str, key: ReportKey) -> Optional[List[str]]:
+        """Return the cached sections for an idea if they were rendered under the same key"""
+        entry = self._entries.get(idea_id)
+        if entry is not None and entry[0] == key:
+            self._entries.move_to_end(idea_id)
+            self.hits += 1
+            return entry[1]
+        if entry is not None:
+            self._drop(idea_id)
+        self.misses += 1
+        return None
+
+    def put(self, idea_id: str, key: ReportKey, sections: List[str]):
+        self._drop(idea_id)
+        self._entries[idea_id] = (key, sections)
+        for week, _ in key[1]:
+            self._week_ideas.setdefault(week, set()).add(idea_id)
+        while len(self._entries) > max(self.max_entries, 0):
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, idea_id: str):
+        entry = self._entries.pop(idea_id, None)
+        if entry is None:
+            return
+        for week, _ in entry[0][1]:
+            ideas = self._week_ideas.get(week)
+            if ideas is not None:
+                ideas.discard(idea_id)
+                if not ideas:
+                    del self._week_ideas[week]
+
+    def invalidate_idea(self, idea_id: str):
+        if idea_id in self._entries:
+            self._drop(idea_id)
+            self.invalidations += 1
+
+    def invalidate_week(self, week: str):
+        """Drop every report that shows a week"""
+        for idea_id in list(self._week_ideas.get(week, ())):
+            self._drop(idea_id)
+            self.invalidations += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._week_ideas.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {'entries': len(self._entries), 'max_entries': self.max_entries, 'hits': self.hits,
+                'misses': self.misses, 'invalidations': self.invalidations}
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Schema Validation - Compiled checks for weekly logs and the idea repository against the shipped JSON schemas
+"""
+
+import functools
+import json
+import os
+import re
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+
+AGENTS_PATH = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'agents'))
+SCHEMA_PATHS = {
+    'weekly': os.path.join(AGENTS_PATH, "Weekly-Archivist", "weekly.schema.json"),
+    'repo': os.path.join(AGENTS_PATH, "Repo-Archivist", "repo.schema.json"),
+}
+# Keywords that only document a schema
+ANNOTATIONS = {'$schema', '$id', '$comment', 'title', 'description', 'default', 'examples'}
+FORMATS = {
+    'date-time': re.compile(r'^\d{4}-\d{2}-\d{2}[Tt ]\d{2}:\d{2}:\d{2}(\.\d+)?([Zz]|[+-]\d{2}:\d{2})$'),
+    'date': re.compile(r'^\d{4}-\d{2}-\d{2}$'),
+}
+# Files in parallel runs are split over worker processes only above this many
+PARALLEL_THRESHOLD = 64
+MAX_ERRORS_PER_FILE = 50
+# Distinct passing strings remembered per pattern
+MAX_MEMOIZED = 4096
+
+Path = Tuple[Any, ...]
+SUPPORTED = {'type', 'required', 'properties', 'additionalProperties', 'items', 'enum', 'const', 'pattern',
+             'format', 'minLength', 'maxLength', 'minimum', 'maximum', 'minItems', 'maxItems', 'uniqueItems'}
+TYPE_TESTS = {
+    'string': "isinstance({0}, str)",
+    'integer': "(type({0}) is int or (isinstance({0}, int) and not isinstance({0}, bool)))",
+    'number': "(isinstance({0}, (int, float)) and not isinstance({0}, bool))",
+    'boolean': "isinstance({0}, bool)",
+    'object': "isinstance({0}, (dict, Mapping))",
+    'array': "isinstance({0}, list)",
+    'null': "{0} is None",
+}
+
+
+class SchemaError(ValueError):
+    """The schema uses a keyword the compiler does not implement"""
+
+
+def format_path(path: Path) -> str:
+    return "/".join(str(part) for part in path) or "(root)"
+
+
+class SchemaCompiler:
+    """Generates the Python source of a check function for a JSON schema (the draft-07 subset the shipped schemas use).
+
+    Every keyword becomes inline code, so validating a document runs no schema
+    interpretation at all; error paths and messages are only built when a
+    check fails. The generated function appends (path, message) pairs.
+    """
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.constants: Dict[str, Any] = {'re': re, 'json': json, 'Mapping': Mapping, 'MISSING': object()}
+        self.counter = 0
+
+    def constant(self, value: Any) -> str:
+        name = f"C{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def variable(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def emit(self, indent: int, line: str):
+        self.lines.append("    " * indent + line)
+
+    def fail(self, indent: int, path: List[str], message: str):
+        path_expr = f"({', '.join(path)},)" if path else "()"
+        self.emit(indent, f"errors.append((prefix + {path_expr}, {message}))")
+
+    def compile(self, schema: Dict[str, Any]) -> Callable[[Any, Path, List[Tuple[Path, str]]], None]:
+        self.emit(0, "def check(value, prefix, errors):")
+        self.node(schema, "value", [], 1)
+        self.emit(1, "return errors")
+        namespace = dict(self.constants)
+        exec(compile("\n".join(self.lines), "<schema>", "exec"), namespace)
+        return namespace['check']
+
+    def node(self, schema: Dict[str, Any], var: str, path: List[str], indent: int):
+        unsupported = set(schema) - ANNOTATIONS - SUPPORTED
+        if unsupported:
+            raise SchemaError(f"Unsupported schema keywords: {', '.join(sorted(unsupported))}")
+        self.emit(indent, "pass")
+
+        type_names = schema.get('type')
+        if type_names is not None:
+            type_names = type_names if isinstance(type_names, list) else [type_names]
+            test = " or ".join(TYPE_TESTS[name].format(var) for name in type_names)
+            expected = " or ".join(type_names)
+            self.emit(indent, f"if not ({test}):")
+            self.fail(indent + 1, path, f"'expected {expected}, got ' + type({var}).__name__")
+            # A value of the wrong type gets no further (meaningless) errors
+            self.emit(indent, "else:")
+            indent += 1
+            self.emit(indent, "pass")
+
+        if 'enum' in schema:
+            allowed = schema['enum']
+            hashable = all(isinstance(option, (str, int, float, bool, type(None))) for option in allowed)
+            # Sets only work for values that are known to be hashable
+            options = frozenset(allowed) if hashable and type_names in (['string'], ['integer']) else allowed
+            self.emit(indent, f"if {var} not in {self.constant(options)}:")
+            self.fail(indent + 1, path, f"repr({var}) + {self.constant(' is not one of ' + repr(allowed))}")
+        if 'const' in schema:
+            self.emit(indent, f"if {var} != {self.constant(schema['const'])}:")
+            self.fail(indent + 1, path, repr(f"expected {schema['const']!r}"))
+
+        self.string_rules(schema, var, path, indent, guarded='string' in (type_names or []))
+        self.number_rules(schema, var, path, indent, guarded=bool(type_names) and set(type_names) <= {'integer', 'number'})
+
+        if any(key in schema for key in ('required', 'properties', 'additionalProperties')):
+            self.object_rules(schema, var, path, indent, guarded=type_names == ['object'])
+        if any(key in schema for key in ('items', 'minItems', 'maxItems', 'uniqueItems')):
+            self.array_rules(schema, var, path, indent, guarded=type_names == ['array'])
+
+    def string_rules(self, schema, var, path, indent, guarded):
+        rules = []
+        if 'minLength' in schema:
+            rules.append((f"len({var}) < {int(schema['minLength'])}", repr(f"shorter than {schema['minLength']} characters")))
+        if 'maxLength' in schema:
+            rules.append((f"len({var}) > {int(schema['maxLength'])}", repr(f"longer than {schema['maxLength']} characters")))
+        if 'pattern' in schema:
+            rules.append((self.memoized_match(re.compile(schema['pattern']).search, var),
+                          f"repr({var}) + {self.constant(' does not match ' + schema['pattern'])}"))
+        if schema.get('format') in FORMATS:
+            rules.append((self.memoized_match(FORMATS[schema['format']].match, var),
+                          f"repr({var}) + {self.constant(' is not a valid ' + schema['format'])}"))
+        if not rules:
+            return
+        if not guarded:
+            self.emit(indent, f"if isinstance({var}, str):")
+            indent += 1
+        for condition, message in rules:
+            self.emit(indent, f"if {condition}:")
+            self.fail(indent + 1, path, message)
+
+    def memoized_match(self, match: Callable, var: str) -> str:
+        """Condition that is true when var fails match; weeks, item ids and sections repeat, so passing values are remembered"""
+        known = self.constant(set())
+        return (f"{var} not in {known} and (not {self.constant(match)}({var}) "
+                f"or (len({known}) < {MAX_MEMOIZED} and {known}.add({var})))")
+
+    def number_rules(self, schema, var, path, indent, guarded):
+        rules = []
+        if 'minimum' in schema:
+            rules.append((f"{var} < {schema['minimum']!r}", f"str({var}) + ' is less than {schema['minimum']}'"))
+        if 'maximum' in schema:
+            rules.append((f"{var} > {schema['maximum']!r}", f"str({var}) + ' is greater than {schema['maximum']}'"))
+        if not rules:
+            return
+        if not guarded:
+            self.emit(indent, f"if {TYPE_TESTS['number'].format(var)}:")
+            indent += 1
+        for condition, message in rules:
+            self.emit(indent, f"if {condition}:")
+            self.fail(indent + 1, path, message)
+
+    def object_rules(self, schema, var, path, indent, guarded):
+        if not guarded:
+            self.emit(indent, f"if {TYPE_TESTS['object'].format(var)}:")
+            indent += 1
+        required = schema.get('required', [])
+        if required:
+            self.emit(indent, f"if not {self.constant(frozenset(required))}.issubset({var}):")
+            for name in required:
+                self.emit(indent + 1, f"if {name!r} not in {var}:")
+                self.fail(indent + 2, path, repr(f"missing required property '{name}'"))
+        properties = schema.get('properties', {})
+        for name, subschema in properties.items():
+            child = self.variable("v")
+            self.emit(indent, f"{child} = {var}.get({name!r}, MISSING)")
+            self.emit(indent, f"if {child} is not MISSING:")
+            self.node(subschema, child, path + [repr(name)], indent + 1)
+        additional = schema.get('additionalProperties', True)
+        if additional is False:
+            known = self.constant(frozenset(properties))
+            key = self.variable("k")
+            self.emit(indent, f"if not {known}.issuperset({var}):")
+            self.emit(indent + 1, f"for {key} in {var}:")
+            self.emit(indent + 2, f"if {key} not in {known}:")
+            self.fail(indent + 3, path, f"'unexpected property ' + repr({key})")
+        elif isinstance(additional, dict):
+            known = self.constant(frozenset(properties))
+            key, child = self.variable("k"), self.variable("v")
+            self.emit(indent, f"for {key}, {child} in {var}.items():")
+            self.emit(indent + 1, f"if {key} not in {known}:")
+            self.node(additional, child, path + [key], indent + 2)
+
+    def array_rules(self, schema, var, path, indent, guarded):
+        if not guarded:
+            self.emit(indent, f"if isinstance({var}, list):")
+            indent += 1
+        if 'minItems' in schema:
+            self.emit(indent, f"if len({var}) < {int(schema['minItems'])}:")
+            self.fail(indent + 1, path, repr(f"fewer than {schema['minItems']} items"))
+        if 'maxItems' in schema:
+            self.emit(indent, f"if len({var}) > {int(schema['maxItems'])}:")
+            self.fail(indent + 1, path, repr(f"more than {schema['maxItems']} items"))
+        if schema.get('uniqueItems'):
+            self.emit(indent, f"if len({{json.dumps(x, sort_keys=True) for x in {var}}}) != len({var}):")
+            self.fail(indent + 1, path, repr("items are not unique"))
+        if isinstance(schema.get('items'), dict):
+            index, child = self.variable("i"), self.variable("v")
+            self.emit(indent, f"for {index}, {child} in enumerate({var}):")
+            self.node(schema['items'], child, path + [index], indent + 1)
+
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Any, Path, List[Tuple[Path, str]]], None]:
+    """Compile a JSON schema into check(value, path_prefix, errors)"""
+    return SchemaCompiler().compile(schema)
+
+
+class CompiledSchema:
+    """A schema compiled once; validate() returns (path, message) pairs"""
+
+    def __init__(self, schema: Dict[str, Any]):
+        self.schema = schema
+        self.check = compile_schema(schema)
+        # Arrays of records (repo.json) can also be checked one record at a time
+        self.item_check = compile_schema(schema['items']) if isinstance(schema.get('items'), dict) else None
+
+    def validate(self, value: Any) -> List[Tuple[Path, str]]:
+        return self.check(value, (), [])
+
+    def validate_item(self, value: Any) -> List[Tuple[Path, str]]:
+        """Check one element of an array schema (e.g. one idea against repo.schema.json)"""
+        return self.item_check(value, (), []) if self.item_check is not None else []
+
+
+@functools.lru_cache(maxsize=None)
+def load_schema(kind: str) -> Optional[CompiledSchema]:
+    """Compile a shipped schema ('weekly' or 'repo') once per process; None if it is not available"""
+    path = SCHEMA_PATHS[kind]
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return CompiledSchema(json.load(f))
+
+
+def locate_line(text: str, path: Path) -> Optional[int]:
+    """Return the 1-based line where the value at path starts in a JSON document"""
+    decoder = json.JSONDecoder()
+    whitespace = re.compile(r'[ \t\n\r]*')
+    position = whitespace.match(text, 0).end()
+    try:
+        for part in path:
+            if text[position] == '{':
+                position = whitespace.match(text, position + 1).end()
+                while text[position] != '}':
+                    key, position = decoder.raw_decode(text, position)
+                    position = whitespace.match(text, position).end() + 1  # ':'
+                    position = whitespace.match(text, position).end()
+                    if key == part:
+                        break
+                    _, position = decoder.raw_decode(text, position)
+                    position = whitespace.match(text, position).end()
+                    if text[position] == ',':
+                        position = whitespace.match(text, position + 1).end()
+                else:
+                    return None
+            elif text[position] == '[' and isinstance(part, int):
+                position = whitespace.match(text, position + 1).end()
+                for _ in range(part):
+                    _, position = decoder.raw_decode(text, position)
+                    position = whitespace.match(text, position).end() + 1  # ','
+                    position = whitespace.match(text, position).end()
+            else:
+                return None
+    except (IndexError, ValueError):
+        return None
+    return text.count('\n', 0, position) + 1
+
+
+def validate_file(path: str, kind: str) -> List[Dict[str, Any]]:
+    """Validate one JSON file against the 'weekly' or 'repo' schema; errors carry file, line and JSON path"""
+    schema = load_schema(kind)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        return [{'file': path, 'line': e.lineno, 'path': "", 'message': f"invalid JSON: {e.msg}"}]
+    except (OSError, UnicodeDecodeError) as e:
+        return [{'file': path, 'line': None, 'path': "", 'message': str(e)}]
+    if schema is None:
+        return []
+    errors = schema.validate(data)[:MAX_ERRORS_PER_FILE]
+    return [{'file': path, 'line': locate_line(text, error_path), 'path': format_path(error_path), 'message': message}
+            for error_path, message in errors]
+
+
+def _validate_file_args(args: Tuple[str, str]) -> List[Dict[str, Any]]:
+    return validate_file(*args)
+
+
+def data_files(data_path: str) -> List[Tuple[str, str]]:
+    """(path, kind) for every weekly log and the repo.json of a data directory"""
+    files = []
+    repo_file = os.path.join(data_path, "REPOSITORY", "repo.json")
+    if os.path.exists(repo_file):
+        files.append((repo_file, 'repo'))
+    logs_path = os.path.join(data_path, "json-logs")
+    if os.path.isdir(logs_path):
+        files.extend((os.path.join(logs_path, name), 'weekly')
+                     for name in sorted(os.listdir(logs_path)) if name.endswith('.json'))
+    return files
+
+
+def validate_files(files: List[Tuple[str, str]], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Validate many (path, kind) files, across worker processes when there are enough of them"""
+    if workers == 1 or len(files) < PARALLEL_THRESHOLD:
+        results = map(_validate_file_args, files)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_validate_file_args, files, chunksize=max(len(files) // 64, 8)))
+    return [error for file_errors in results for error in file_errors]
+
+
+def format_error(error: Dict[str, Any]) -> str:
+    location = f"{error['file']}:{error['line']}" if error.get('line') else error['file']
+    return f"{location}: {error['path']}: {error['message']}" if error.get('path') else f"{location}: {error['message']}"
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Search Index - Incremental inverted index with BM25 ranking for ideas
+"""
+
+import bisect
+import heapq
+import math
+import re
+from collections import Counter
+from collections.abc import Mapping
+from typing import Dict, List, Any, Optional, Tuple
+
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric terms"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class SearchIndex:
+    """Inverted index over idea documents, updated one document at a time.
+
+    Postings map term -> {doc_id: term frequency}. Adding or removing a
+    document only touches that document's terms, so edits stay cheap on large
+    repositories. The last query term is matched as a prefix so results
+    update sensibly while a word is still being typed.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75, max_prefix_terms: int = 20):
+        self.k1 = k1
+        self.b = b
+        # Short prefixes are capped to the closest completions to keep keystrokes cheap
+        self.max_prefix_terms = max_prefix_terms
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+        self.doc_terms: Dict[str, Counter] = {}
+        self.total_length = 0
+        self._sorted_terms: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self.doc_lengths
+
+    def add(self, doc_id: str, text: str):
+        """Index a document, replacing any previous version with the same id"""
+        if doc_id in self.doc_lengths:
+            self.remove(doc_id)
+        terms = Counter(tokenize(text))
+        for term, count in terms.items():
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = {}
+                self._sorted_terms = None
+            postings[doc_id] = count
+        length = sum(terms.values())
+        self.doc_terms[doc_id] = terms
+        self.doc_lengths[doc_id] = length
+        self.total_length += length
+
+    def remove(self, doc_id: str):
+        """Remove a document from the index"""
+        terms = self.doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self.postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self.postings[term]
+                    self._sorted_terms = None
+        self.total_length -= self.doc_lengths.pop(doc_id, 0)
+
+    def clear(self):
+        self.postings.clear()
+        self.doc_lengths.clear()
+        self.doc_terms.clear()
+        self.total_length = 0
+        self._sorted_terms = None
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        """Return the indexed terms starting with prefix, shortest first when capped"""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self.postings)
+        start = bisect.bisect_left(self._sorted_terms, prefix)
+        matches = []
+        for term in self._sorted_terms[start:]:
+            if not term.startswith(prefix):
+                break
+            matches.append(term)
+        if len(matches) > self.max_prefix_terms:
+            matches = heapq.nsmallest(self.max_prefix_terms, matches, key=lambda term: (len(term), term))
+        return matches
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Return (doc_id, score) pairs ranked by BM25; every query term must match"""
+        query_terms = tokenize(query)
+        if not query_terms or not self.doc_lengths:
+            return []
+
+        # Complete words match exactly; the word being typed matches as a prefix
+        term_groups = [[term] for term in query_terms[:-1]]
+        if query.rstrip() != query or not query[-1:].isalnum():
+            term_groups.append([query_terms[-1]])
+        else:
+            term_groups.append(self._expand_prefix(query_terms[-1]))
+
+        doc_count = len(self.doc_lengths)
+        avg_length = self.total_length / doc_count if doc_count else 0.0
+        scores: Dict[str, float] = {}
+        matched_groups: Dict[str, int] = {}
+        for terms in term_groups:
+            group_docs = set()
+            for term in terms:
+                postings = self.postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, tf in postings.items():
+                    length_norm = 1 - self.b + self.b * (self.doc_lengths[doc_id] / avg_length if avg_length else 0)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + self.k1 * length_norm)
+                    group_docs.add(doc_id)
+            for doc_id in group_docs:
+                matched_groups[doc_id] = matched_groups.get(doc_id, 0) + 1
+
+        group_count = len(term_groups)
+        results = [(doc_id, score) for doc_id, score in scores.items() if matched_groups[doc_id] == group_count]
+        rank = lambda result: (-result[1], result[0])
+        if limit is not None and limit < len(results):
+            return heapq.nsmallest(limit, results, key=rank)
+        results.sort(key=rank)
+        return results
+
+
+def idea_document(idea: Dict[str, Any], item_text=None) -> str:
+    """Build the searchable text of an idea; item_text(week, section, item_id) may supply linked item text"""
+    parts = [str(idea.get('idea_id', '')), str(idea.get('title', '')), str(idea.get('description', ''))]
+    parts.extend(str(tag) for tag in idea.get('tags', []) or [])
+    if item_text is not None:
+        for item in idea.get('related_items', []) or []:
+            if isinstance(item, Mapping):
+                text = item_text(item.get('week'), item.get('section'), item.get('item_id'))
+                if text:
+                    parts.append(text)
+    return "\n".join(parts)
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Source Store - Lazy, manifest-backed access to the weekly JSON and markdown logs
+"""
+
+import os
+from collections import OrderedDict
+from typing import Callable, Dict, List, Any, Optional, Iterator, Tuple
+
+from json_codec import load_file
+
+
+class SourceStore:
+    """Dictionary-like view over weekly logs that parses weeks on first access.
+
+    A cheap directory scan builds a manifest of week -> file paths, sizes and
+    mtimes. Week payloads are only read when a consumer asks for them, and an
+    optional limit bounds how many parsed weeks are kept in memory.
+
+    Every parsed week also contributes its items to a hash index keyed by
+    (week, section, item_id) so related items resolve in constant time.
+
+    Markdown logs are never held in memory. Each is indexed once into heading
+    and bullet byte offsets, kept across sessions in md_index_path (by default a
+    per-user cache file outside the data directory), and only the requested
+    ranges are read back through mmap.
+    """
+
+    def __init__(self, json_logs_path: str, md_logs_path: str, max_cached_weeks: Optional[int] = None,
+                 md_index_path: Optional[str] = None):
+        self.json_logs_path = json_logs_path
+        self.md_logs_path = md_logs_path
+        self.max_cached_weeks = max_cached_weeks
+        self.md_index_path = md_index_path
+        self._md_indexes = None
+        self.manifest: Dict[str, Dict[str, Any]] = {}
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.item_index: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self._week_keys: Dict[str, List[Tuple[str, str, str]]] = {}
+        # Optional check run on every week as it is parsed; non-empty results are kept per week
+        self.validate_week: Optional[Callable[[Dict[str, Any]], List[Any]]] = None
+        self.week_errors: Dict[str, List[Any]] = {}
+
+    def scan(self) -> int:
+        """Build the week manifest from the log directories without reading file contents"""
+        manifest: Dict[str, Dict[str, Any]] = {}
+        for kind, directory, extension in (("json", self.json_logs_path, ".json"),
+                                           ("md", self.md_logs_path, ".md")):
+            for week, stat_info in self._scan_directory(directory, extension):
+                entry = manifest.setdefault(week, {'week': week})
+                entry[f'{kind}_path'] = os.path.join(directory, week + extension)
+                entry[f'{kind}_size'] = stat_info.st_size
+                entry[f'{kind}_mtime'] = stat_info.st_mtime
+
+        # Drop parsed weeks whose files changed or disappeared since the last scan
+        for week in list(self._cache):
+            if self._signature(manifest.get(week)) != self._signature(self.manifest.get(week)):
+                self._forget(week)
+
+        for week in list(self.week_errors):
+            if week not in manifest:
+                del self.week_errors[week]
+
+        if self._md_indexes is not None:
+            for week, entry in self.manifest.items():
+                if 'md_path' in entry and self._md_signature(manifest.get(week)) != self._md_signature(entry):
+                    self._md_indexes.forget(week)
+            self._md_indexes.prune({week for week, entry in manifest.items() if 'md_path' in entry})
+
+        self.manifest = manifest
+        return len(self.manifest)
+
+    @staticmethod
+    def _scan_directory(directory: str, extension: str) -> Iterator:
+        """Yield (week, stat) for every file with the given extension in a directory"""
+        if not os.path.isdir(directory):
+            return
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(extension) and entry.is_file():
+                    yield entry.name[:-len(extension)], entry.stat()
+
+    @staticmethod
+    def _signature(entry: Optional[Dict[str, Any]]) -> Optional[tuple]:
+        """Return the (size, mtime) fingerprint of a manifest entry"""
+        if entry is None:
+            return None
+        return (entry.get('json_size'), entry.get('json_mtime'),
+                entry.get('md_size'), entry.get('md_mtime'))
+
+    @staticmethod
+    def _md_signature(entry: Optional[Dict[str, Any]]) -> Optional[tuple]:
+        if entry is None:
+            return None
+        return entry.get('md_size'), entry.get('md_mtime')
+
+    def week_signature(self, week: str) -> Optional[tuple]:
+        """Fingerprint of a week's files as of the last scan (None for an unknown week)"""
+        return self._signature(self.manifest.get(week))
+
+    @staticmethod
+    def parse_week(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Read and parse the JSON log listed in a manifest entry (the markdown log is read through markdown_index)"""
+        if 'json_path' in entry:
+            return load_file(entry['json_path'])
+        return {}
+
+    @property
+    def md_indexes(self):
+        """The markdown offset store, created (and md_index imported) the first time a log is needed"""
+        if self._md_indexes is None:
+            from md_index import MarkdownIndexStore, default_cache_path
+            self._md_indexes = MarkdownIndexStore(self.md_index_path or default_cache_path(self.md_logs_path))
+        return self._md_indexes
+
+    def markdown_index(self, week: str) -> Optional[Any]:
+        """Heading offsets of a week's markdown log (a md_index.MarkdownIndex), or None when the week has none"""
+        entry = self.manifest.get(week)
+        if entry is None or 'md_path' not in entry:
+            return None
+        index = self.md_indexes.get(week, entry['md_path'], entry['md_size'], entry['md_mtime'])
+        self.md_indexes.save()
+        return index
+
+    def index_markdown(self, weeks: Optional[List[str]] = None) -> int:
+        """Index the markdown logs of the given weeks (all by default) and save the offsets once"""
+        count = 0
+        for week in self.weeks() if weeks is None else weeks:
+            entry = self.manifest.get(week)
+            if entry is not None and 'md_path' in entry:
+                self.md_indexes.get(week, entry['md_path'], entry['md_size'], entry['md_mtime'])
+                count += 1
+        self.md_indexes.save()
+        return count
+
+    def markdown_section(self, week: str, section: str, item_id: Optional[str] = None) -> Optional[str]:
+        """Markdown of an item's bullet (or its whole section) in a week's log; None when there is no match"""
+        index = self.markdown_index(week)
+        if index is None:
+            return None
+        return index.item_text(section, item_id)
+
+    def markdown(self, week: str) -> Optional[str]:
+        """Full text of a week's markdown log, read on demand and not kept"""
+        index = self.markdown_index(week)
+        if index is None:
+            return None
+        return index.read(0, index.size)
+
+    def load_week(self, week: str) -> Dict[str, Any]:
+        """Return the parsed payload for a week, reading it from disk if needed"""
+        if week in self._cache:
+            self._cache.move_to_end(week)
+            return self._cache[week]
+        if week not in self.manifest:
+            raise KeyError(week)
+        return self.install(week, self.parse_week(self.manifest[week]))
+
+    def install(self, week: str, week_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Store an already parsed week payload, evicting the least recently used weeks"""
+        self._forget(week)
+        self._cache[week] = week_data
+        self._index_week(week, week_data)
+        if self.validate_week is not None:
+            errors = self.validate_week(week_data)
+            if errors:
+                self.week_errors[week] = errors
+            else:
+                self.week_errors.pop(week, None)
+        if self.max_cached_weeks is not None:
+            while len(self._cache) > max(self.max_cached_weeks, 1):
+                self._forget(next(iter(self._cache)))
+        return week_data
+
+    def _index_week(self, week: str, week_data: Dict[str, Any]):
+        """Add every item of a parsed week to the item index"""
+        keys = []
+        items = week_data.get('items')
+        if isinstance(items, dict):
+            for section, section_items in items.items():
+                if not isinstance(section_items, list):
+                    continue
+                for item_data in section_items:
+                    if isinstance(item_data, dict) and 'id' in item_data:
+                        key = (week, section, item_data['id'])
+                        # Keep the first occurrence, as the linear scan used to
+                        if key not in self.item_index:
+                            self.item_index[key] = item_data
+                            keys.append(key)
+        self._week_keys[week] = keys
+
+    def _forget(self, week: str):
+        """Drop a parsed week and its item index entries"""
+        self._cache.pop(week, None)
+        for key in self._week_keys.pop(week, []):
+            self.item_index.pop(key, None)
+
+    def invalidate(self, week: Optional[str] = None):
+        """Forget the parsed payload of one week, or of all weeks"""
+        if week is None:
+            self._cache.clear()
+            self.item_index.clear()
+            self._week_keys.clear()
+        else:
+            self._forget(week)
+
+    def get_item(self, week: str, section: str, item_id: str) -> Optional[Dict[str, Any]]:
+        """Return a single weekly item, loading its week if needed"""
+        key = (week, section, item_id)
+        if week in self._cache:
+            self._cache.move_to_end(week)
+        elif week in self.manifest:
+            self.load_week(week)
+        else:
+            return None
+        return self.item_index.get(key)
+
+    def week_items(self, week: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Return (section, item) for every indexed item of a week in log order, loading the week if needed"""
+        self.load_week(week)
+        return [(key[1], self.item_index[key]) for key in self._week_keys.get(week, [])]
+
+    def is_loaded(self, week: str) -> bool:
+        return week in self._cache
+
+    def loaded_weeks(self) -> List[str]:
+        return list(self._cache)
+
+    def weeks(self) -> List[str]:
+        """Return all known weeks in chronological order"""
+        return sorted(self.manifest)
+
+    # Mapping interface so existing consumers can keep using source_data[week]
+    def __contains__(self, week: object) -> bool:
+        return week in self.manifest
+
+    def __getitem__(self, week: str) -> Dict[str, Any]:
+        return self.load_week(week)
+
+    def get(self, week: str, default: Any = None) -> Any:
+        if week not in self.manifest:
+            return default
+        return self.load_week(week)
+
+    def __len__(self) -> int:
+        return len(self.manifest)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.weeks())
+
+    def keys(self) -> List[str]:
+        return self.weeks()
+
+    def items(self) -> Iterator:
+        for week in self.weeks():
+            yield week, self.load_week(week)
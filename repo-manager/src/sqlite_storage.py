@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+SQLite Storage - Normalized sqlite3 backend for ideas and assessments
+"""
+
+import os
+import sqlite3
+import sys
+from urllib.request import pathname2url
+from collections.abc import Mapping
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+from json_codec import dumps, loads, load_file
+from repo_journal import RepoJournal
+from repo_storage import RepoStorage
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ideas (
+    idea_id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    maturity_score INTEGER,
+    personal_interest_score INTEGER,
+    trend_score INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ideas_position ON ideas(position);
+CREATE INDEX IF NOT EXISTS idx_ideas_maturity ON ideas(maturity_score);
+CREATE INDEX IF NOT EXISTS idx_ideas_trend ON ideas(trend_score);
+
+CREATE TABLE IF NOT EXISTS tags (
+    idea_id TEXT NOT NULL REFERENCES ideas(idea_id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (idea_id, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_tags_tag ON tags(tag);
+
+CREATE TABLE IF NOT EXISTS related_items (
+    idea_id TEXT NOT NULL REFERENCES ideas(idea_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    week TEXT,
+    section TEXT,
+    item_id TEXT,
+    PRIMARY KEY (idea_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_related_items_item ON related_items(week, section, item_id);
+
+CREATE TABLE IF NOT EXISTS assessments (
+    idea_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    score INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (idea_id, type)
+);
+CREATE INDEX IF NOT EXISTS idx_assessments_type_score ON assessments(type, score);
+
+-- Weekly logs stay in json-logs/ (read through SourceStore); drop copies made by earlier imports
+DROP TABLE IF EXISTS weekly_items;
+DROP TABLE IF EXISTS weeks;
+"""
+
+# Stored in PRAGMA user_version once import_directory has filled the database
+IMPORTED_VERSION = 1
+
+
+class SqliteStorage(RepoStorage):
+    """Stores the repository in a single SQLite database.
+
+    Each idea keeps its full JSON in ``ideas.data`` so round trips are lossless,
+    while scores, tags and related items are also normalized into indexed
+    columns and tables for point queries.
+    """
+
+    stores_assessments = True
+
+    def __init__(self, db_path: str, mode: str = "rw"):
+        """mode is an SQLite open mode: "ro" (read only), "rw" (existing database) or "rwc" (create if missing)"""
+        self.db_path = db_path
+        self.mode = mode
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.mode == "rwc":
+                os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            elif not self.exists():
+                raise FileNotFoundError(f"SQLite database not found: {self.db_path} (run 'sqlite_storage.py import')")
+            self._conn = self.connect(self.db_path, self.mode)
+            self._conn.execute("PRAGMA foreign_keys = ON")
+            if self.mode != "ro":
+                self._conn.execute("PRAGMA journal_mode = WAL")
+            if self.mode == "rwc":
+                self._conn.executescript(SCHEMA)
+        return self._conn
+
+    @staticmethod
+    def connect(db_path: str, mode: str) -> sqlite3.Connection:
+        return sqlite3.connect(f"file:{pathname2url(os.path.abspath(db_path))}?mode={mode}", uri=True)
+
+    @classmethod
+    def is_imported(cls, db_path: str) -> bool:
+        """True if db_path holds a database that import_directory completed, checked without writing to it"""
+        if not os.path.isfile(db_path):
+            return False
+        try:
+            conn = cls.connect(db_path, "ro")
+            try:
+                if conn.execute("PRAGMA user_version").fetchone()[0] >= IMPORTED_VERSION:
+                    return True
+                # Databases imported before the version mark was written still hold ideas
+                return conn.execute("SELECT 1 FROM ideas LIMIT 1").fetchone() is not None
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return False
+
+    def exists(self) -> bool:
+        return os.path.exists(self.db_path)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # Ideas
+
+    def load_ideas(self) -> List[Dict[str, Any]]:
+        rows = self.conn.execute("SELECT data FROM ideas ORDER BY position")
+        return [loads(data) for (data,) in rows]
+
+    def load_idea(self, idea_id: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT data FROM ideas WHERE idea_id = ?", (idea_id,)).fetchone()
+        return loads(row[0]) if row else None
+
+    def save_idea(self, idea: Dict[str, Any], previous_id: Optional[str] = None):
+        with self.conn:
+            self._upsert_idea(idea, previous_id)
+
+    def delete_idea(self, idea_id: str):
+        with self.conn:
+            self.conn.execute("DELETE FROM ideas WHERE idea_id = ?", (idea_id,))
+
+    def maintain(self, repo_data: List[Dict[str, Any]]) -> bool:
+        # Every change is committed in its own transaction
+        return True
+
+    def _upsert_idea(self, idea: Dict[str, Any], previous_id: Optional[str] = None, position: Optional[int] = None):
+        idea_id = idea.get('idea_id')
+        if position is None:
+            row = None
+            for candidate in (previous_id, idea_id):
+                if candidate and row is None:
+                    row = self.conn.execute("SELECT position FROM ideas WHERE idea_id = ?", (candidate,)).fetchone()
+            if row is None:
+                row = self.conn.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM ideas").fetchone()
+            position = row[0]
+        if previous_id and previous_id != idea_id:
+            if self.conn.execute("SELECT 1 FROM ideas WHERE idea_id = ?", (idea_id,)).fetchone():
+                raise ValueError(f"Idea ID already exists: {idea_id}")
+        # Deleting the old row cascades to its tags and related items
+        self.conn.execute("DELETE FROM ideas WHERE idea_id = ?", (previous_id or idea_id,))
+
+        self.conn.execute(
+            "INSERT INTO ideas (idea_id, position, title, description, maturity_score, "
+            "personal_interest_score, trend_score, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (idea_id, position, idea.get('title', ''), idea.get('description', ''),
+             idea.get('maturity_score'), idea.get('personal_interest_score'), idea.get('trend_score'),
+             dumps(idea)))
+        self.conn.executemany("INSERT OR IGNORE INTO tags (idea_id, tag) VALUES (?, ?)",
+                              [(idea_id, tag) for tag in idea.get('tags', []) if isinstance(tag, str)])
+        self.conn.executemany(
+            "INSERT INTO related_items (idea_id, position, week, section, item_id) VALUES (?, ?, ?, ?, ?)",
+            [(idea_id, i, item.get('week'), item.get('section'), item.get('item_id'))
+             for i, item in enumerate(idea.get('related_items', [])) if isinstance(item, Mapping)])
+
+    def replace_ideas(self, repo_data: Iterable[Dict[str, Any]]) -> int:
+        """Replace all ideas with repo_data, keeping its order"""
+        count = 0
+        with self.conn:
+            self.conn.execute("DELETE FROM ideas")
+            for position, idea in enumerate(repo_data):
+                self._upsert_idea(idea, position=position)
+                count += 1
+        return count
+
+    def query_ideas(self, tag: Optional[str] = None, min_maturity: Optional[int] = None,
+                    min_trend: Optional[int] = None, week_from: Optional[str] = None,
+                    week_to: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return ideas matching all given filters, e.g. tag X with maturity >= 3 touching a week range"""
+        clauses = []
+        params: List[Any] = []
+        if tag is not None:
+            clauses.append("idea_id IN (SELECT idea_id FROM tags WHERE tag = ?)")
+            params.append(tag)
+        if min_maturity is not None:
+            clauses.append("maturity_score >= ?")
+            params.append(min_maturity)
+        if min_trend is not None:
+            clauses.append("trend_score >= ?")
+            params.append(min_trend)
+        if week_from is not None or week_to is not None:
+            # Week labels (YYYY-W##) sort lexicographically in time order
+            clauses.append("idea_id IN (SELECT idea_id FROM related_items WHERE week BETWEEN ? AND ?)")
+            params.extend([week_from or "", week_to or "\uffff"])
+        sql = "SELECT data FROM ideas"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY position"
+        return [loads(data) for (data,) in self.conn.execute(sql, params)]
+
+    # Assessments
+
+    def load_assessment(self, idea_id: str, assessment_type: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT data FROM assessments WHERE idea_id = ? AND type = ?",
+                                (idea_id, assessment_type)).fetchone()
+        return loads(row[0]) if row else None
+
+    def save_assessment(self, idea_id: str, assessment_type: str, assessment_data: Dict[str, Any]):
+        self.save_assessments({(idea_id, assessment_type): assessment_data})
+
+    def save_assessments(self, assessments: Dict[Tuple[str, str], Dict[str, Any]]) -> int:
+        """Write a batch of assessments keyed by (idea_id, type) in one transaction"""
+        rows = []
+        for (idea_id, assessment_type), assessment_data in assessments.items():
+            score = assessment_data.get(f'{assessment_type}_score')
+            rows.append((idea_id, assessment_type, score if isinstance(score, int) else None,
+                         dumps(assessment_data)))
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO assessments (idea_id, type, score, data) VALUES (?, ?, ?, ?)",
+                                  rows)
+        return len(rows)
+
+    # Import
+
+    def import_directory(self, data_path: str) -> Dict[str, int]:
+        """One-shot import of the ideas and assessments (REPOSITORY/repo.json, evaluations/); weekly logs stay files"""
+        counts = {'ideas': 0, 'assessments': 0}
+
+        repo_file_path = os.path.join(data_path, "REPOSITORY", "repo.json")
+        repo_data: List[Dict[str, Any]] = []
+        if os.path.exists(repo_file_path):
+            repo_data = load_file(repo_file_path)
+        RepoJournal(repo_file_path).replay(repo_data)
+        counts['ideas'] = self.replace_ideas(repo_data)
+
+        evaluations_path = os.path.join(data_path, "evaluations")
+        if os.path.isdir(evaluations_path):
+            for name in sorted(os.listdir(evaluations_path)):
+                stem, ext = os.path.splitext(name)
+                if ext != '.json' or '_' not in stem:
+                    continue
+                idea_id, assessment_type = stem.rsplit('_', 1)
+                self.save_assessment(idea_id, assessment_type, load_file(os.path.join(evaluations_path, name)))
+                counts['assessments'] += 1
+
+        # Only now may RepoCore pick this database over the flat files
+        with self.conn:
+            self.conn.execute(f"PRAGMA user_version = {IMPORTED_VERSION}")
+        return counts
+
+
+def main():
+    """Import the flat-file data directory into SQLite or run a point query"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SQLite storage for the EchoForge repository")
+    parser.add_argument("--db", default="../data/echoforge.db")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = subparsers.add_parser("import", help="import repo.json and evaluations/")
+    import_parser.add_argument("--data-dir", default="../data")
+
+    query_parser = subparsers.add_parser("query", help="list ideas matching filters")
+    query_parser.add_argument("--tag")
+    query_parser.add_argument("--min-maturity", type=int)
+    query_parser.add_argument("--min-trend", type=int)
+    query_parser.add_argument("--week-from")
+    query_parser.add_argument("--week-to")
+    args = parser.parse_args()
+
+    if args.command != "import" and not os.path.exists(args.db):
+        print(f"SQLite database not found: {args.db} (run 'import' first)", file=sys.stderr)
+        return 1
+    storage = SqliteStorage(args.db, mode="rwc" if args.command == "import" else "ro")
+    try:
+        if args.command == "import":
+            counts = storage.import_directory(args.data_dir)
+            print(f"Imported {counts['ideas']} ideas and {counts['assessments']} assessments into {args.db}")
+        else:
+            for idea in storage.query_ideas(args.tag, args.min_maturity, args.min_trend,
+                                            args.week_from, args.week_to):
+                print(f"{idea.get('idea_id', 'N/A')}: {idea.get('title', 'No Title')}")
+    finally:
+        storage.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Startup Profile - Phase timings for application startup
+"""
+
+import sys
+import time
+from typing import List, Optional, Tuple
+
+
+# Taken when this module is first imported; run.py imports it before anything else
+PROCESS_START = time.perf_counter()
+
+
+class StartupProfiler:
+    """Records the duration of named startup phases and prints a breakdown"""
+
+    def __init__(self, start: Optional[float] = None, stream=None):
+        self.start = PROCESS_START if start is None else start
+        self.last = self.start
+        self.stream = stream if stream is not None else sys.stderr
+        self.phases: List[Tuple[str, float, float]] = []
+        self.reported = False
+
+    def mark(self, phase: str):
+        """End the current phase, naming it"""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last, now - self.start))
+        self.last = now
+
+    def elapsed(self, phase: str) -> Optional[float]:
+        """Seconds from start to the end of a phase, or None if it was not reached"""
+        for name, _, total in self.phases:
+            if name == phase:
+                return total
+        return None
+
+    def format_report(self) -> str:
+        width = max([len(name) for name, _, _ in self.phases] + [5])
+        lines = ["Startup profile:"]
+        for name, duration, total in self.phases:
+            lines.append(f"  {name:<{width}}  {duration * 1000:8.1f} ms  (at {total * 1000:8.1f} ms)")
+        return "\n".join(lines)
+
+    def report(self):
+        """Print the breakdown once"""
+        if not self.reported:
+            self.reported = True
+            print(self.format_report(), file=self.stream)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Synthetic Data - Deterministic generator of weekly logs, ideas and assessments for benchmarks
+"""
+
+import json
+import os
+import random
+import sys
+from typing import Dict, List, Any
+
+
+SECTIONS = [
+    "experiments_and_research",
+    "coding_and_projects",
+    "systems_engineering_work",
+    "content_ideas",
+    "notes_and_observations",
+]
+# One letter per section so item ids match the repo schema pattern ^[a-z]\d+$
+SECTION_PREFIXES = {
+    "experiments_and_research": "e",
+    "coding_and_projects": "c",
+    "systems_engineering_work": "s",
+    "content_ideas": "t",
+    "notes_and_observations": "n",
+}
+WORDS = [
+    "agent", "architecture", "battery", "benchmark", "cache", "compiler", "dashboard", "dataset",
+    "diagram", "drone", "embedding", "fuel", "cell", "gateway", "graph", "hydrogen", "index",
+    "interface", "kernel", "latency", "model", "network", "optimizer", "pipeline", "propulsion",
+    "prototype", "requirements", "robot", "schema", "search", "sensor", "simulation", "solver",
+    "storage", "stream", "systems", "telemetry", "thermal", "toolchain", "trace", "vector", "workflow",
+]
+TOOLS = ["Python", "Rust", "React", "Supabase", "SysML", "Jupyter", "Docker", "Blender", "LaTeX"]
+
+
+def week_label(index: int, first_year: int = 2000) -> str:
+    """Return the YYYY-W## label of the index-th generated week (52 weeks per year)"""
+    return f"{first_year + index // 52}-W{index % 52 + 1:02d}"
+
+
+def sentence(rng: random.Random, min_words: int, max_words: int) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))]
+    return " ".join(words).capitalize()
+
+
+def generate_week(rng: random.Random, index: int, items_per_section: int) -> Dict[str, Any]:
+    """Build one weekly log that follows weekly.schema.json"""
+    week = week_label(index)
+    year, number = week.split("-W")
+    return {
+        "week": week,
+        "date_range": f"{year} week {number}",
+        "items": {
+            section: [{"id": f"{SECTION_PREFIXES[section]}{position + 1}", "text": sentence(rng, 4, 12)}
+                      for position in range(items_per_section)]
+            for section in SECTIONS
+        },
+        "metadata": {
+            "tools_used": rng.sample(TOOLS, 3),
+            "tags": rng.sample(WORDS, 4),
+            "source": "synthetic",
+            "generated_at": f"{year}-01-01T00:00:00Z",
+        },
+    }
+
+
+def week_markdown(week_data: Dict[str, Any]) -> str:
+    """Render a weekly log the way the Weekly Archivist writes its markdown"""
+    lines = [f"# Weekly Log {week_data['week']}", "", f"_{week_data['date_range']}_", ""]
+    for section, items in week_data["items"].items():
+        lines.append(f"## {section.replace('_', ' ').title()}")
+        lines.append("")
+        lines.extend(f"- **{item['id']}**: {item['text']}" for item in items)
+        lines.append("")
+    return "\n".join(lines)
+
+
+def generate_idea(rng: random.Random, index: int, weeks: int, related_per_idea: int,
+                  items_per_section: int) -> Dict[str, Any]:
+    """Build one idea in the shape the repo manager reads and writes (see repo.schema.json)"""
+    related_items = []
+    for _ in range(related_per_idea):
+        section = rng.choice(SECTIONS)
+        related_items.append({
+            "week": week_label(rng.randrange(weeks)),
+            "item_id": f"{SECTION_PREFIXES[section]}{rng.randint(1, items_per_section)}",
+            "section": section,
+        })
+    return {
+        "idea_id": f"I-SYN-{index:06d}",
+        "title": sentence(rng, 2, 5),
+        "description": sentence(rng, 12, 30),
+        "related_items": related_items,
+        "maturity_score": rng.randint(1, 10),
+        "personal_interest_score": rng.randint(1, 10),
+        "trend_score": rng.randint(1, 10),
+        "tags": rng.sample(WORDS, rng.randint(1, 4)),
+    }
+
+
+def generate_assessment(rng: random.Random, idea_id: str, assessment_type: str) -> Dict[str, Any]:
+    """Build an assessment in the Evaluator's trend or maturity format"""
+    assessment = {"idea_id": idea_id, f"{assessment_type}_score": rng.randint(1, 10),
+                  "justification": sentence(rng, 15, 40)}
+    if assessment_type == "trend":
+        assessment["suggested_tags"] = rng.sample(WORDS, 3)
+    else:
+        assessment["suggested_next_steps"] = [sentence(rng, 3, 8) for _ in range(3)]
+    return assessment
+
+
+def generate_dataset(data_path: str, weeks: int, ideas: int, related_per_idea: int,
+                     items_per_section: int = 4, assessment_ratio: float = 0.5, seed: int = 0) -> Dict[str, int]:
+    """Write a complete data directory (REPOSITORY/, json-logs/, md-logs/, evaluations/); same seed, same bytes"""
+    rng = random.Random(seed)
+    paths = {name: os.path.join(data_path, name) for name in ("REPOSITORY", "json-logs", "md-logs", "evaluations")}
+    for path in paths.values():
+        os.makedirs(path, exist_ok=True)
+
+    for index in range(weeks):
+        week_data = generate_week(rng, index, items_per_section)
+        with open(os.path.join(paths["json-logs"], f"{week_data['week']}.json"), 'w', encoding='utf-8') as f:
+            json.dump(week_data, f, indent=2, ensure_ascii=False)
+        with open(os.path.join(paths["md-logs"], f"{week_data['week']}.md"), 'w', encoding='utf-8') as f:
+            f.write(week_markdown(week_data))
+
+    repo_data: List[Dict[str, Any]] = [generate_idea(rng, index, weeks, related_per_idea, items_per_section)
+                                       for index in range(ideas)]
+    with open(os.path.join(paths["REPOSITORY"], "repo.json"), 'w', encoding='utf-8') as f:
+        json.dump(repo_data, f, indent=2, ensure_ascii=False)
+
+    assessments = 0
+    for idea in repo_data:
+        for assessment_type in ("trend", "maturity"):
+            if rng.random() < assessment_ratio:
+                assessment = generate_assessment(rng, idea["idea_id"], assessment_type)
+                file_name = f"{idea['idea_id']}_{assessment_type}.json"
+                with open(os.path.join(paths["evaluations"], file_name), 'w', encoding='utf-8') as f:
+                    json.dump(assessment, f, indent=2, ensure_ascii=False)
+                assessments += 1
+
+    return {'weeks': weeks, 'ideas': ideas, 'related_items': ideas * related_per_idea, 'assessments': assessments}
+
+
+def main():
+    """Generate a synthetic data directory"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate deterministic synthetic EchoForge data")
+    parser.add_argument("output", help="data directory to create")
+    parser.add_argument("--weeks", type=int, default=52)
+    parser.add_argument("--ideas", type=int, default=200)
+    parser.add_argument("--related", type=int, default=5, help="related items per idea")
+    parser.add_argument("--items-per-section", type=int, default=4)
+    parser.add_argument("--assessment-ratio", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    counts = generate_dataset(args.output, args.weeks, args.ideas, args.related,
+                              args.items_per_section, args.assessment_ratio, args.seed)
+    print(f"Generated {counts['weeks']} weeks, {counts['ideas']} ideas, "
+          f"{counts['related_items']} related items and {counts['assessments']} assessments in {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Tracing - Opt-in spans and metrics for the repo manager data paths
+"""
+
+import functools
+import json
+import os
+import time
+from collections import deque
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+
+# (bytes, count) for one call, computed from the traced object, the call arguments and the result
+MetricFunction = Callable[[Any, tuple, Any], Tuple[Optional[int], Optional[int]]]
+SPAN_FIELDS = ['name', 'parent', 'start', 'seconds', 'bytes', 'count', 'error']
+
+
+def file_size(path: Optional[str]) -> Optional[int]:
+    try:
+        return os.path.getsize(path) if path else None
+    except OSError:
+        return None
+
+
+def storage_bytes(core) -> Optional[int]:
+    """Size of the file that holds the idea list for the core's storage backend"""
+    storage = core.storage
+    for attribute in ('db_path', 'index_path', 'repo_file_path'):
+        if hasattr(storage, attribute):
+            return file_size(getattr(storage, attribute))
+    return None
+
+
+def assessment_bytes(core, idea_id: str, assessment_type: str, assessment: Any) -> Optional[int]:
+    if assessment is None:
+        return 0
+    if core.storage.stores_assessments:
+        return len(json.dumps(assessment, ensure_ascii=False).encode('utf-8'))
+    return file_size(core.get_assessment_file_path(idea_id, assessment_type))
+
+
+def source_bytes(core) -> int:
+    return sum(entry.get('json_size', 0) + entry.get('md_size', 0) for entry in core.source_data.manifest.values())
+
+
+# Bytes read or written and item counts for the RepoCore data paths
+CORE_METRICS: Dict[str, MetricFunction] = {
+    'load_repo_data': lambda core, args, result: (storage_bytes(core), len(core.repo_data)),
+    'load_source_data': lambda core, args, result: (source_bytes(core), len(core.source_data.manifest)),
+    'get_source_information': lambda core, args, result: (
+        len(result.encode('utf-8')) if isinstance(result, str) else None,
+        len((args[0] or {}).get('related_items', []) or []) if args else None),
+    'save_repo_data': lambda core, args, result: (storage_bytes(core), len(core.repo_data)),
+    'flush_repo_data': lambda core, args, result: (storage_bytes(core), len(core.repo_data)),
+    'load_assessment': lambda core, args, result: (assessment_bytes(core, args[0], args[1], result),
+                                                   0 if result is None else 1),
+    'save_assessment': lambda core, args, result: (assessment_bytes(core, args[0], args[1], args[2]),
+                                                   0 if result is False else 1),
+}
+
+
+class Tracer:
+    """Records timed spans for selected methods of an object.
+
+    Nothing is wrapped until enable(): instrumented methods are replaced on the
+    instance only while tracing is on, and disable() removes the wrappers again,
+    so a disabled tracer costs nothing on the traced paths. Spans keep the name
+    of the enclosing traced call, which separates e.g. a load_assessment done
+    by save_assessment from one triggered by selecting an idea.
+    """
+
+    def __init__(self, max_spans: int = 2000):
+        self.enabled = False
+        self.spans: "deque[Dict[str, Any]]" = deque(maxlen=max_spans)
+        self.totals: Dict[str, Dict[str, Any]] = {}
+        self._targets: List[Tuple[Any, Dict[str, Optional[MetricFunction]]]] = []
+        self._stack: List[str] = []
+        self.started = time.perf_counter()
+
+    def instrument(self, target: Any, metrics: Dict[str, Optional[MetricFunction]]):
+        """Trace the named methods of target (metric function or None per method) whenever tracing is enabled"""
+        metrics = {name: metric for name, metric in metrics.items() if hasattr(target, name)}
+        self._targets.append((target, metrics))
+        if self.enabled:
+            self._wrap(target, metrics)
+
+    def enable(self):
+        if not self.enabled:
+            self.enabled = True
+            for target, metrics in self._targets:
+                self._wrap(target, metrics)
+
+    def disable(self):
+        if self.enabled:
+            self.enabled = False
+            for target, metrics in self._targets:
+                for name in metrics:
+                    target.__dict__.pop(name, None)
+
+    def _wrap(self, target: Any, metrics: Dict[str, Optional[MetricFunction]]):
+        for name, metric in metrics.items():
+            setattr(target, name, self._traced(target, name, getattr(target, name), metric))
+
+    def _traced(self, target: Any, name: str, method: Callable, metric: Optional[MetricFunction]) -> Callable:
+        @functools.wraps(method)
+        def traced(*args, **kwargs):
+            parent = self._stack[-1] if self._stack else None
+            self._stack.append(name)
+            start = time.perf_counter()
+            error = None
+            result = None
+            try:
+                result = method(*args, **kwargs)
+                return result
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                seconds = time.perf_counter() - start
+                self._stack.pop()
+                size = count = None
+                if metric is not None and error is None:
+                    try:
+                        size, count = metric(target, args, result)
+                    except Exception:
+                        pass
+                self.record(name, seconds, size, count, parent, error, start)
+        return traced
+
+    def record(self, name: str, seconds: float, size: Optional[int] = None, count: Optional[int] = None,
+               parent: Optional[str] = None, error: Optional[str] = None, start: Optional[float] = None):
+        """Add one finished span"""
+        start = time.perf_counter() - seconds if start is None else start
+        self.spans.append({'name': name, 'parent': parent, 'start': round(start - self.started, 6),
+                           'seconds': seconds, 'bytes': size, 'count': count, 'error': error})
+        totals = self.totals.setdefault(name, {'calls': 0, 'seconds': 0.0, 'max_seconds': 0.0,
+                                               'bytes': 0, 'count': 0, 'errors': 0})
+        totals['calls'] += 1
+        totals['seconds'] += seconds
+        totals['max_seconds'] = max(totals['max_seconds'], seconds)
+        totals['bytes'] += size or 0
+        totals['count'] += count or 0
+        totals['errors'] += 1 if error else 0
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Per-name totals plus median and p95 over the recent spans, slowest total first"""
+        recent: Dict[str, List[float]] = {}
+        for span in self.spans:
+            recent.setdefault(span['name'], []).append(span['seconds'])
+        rows = []
+        for name, totals in self.totals.items():
+            durations = sorted(recent.get(name, []))
+            rows.append({'name': name, **totals,
+                         'mean_seconds': totals['seconds'] / totals['calls'],
+                         'median_seconds': durations[len(durations) // 2] if durations else None,
+                         'p95_seconds': durations[int(len(durations) * 0.95)] if durations else None})
+        rows.sort(key=lambda row: row['seconds'], reverse=True)
+        return rows
+
+    def reset(self):
+        self.spans.clear()
+        self.totals.clear()
+
+    def export(self, path: str):
+        """Write the metrics to path: CSV (one row per recent span) for .csv, JSON (summary and spans) otherwise"""
+        if path.lower().endswith('.csv'):
+            import csv
+
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=SPAN_FIELDS)
+                writer.writeheader()
+                writer.writerows(self.spans)
+            return
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'summary': self.summary(), 'spans': list(self.spans)}, f, indent=2)
+
+    def format_summary(self) -> str:
+        lines = [f"{'operation':<24} {'calls':>6} {'total ms':>10} {'mean ms':>9} {'p95 ms':>9} {'bytes':>12} {'count':>8}"]
+        for row in self.summary():
+            p95 = row['p95_seconds'] * 1000 if row['p95_seconds'] is not None else 0
+            lines.append(f"{row['name']:<24} {row['calls']:>6} {row['seconds'] * 1000:>10.2f} "
+                         f"{row['mean_seconds'] * 1000:>9.3f} {p95:>9.3f} {row['bytes']:>12} {row['count']:>8}")
+        return "\n".join(lines)
@@ -1 +1,9 @@
-# Tests package for Repo Manager 
\ No newline at end of file
+# Tests package for Repo Manager 
+import atexit
+import os
+import shutil
+import tempfile
+
+# Keep the tool's caches (markdown log offsets) out of the user's cache directory while testing
+os.environ["ECHOFORGE_CACHE_DIR"] = tempfile.mkdtemp(prefix="echoforge-test-cache-")
+atexit.register(shutil.rmtree, os.environ["ECHOFORGE_CACHE_DIR"], True)
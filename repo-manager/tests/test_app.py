@@ -5,19 +5,20 @@ Test script to verify Repo Manager functionality without GUI
 
 import sys
 import os
-import json
 
 # Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from repo_core import RepoCore
 
 def test_data_loading():
     """Test loading data from repo.json"""
-    repo_file_path = "../data/REPOSITORY/repo.json"
+    core = RepoCore("../data")
+    repo_file_path = core.repo_file_path
     
     try:
-        if os.path.exists(repo_file_path):
-            with open(repo_file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        if core.storage.exists():
+            data = core.load_repo_data()
             print(f"✅ Successfully loaded {len(data)} ideas from {repo_file_path}")
             
             # Print first idea as example
@@ -39,12 +40,11 @@ def test_data_loading():
 
 def test_data_structure():
     """Test that data structure is valid"""
-    repo_file_path = "../data/REPOSITORY/repo.json"
+    core = RepoCore("../data")
     
     try:
-        if os.path.exists(repo_file_path):
-            with open(repo_file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        if core.storage.exists():
+            data = core.load_repo_data()
             
             required_fields = ['idea_id', 'title', 'description', 'maturity_score', 
                               'personal_interest_score', 'trend_score', 'tags', 'related_items']
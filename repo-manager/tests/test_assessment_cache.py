@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the assessment cache
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from assessment_cache import AssessmentCache
+
+
+class TestAssessmentCache(unittest.TestCase):
+    """Tests for the startup scan, mtime validation and write-through saves"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.evaluations_path = self.tmp.name
+        self.write("I-A_trend.json", {"idea_id": "I-A", "trend_score": 6})
+        self.write("I_B_maturity.json", {"idea_id": "I_B", "maturity_score": 4})
+        self.write("notes.txt", {})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name: str, data: dict, mtime: float = None):
+        path = os.path.join(self.evaluations_path, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+
+    def test_scan_records_existing_assessments(self):
+        """One scan finds every assessment; ids may contain underscores"""
+        cache = AssessmentCache(self.evaluations_path)
+        self.assertEqual(cache.scan(), 2)
+        self.assertEqual(set(cache.files), {("I-A", "trend"), ("I_B", "maturity")})
+        self.assertEqual(cache.get("I_B", "maturity")["maturity_score"], 4)
+        self.assertIsNone(cache.get("I-A", "maturity"))
+
+    def test_reload_only_when_mtime_changes(self):
+        """Cached payloads are reused until the file is modified"""
+        cache = AssessmentCache(self.evaluations_path)
+        cache.scan()
+        first = cache.get("I-A", "trend")
+        self.assertIs(cache.get("I-A", "trend"), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        self.write("I-A_trend.json", {"idea_id": "I-A", "trend_score": 9}, mtime=1_000_000)
+        self.assertEqual(cache.get("I-A", "trend")["trend_score"], 9)
+
+        os.remove(os.path.join(self.evaluations_path, "I-A_trend.json"))
+        self.assertIsNone(cache.get("I-A", "trend"))
+        self.assertNotIn(("I-A", "trend"), cache.files)
+
+    def test_put_writes_through_and_bounds_entries(self):
+        """Saving updates disk and cache; only max_entries payloads are kept"""
+        cache = AssessmentCache(self.evaluations_path, max_entries=1)
+        cache.scan()
+        cache.put("I-C", "trend", {"idea_id": "I-C", "trend_score": 3})
+        with open(os.path.join(self.evaluations_path, "I-C_trend.json"), 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)["trend_score"], 3)
+        self.assertEqual(cache.get("I-C", "trend")["trend_score"], 3)
+        self.assertEqual(cache.hits, 1)
+
+        cache.get("I-A", "trend")
+        self.assertEqual(len(cache), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Unit tests for bulk assessment import
+"""
+
+import unittest
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from assessment_cache import AssessmentCache
+import assessment_import
+from assessment_import import collect_assessments, validate_assessment
+from sqlite_storage import SqliteStorage
+
+
+def trend(idea_id: str, score: int = 5) -> dict:
+    return {"idea_id": idea_id, "trend_score": score, "justification": "Rising interest",
+            "suggested_tags": ["ai"]}
+
+
+def maturity(idea_id: str, score: int = 6) -> dict:
+    return {"idea_id": idea_id, "maturity_score": score, "justification": "Prototype exists",
+            "suggested_next_steps": ["Write it up"]}
+
+
+class TestAssessmentImport(unittest.TestCase):
+    """Tests for validation, source reading and batch writing"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.tmp.name, name)
+
+    def test_validate_against_formats(self):
+        """Each format's fields, types and score range are enforced"""
+        self.assertEqual(validate_assessment(trend("I-A")), ("trend", []))
+        self.assertEqual(validate_assessment(maturity("I-A")), ("maturity", []))
+
+        record = maturity("I-A", score=11)
+        del record["suggested_next_steps"]
+        assessment_type, errors = validate_assessment(record)
+        self.assertEqual(assessment_type, "maturity")
+        self.assertEqual(len(errors), 2)
+
+        self.assertIsNone(validate_assessment({**trend("I-A"), "maturity_score": 3})[0])
+        self.assertEqual(validate_assessment({**trend("I-A"), "trend_score": True})[1], ["'trend_score' must be int"])
+
+    def test_collect_from_directory_and_jsonl(self):
+        """Records are keyed by idea_id and type; rejects carry their file and line"""
+        os.makedirs(self.path("outputs"))
+        with open(self.path("outputs/a.json"), 'w', encoding='utf-8') as f:
+            json.dump([trend("I-A"), maturity("I-A")], f)
+        with open(self.path("outputs/bad.json"), 'w', encoding='utf-8') as f:
+            f.write("{not json")
+        with open(self.path("batch.jsonl"), 'w', encoding='utf-8') as f:
+            f.write(json.dumps(trend("I-A", 8)) + "\n\n")
+            f.write(json.dumps(trend("I-X")) + "\n")
+            f.write(json.dumps({"idea_id": "I-B"}) + "\n")
+
+        report = collect_assessments([self.path("outputs"), self.path("batch.jsonl")], known_ids={"I-A", "I-B"})
+
+        self.assertEqual(set(report.accepted), {("I-A", "trend"), ("I-A", "maturity")})
+        self.assertEqual(report.accepted[("I-A", "trend")]["trend_score"], 8)
+        self.assertEqual(len(report.replaced), 1)
+        locations = sorted(location for location, _ in report.rejects)
+        self.assertEqual(locations, [self.path("batch.jsonl:3"), self.path("batch.jsonl:4"),
+                                     self.path("outputs/bad.json")])
+        self.assertIn("rejected 3", report.summary())
+
+    def test_write_batch(self):
+        """Accepted assessments are written to evaluations/ or SQLite in one batch"""
+        report = collect_assessments([self.write_jsonl([trend("I-A"), maturity("I-B")])])
+
+        cache = AssessmentCache(self.path("evaluations"))
+        os.makedirs(cache.evaluations_path)
+        self.assertEqual(cache.put_many(report.accepted), 2)
+        self.assertEqual(cache.put_many(report.accepted), 0)
+        self.assertTrue(os.path.exists(self.path("evaluations/I-B_maturity.json")))
+
+        storage = SqliteStorage(self.path("echoforge.db"), mode="rwc")
+        try:
+            self.assertEqual(storage.save_assessments(report.accepted), 2)
+            self.assertEqual(storage.load_assessment("I-A", "trend")["trend_score"], 5)
+        finally:
+            storage.close()
+
+    def test_worker_processes_match_in_process_results(self):
+        """Validating across processes keeps the input order and the same outcome"""
+        os.makedirs(self.path("outputs"))
+        for number in range(assessment_import.PARALLEL_THRESHOLD + 4):
+            with open(self.path(f"outputs/{number:03d}.json"), 'w', encoding='utf-8') as f:
+                json.dump([trend("I-A", number % 10 + 1), maturity(f"I-{number}")] if number != 7 else {}, f)
+
+        serial = collect_assessments([self.path("outputs")], workers=1)
+        with mock.patch.object(assessment_import, "ProcessPoolExecutor", wraps=ProcessPoolExecutor) as pool:
+            parallel = collect_assessments([self.path("outputs")], workers=2)
+        # Never forked: the GUI runs imports from a thread of the Tk process
+        self.assertEqual(pool.call_args.kwargs["mp_context"].get_start_method(), "spawn")
+        self.assertEqual(parallel.to_dict(), serial.to_dict())
+        self.assertEqual(parallel.accepted[("I-A", "trend")]["trend_score"], 10)
+        self.assertEqual(len(parallel.rejects), 1)
+
+    def test_cli_skips_unchanged_files(self):
+        """A second import of the same records writes nothing"""
+        argv = [self.write_jsonl([trend("I-A"), maturity("I-B")]),
+                "--evaluations-dir", self.path("evaluations"), "--workers", "1"]
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(assessment_import.main(argv), 0)
+            self.assertEqual(assessment_import.main(argv), 0)
+        self.assertIn("Wrote 2 assessments", output.getvalue())
+        self.assertTrue(output.getvalue().rstrip().endswith("Wrote 0 assessments"))
+
+    def write_jsonl(self, records: list) -> str:
+        with open(self.path("records.jsonl"), 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+        return self.path("records.jsonl")
+
+
+if __name__ == '__main__':
+    unittest.main()
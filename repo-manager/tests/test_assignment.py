@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the TF-IDF item-to-idea assignment engine
+"""
+
+import unittest
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+from collections import Counter
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import assignment
+from assignment import TfidfIndex, build_idea_index, build_repo_updates, idea_terms, suggest_assignments
+from repo_core import RepoCore
+from search_index import tokenize
+from synthetic_data import generate_dataset
+import echoforge_cli
+
+
+def make_data_dir(root: str):
+    os.makedirs(os.path.join(root, "REPOSITORY"))
+    os.makedirs(os.path.join(root, "json-logs"))
+    with open(os.path.join(root, "REPOSITORY", "repo.json"), 'w', encoding='utf-8') as f:
+        json.dump([
+            {"idea_id": "I-FUEL", "title": "Hydrogen fuel cell drones", "description": "Long range delivery drones",
+             "tags": ["hydrogen", "drones"], "related_items": [{"week": "2025-W01", "section": "notes_and_observations",
+                                                                "item_id": "n1"}]},
+            {"idea_id": "I-MBSE", "title": "Functional architecture verbs", "description": "SysML modelling style",
+             "tags": ["mbse"], "related_items": []},
+        ], f)
+    with open(os.path.join(root, "json-logs", "2025-W01.json"), 'w', encoding='utf-8') as f:
+        json.dump({"items": {"notes_and_observations": [{"id": "n1", "text": "Electrolyser efficiency notes"}]}}, f)
+    with open(os.path.join(root, "json-logs", "2025-W02.json"), 'w', encoding='utf-8') as f:
+        json.dump({"items": {
+            "coding_and_projects": [{"id": "c1", "text": "Simulated a hydrogen fuel cell stack for a drone"},
+                                    {"id": "c2", "text": "Knitting patterns"}],
+            "content_ideas": [{"id": "ci1", "text": "Video about verbs in SysML architecture"},
+                              {"id": "ci2", "text": "Gardening"}],
+            "notes_and_observations": [{"id": "n1", "text": "Electrolyser costs are falling"}],
+        }}, f)
+
+
+class TestTfidfIndex(unittest.TestCase):
+    """Tests for the sparse TF-IDF index"""
+
+    def test_ranking_and_ties(self):
+        index = TfidfIndex(use_numpy=False)
+        index.build([("a", Counter(tokenize("fuel cell drone"))), ("b", Counter(tokenize("fuel cell drone"))),
+                     ("c", Counter(tokenize("graph database"))), ("d", Counter())])
+        results = index.query(Counter(tokenize("drone fuel")), top_k=5)
+        self.assertEqual([position for position, _ in results], [0, 1])
+        self.assertAlmostEqual(results[0][1], results[1][1])
+        self.assertLessEqual(results[0][1], 1.0 + 1e-9)
+        self.assertEqual(index.query(Counter(tokenize("unknown words")), top_k=5), [])
+        self.assertEqual(index.query(Counter(tokenize("graph")), top_k=0), [])
+        self.assertEqual(index.shared_terms(Counter(tokenize("graph database index")), 2), ["database", "graph"])
+
+    @unittest.skipIf(assignment.numpy is None, "NumPy is not installed")
+    def test_numpy_matches_pure_python(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            generate_dataset(temp_dir, weeks=4, ideas=60, related_per_idea=3, seed=2)
+            core = RepoCore(temp_dir)
+            core.load_repo_data()
+            core.load_source_data()
+            fast = build_idea_index(core, use_numpy=True)
+            slow = build_idea_index(core, use_numpy=False)
+            for _, item_data in core.source_data.week_items(core.source_data.weeks()[0]):
+                terms = Counter(tokenize(item_data['text']))
+                expected = slow.query(terms, 5)
+                actual = fast.query(terms, 5)
+                self.assertEqual([position for position, _ in actual], [position for position, _ in expected])
+                for (_, a), (_, b) in zip(actual, expected):
+                    self.assertAlmostEqual(a, b)
+            core.close()
+
+    def test_idea_terms_weights_title_and_tags(self):
+        terms = idea_terms({"title": "Drones", "description": "Drones and cells", "tags": ["cells"],
+                            "related_items": [{"week": "W1", "section": "s", "item_id": "i"}, "junk"]},
+                           lambda week, section, item_id: "linked text")
+        self.assertEqual(terms["drones"], 3)
+        self.assertEqual(terms["cells"], 3)
+        self.assertEqual(terms["linked"], 1)
+
+
+class TestSuggestions(unittest.TestCase):
+    """Tests for suggestions and the repo_updates file"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        make_data_dir(self.tmp.name)
+        self.core = RepoCore(self.tmp.name)
+        self.core.load_repo_data()
+        self.core.load_source_data()
+
+    def tearDown(self):
+        self.core.close()
+        self.tmp.cleanup()
+
+    def test_suggest_and_shape_updates(self):
+        index = build_idea_index(self.core, use_numpy=False)
+        suggestions = suggest_assignments(self.core, ["2025-W02"], index)
+        by_item = {suggestion['item_id']: suggestion for suggestion in suggestions}
+        self.assertEqual(by_item['c1']['candidates'][0]['idea_id'], "I-FUEL")
+        self.assertEqual(by_item['c2']['candidates'], [])
+        # Linked item text makes the electrolyser note match the idea that links the first one
+        self.assertEqual(by_item['n1']['candidates'][0]['idea_id'], "I-FUEL")
+
+        updates = build_repo_updates(suggestions, threshold=0.2)
+        self.assertEqual(updates['existing_ideas_updated'][0]['idea_id'], "I-FUEL")
+        self.assertEqual([item['item_id'] for item in updates['existing_ideas_updated'][0]['items_added']],
+                         ["c1", "n1"])
+        self.assertEqual([entry['content_item']['item_id'] for entry in updates['content_ideas_assigned']], ["ci1"])
+        self.assertEqual(updates['content_ideas_assigned'][0]['assigned_to_idea'], "I-MBSE")
+        # Content ideas never become new ideas, even without a match
+        self.assertEqual([entry['source_item']['item_id'] for entry in updates['new_ideas_added']], ["c2"])
+
+    def test_linked_items_are_skipped(self):
+        suggestions = suggest_assignments(self.core, ["2025-W01"])
+        self.assertEqual(suggestions[0]['linked_ideas'], ["I-FUEL"])
+        self.assertEqual(suggestions[0]['candidates'], [])
+        self.assertEqual(build_repo_updates(suggestions),
+                         {'new_ideas_added': [], 'existing_ideas_updated': [], 'content_ideas_assigned': []})
+
+    def test_cli_writes_suggestion_file(self):
+        output = os.path.join(self.tmp.name, "suggestions.json")
+        with contextlib.redirect_stderr(io.StringIO()):
+            code = echoforge_cli.main(["--data-dir", self.tmp.name, "suggest", "2025-W02", "--output", output])
+            self.assertEqual(echoforge_cli.main(["--data-dir", self.tmp.name, "suggest", "1999-W01"]), 1)
+        self.assertEqual(code, 0)
+        with open(output, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+        self.assertEqual(set(report['repo_updates']),
+                         {'new_ideas_added', 'existing_ideas_updated', 'content_ideas_assigned'})
+        self.assertEqual(len(report['suggestions']), 5)
+
+        with contextlib.redirect_stderr(io.StringIO()):
+            echoforge_cli.main(["--data-dir", self.tmp.name, "suggest", "2025-W02"])
+        written = os.listdir(os.path.join(self.tmp.name, "REPOSITORY", "transition_logs"))
+        self.assertEqual(len(written), 1)
+        self.assertTrue(written[0].endswith("_weekly_to_repo_suggestions.json"))
+
+
+if __name__ == "__main__":
+    unittest.main()
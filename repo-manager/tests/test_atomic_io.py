@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Unit tests for crash-safe file writes
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+from unittest import mock
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from atomic_io import atomic_write_json
+
+
+class TestAtomicWrite(unittest.TestCase):
+    """Tests for atomic JSON writes"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "nested", "repo.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_write_and_replace(self):
+        """Files are created, replaced and no temp files are left behind"""
+        atomic_write_json(self.path, [{"idea_id": "I-A"}])
+        atomic_write_json(self.path, [{"idea_id": "I-B"}])
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), [{"idea_id": "I-B"}])
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["repo.json"])
+
+    def test_failed_write_keeps_original(self):
+        """A failure before the rename leaves the previous content intact"""
+        atomic_write_json(self.path, [{"idea_id": "I-A"}])
+        with mock.patch("atomic_io.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                atomic_write_json(self.path, [{"idea_id": "I-B"}])
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), [{"idea_id": "I-A"}])
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["repo.json"])
+
+
+if __name__ == '__main__':
+    unittest.main()
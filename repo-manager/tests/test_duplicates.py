@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Unit tests for near-duplicate idea detection and merging
+"""
+
+import unittest
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import duplicates
+from duplicates import DuplicateDetector, MinHasher, merge_ideas, text_shingles
+from repo_core import RepoCore
+from synthetic_data import generate_idea
+import echoforge_cli
+
+
+def idea(idea_id, title, description, tags=(), items=()):
+    return {"idea_id": idea_id, "title": title, "description": description, "tags": list(tags),
+            "related_items": [{"week": week, "section": "notes_and_observations", "item_id": item_id}
+                              for week, item_id in items]}
+
+
+IDEAS = [
+    idea("I-FUEL", "Hydrogen fuel cell drones", "Long range delivery drones powered by hydrogen fuel cells",
+         ["hydrogen", "drones"], [("2025-W01", "n1"), ("2025-W02", "n3")]),
+    idea("I-MBSE", "Functional architecture verbs", "Naming functions with verbs in SysML models", ["mbse"]),
+    idea("I-FUEL-2", "Hydrogen fuel cell drones", "Long range delivery drones powered by hydrogen fuel cells too",
+         ["drones", "energy"], [("2025-W01", "n1"), ("2025-W03", "n2")]),
+    idea("I-GARDEN", "Balcony gardening", "Growing tomatoes on a small balcony", ["garden"]),
+]
+
+
+class TestDuplicateDetector(unittest.TestCase):
+    """Tests for MinHash, LSH candidates and clustering"""
+
+    def test_minhash_is_deterministic_and_estimates_jaccard(self):
+        first = {f"s{i}" for i in range(100)}
+        second = {f"s{i}" for i in range(50, 150)}
+        hasher = MinHasher(num_perm=256, seed=3, use_numpy=False)
+        signature = hasher.signature(first)
+        self.assertEqual(signature, MinHasher(num_perm=256, seed=3, use_numpy=False).signature(first))
+        estimate = sum(a == b for a, b in zip(signature, hasher.signature(second))) / 256
+        self.assertAlmostEqual(estimate, 50 / 150, delta=0.1)
+        self.assertEqual(hasher.signature(set()), ())
+
+    @unittest.skipIf(duplicates.numpy is None, "NumPy is not installed")
+    def test_numpy_signatures_match(self):
+        shingles = text_shingles(IDEAS[0])
+        self.assertEqual(MinHasher(use_numpy=True).signature(shingles), MinHasher(use_numpy=False).signature(shingles))
+
+    def test_finds_planted_duplicates(self):
+        clusters = DuplicateDetector(use_numpy=False).find(IDEAS)
+        self.assertEqual(len(clusters), 1)
+        self.assertEqual(clusters[0]['idea_ids'], ["I-FUEL", "I-FUEL-2"])
+        pair = clusters[0]['pairs'][0]
+        self.assertEqual(pair['item_overlap'], 0.5)
+        self.assertGreater(pair['score'], 0.5)
+
+    def test_clusters_at_scale(self):
+        rng = random.Random(4)
+        ideas = [generate_idea(rng, index, 50, 3, 4) for index in range(400)]
+        for index in (10, 200, 399):
+            copy = dict(ideas[index], idea_id=f"{ideas[index]['idea_id']}-COPY")
+            copy['title'] += " revisited"
+            ideas.append(copy)
+        # A third member chains onto the first planted pair
+        ideas.append(dict(ideas[10], idea_id="I-THIRD"))
+        clusters = DuplicateDetector(threshold=0.8, use_numpy=False).find(ideas)
+        self.assertEqual([cluster['idea_ids'] for cluster in clusters if len(cluster['idea_ids']) > 2],
+                         [["I-SYN-000010", "I-SYN-000010-COPY", "I-THIRD"]])
+        found = {tuple(cluster['idea_ids']) for cluster in clusters}
+        self.assertIn(("I-SYN-000200", "I-SYN-000200-COPY"), found)
+        self.assertIn(("I-SYN-000399", "I-SYN-000399-COPY"), found)
+
+    def test_merge_unions_items_and_tags(self):
+        merged = merge_ideas(IDEAS[0], [IDEAS[2]])
+        self.assertEqual(merged['tags'], ["hydrogen", "drones", "energy"])
+        self.assertEqual([item['item_id'] for item in merged['related_items']], ["n1", "n3", "n2"])
+        self.assertEqual(merged['description'], IDEAS[0]['description'])
+        self.assertEqual(len(IDEAS[0]['related_items']), 2)
+
+
+class TestCoreMerge(unittest.TestCase):
+    """Tests for merging through the core"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        os.makedirs(os.path.join(self.tmp.name, "REPOSITORY"))
+        with open(os.path.join(self.tmp.name, "REPOSITORY", "repo.json"), 'w', encoding='utf-8') as f:
+            json.dump(IDEAS, f)
+        self.core = RepoCore(self.tmp.name)
+        self.core.load_repo_data()
+
+    def tearDown(self):
+        self.core.close()
+        self.tmp.cleanup()
+
+    def test_merge_duplicate_ideas(self):
+        self.core.get_link_index()
+        merged = self.core.merge_duplicate_ideas("I-FUEL", ["I-FUEL-2"])
+        self.assertEqual(merged['tags'], ["hydrogen", "drones", "energy"])
+        self.assertIsNone(self.core.find_idea("I-FUEL-2"))
+        self.assertEqual(self.core.ideas_linked_to("2025-W03", "notes_and_observations", "n2"), ["I-FUEL"])
+        self.assertEqual(self.core.find_duplicate_ideas(), [])
+        with self.assertRaises(KeyError):
+            self.core.merge_duplicate_ideas("I-FUEL", ["I-MISSING"])
+
+        self.core.flush_repo_data()
+        with open(os.path.join(self.tmp.name, "REPOSITORY", "repo.json"), 'r', encoding='utf-8') as f:
+            self.assertEqual([entry['idea_id'] for entry in json.load(f)], ["I-FUEL", "I-MBSE", "I-GARDEN"])
+
+    def test_cli(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            code = echoforge_cli.main(["--data-dir", self.tmp.name, "duplicates", "--json"])
+        self.assertEqual(code, 0)
+        self.assertEqual(json.loads(output.getvalue())[0]['idea_ids'], ["I-FUEL", "I-FUEL-2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
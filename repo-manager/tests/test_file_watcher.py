@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the polling file watcher
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from file_watcher import PollingWatcher
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestPollingWatcher(unittest.TestCase):
+    """Tests for snapshot diffs and burst batching"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.logs_path = os.path.join(self.tmp.name, "json-logs")
+        os.makedirs(self.logs_path)
+        self.repo_file_path = os.path.join(self.tmp.name, "repo.json")
+        self.write("json-logs/2025-W01.json", "{}")
+        self.write("repo.json", "[]")
+        self.clock = FakeClock()
+        self.watcher = PollingWatcher(settle_seconds=0.5, clock=self.clock)
+        self.watcher.watch_directory("json-logs", self.logs_path, (".json",))
+        self.watcher.watch_file("repo", self.repo_file_path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name: str, content: str, mtime_ns: int = None):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_no_changes(self):
+        self.clock.now = 10
+        self.assertEqual(self.watcher.poll(), {})
+
+    def test_burst_is_reported_once_settled(self):
+        """Changes are held back until quiet, then reported together"""
+        self.write("json-logs/2025-W02.json", "{}")
+        self.assertEqual(self.watcher.poll(), {})
+
+        self.clock.now = 0.3
+        self.write("json-logs/2025-W01.json", '{"week": 1}', mtime_ns=1_000_000_000)
+        self.write("json-logs/notes.txt", "ignored")
+        self.assertEqual(self.watcher.poll(), {})
+
+        self.clock.now = 1.0
+        changes = self.watcher.poll()
+        self.assertEqual(list(changes), ["json-logs"])
+        self.assertEqual([os.path.basename(path) for path in changes["json-logs"].added], ["2025-W02.json"])
+        self.assertEqual([os.path.basename(path) for path in changes["json-logs"].modified], ["2025-W01.json"])
+
+        self.clock.now = 5.0
+        self.assertEqual(self.watcher.poll(), {})
+
+    def test_removed_and_single_file(self):
+        os.remove(os.path.join(self.logs_path, "2025-W01.json"))
+        self.write("repo.json", '[{"idea_id": "I-A"}]')
+        self.watcher.poll()
+        self.clock.now = 1.0
+        changes = self.watcher.poll()
+        self.assertEqual(len(changes["json-logs"].removed), 1)
+        self.assertEqual(changes["repo"].changed(), [self.repo_file_path])
+
+
+if __name__ == '__main__':
+    unittest.main()
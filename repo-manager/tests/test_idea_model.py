@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the slotted Idea and RelatedItem records
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from idea_model import Idea, RelatedItem, to_ideas, to_related_items
+from json_codec import dumps, loads
+from repo_core import RepoCore
+from schema_validation import load_schema
+from synthetic_data import generate_dataset
+
+
+IDEA = {
+    "idea_id": "IDEA-001",
+    "title": "Fuel cell drones",
+    "description": "Long range delivery",
+    "related_items": [{"week": "2024-W01", "item_id": "N-1", "section": "news"},
+                      {"section": "tools", "week": "2024-W02", "item_id": "T-3", "note": "kept"}],
+    "maturity_score": 4,
+    "personal_interest_score": 8,
+    "trend_score": 6,
+    "tags": ["energy", "drones"],
+}
+
+
+class TestIdeaModel(unittest.TestCase):
+    """Tests for lossless conversion, dict compatibility and interning"""
+
+    def test_round_trip_is_lossless(self):
+        data = dict(IDEA, extra_field={"a": 1})
+        idea = Idea(data)
+        self.assertEqual(idea.to_dict(), data)
+        self.assertEqual(list(idea.to_dict()), list(data))
+        self.assertEqual(list(idea['related_items'][1].to_dict()), ["section", "week", "item_id", "note"])
+        self.assertEqual(dumps(idea), dumps(data))
+        self.assertEqual(loads(dumps([idea], indent=2)), [data])
+
+    def test_missing_and_malformed_fields(self):
+        data = {"idea_id": "IDEA-002", "related_items": [{"week": "2024-W01"}, "not an item", 3], "tags": None}
+        idea = Idea(data)
+        self.assertEqual(idea.to_dict(), data)
+        self.assertNotIn('title', idea)
+        self.assertIsNone(idea.get('title'))
+        with self.assertRaises(KeyError):
+            idea['title']
+        self.assertEqual(to_related_items("oops"), "oops")
+        self.assertEqual(Idea({"related_items": {"week": "x"}})['related_items'], {"week": "x"})
+
+    def test_behaves_like_a_dict(self):
+        idea = Idea(IDEA)
+        self.assertEqual(idea, IDEA)
+        self.assertEqual(IDEA, idea)
+        self.assertEqual(dict(idea)['title'], IDEA['title'])
+        self.assertEqual(len(idea), len(IDEA))
+        self.assertIsInstance(idea['related_items'][0], RelatedItem)
+        self.assertEqual(idea['related_items'][0], IDEA['related_items'][0])
+
+        idea['title'] = "Renamed"
+        idea['owner'] = "me"
+        del idea['trend_score']
+        self.assertEqual(list(idea)[-1], 'owner')
+        self.assertNotIn('trend_score', idea)
+        copy = idea.copy()
+        self.assertIs(type(copy), dict)
+        self.assertEqual(copy['title'], "Renamed")
+        self.assertNotEqual(idea, IDEA)
+        idea['related_items'] = [{"week": "2024-W03", "item_id": "X", "section": "news"}]
+        self.assertIsInstance(idea['related_items'][0], RelatedItem)
+
+    def test_strings_are_interned(self):
+        first = Idea(loads(dumps(IDEA)))
+        second = Idea(loads(dumps(IDEA)))
+        self.assertIs(first['related_items'][0]['week'], second['related_items'][0]['week'])
+        self.assertIs(first['related_items'][0]['section'], second['related_items'][0]['section'])
+        self.assertIs(first['tags'][0], second['tags'][0])
+        self.assertIs(first._keys, second._keys)
+
+    def test_to_ideas_keeps_other_entries(self):
+        repo_data = [dict(IDEA), "junk"]
+        self.assertIs(to_ideas(repo_data), repo_data)
+        self.assertIsInstance(repo_data[0], Idea)
+        self.assertEqual(repo_data[1], "junk")
+        self.assertIs(Idea.from_dict(repo_data[0]), repo_data[0])
+
+    def test_schema_validation_accepts_records(self):
+        schema = load_schema('repo')
+        self.assertEqual(schema.validate_item(Idea(IDEA)), schema.validate_item(IDEA))
+        self.assertTrue(schema.validate_item(Idea({"idea_id": "IDEA-003"})))
+
+    def test_core_round_trip(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            generate_dataset(temp_dir, weeks=3, ideas=20, related_per_idea=3, seed=5)
+            repo_file = os.path.join(temp_dir, "REPOSITORY", "repo.json")
+            with open(repo_file, 'rb') as f:
+                original = loads(f.read())
+
+            core = RepoCore(temp_dir)
+            core.load_repo_data()
+            self.assertTrue(all(isinstance(idea, Idea) for idea in core.repo_data))
+            self.assertEqual(core.repo_data, original)
+            idea = dict(core.repo_data[0], title="Changed")
+            core.put_idea(idea, idea['idea_id'])
+            self.assertIsInstance(core.repo_data[0], Idea)
+            core.flush_repo_data()
+            core.close()
+
+            with open(repo_file, 'rb') as f:
+                saved = loads(f.read())
+            self.assertEqual(saved[0]['title'], "Changed")
+            self.assertEqual(saved[1:], original[1:])
+
+
+if __name__ == "__main__":
+    unittest.main()
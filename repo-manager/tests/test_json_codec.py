@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the JSON codec and the compact storage format
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import json_codec
+from atomic_io import atomic_write_json
+from json_codec import dumps, loads, load_file, reformat_file, set_storage_format, storage_format
+from repo_core import RepoCore
+from synthetic_data import generate_dataset
+
+
+class TestJsonCodec(unittest.TestCase):
+    """Tests for parsing, serialisation and storage formats"""
+
+    def setUp(self):
+        self.previous_format = storage_format()
+
+    def tearDown(self):
+        set_storage_format(self.previous_format)
+
+    def test_round_trip(self):
+        data = {"title": "Café ☕", "tags": ["a", "b"], "score": 7, "nested": {"empty": []}}
+        self.assertEqual(loads(dumps(data)), data)
+        self.assertEqual(loads(dumps(data).encode('utf-8')), data)
+        self.assertEqual(dumps(data), '{"title":"Café ☕","tags":["a","b"],"score":7,"nested":{"empty":[]}}')
+        self.assertEqual(loads(dumps(data, indent=2)), data)
+        self.assertIn('\n  "tags"', dumps(data, indent=2))
+        with self.assertRaises(json.JSONDecodeError):
+            loads('{"broken": ')
+
+    def test_storage_format(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "data.json")
+            data = [{"idea_id": "I-1", "tags": ["x"]}]
+
+            set_storage_format("compact")
+            atomic_write_json(path, data)
+            with open(path, 'r', encoding='utf-8') as f:
+                compact = f.read()
+            self.assertNotIn("\n", compact)
+
+            set_storage_format("pretty")
+            atomic_write_json(path, data)
+            with open(path, 'r', encoding='utf-8') as f:
+                pretty = f.read()
+            self.assertIn("\n", pretty)
+            self.assertLess(len(compact), len(pretty))
+            self.assertEqual(load_file(path), data)
+
+            # An explicit indent wins over the configured format
+            atomic_write_json(path, data, indent=None)
+            self.assertFalse(reformat_file(path, None))
+            self.assertTrue(reformat_file(path, 2))
+            self.assertEqual(load_file(path), data)
+
+        with self.assertRaises(ValueError):
+            set_storage_format("tiny")
+
+    def test_export_pretty_from_compact_storage(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            generate_dataset(temp_dir, 2, 4, 2, seed=5)
+            set_storage_format("compact")
+            core = RepoCore(temp_dir)
+            core.load_repo_data()
+            core.put_idea(dict(core.repo_data[0], title="Edited"), core.repo_data[0]['idea_id'])
+            core.flush_repo_data()
+            with open(core.repo_file_path, 'r', encoding='utf-8') as f:
+                self.assertEqual(f.read().count("\n"), 0)
+
+            export_path = os.path.join(temp_dir, "export.json")
+            self.assertEqual(core.export_pretty(export_path), 4)
+            with open(export_path, 'r', encoding='utf-8') as f:
+                exported = f.read()
+            self.assertTrue(exported.startswith('[\n  {'))
+            self.assertEqual(json.loads(exported), core.repo_data)
+            core.close()
+
+    def test_backend_is_known(self):
+        self.assertIn(json_codec.BACKEND, ("orjson", "json"))
+
+
+if __name__ == '__main__':
+    unittest.main()
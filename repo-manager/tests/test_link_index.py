@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the weekly item -> ideas link index and the orphan report
+"""
+
+import unittest
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from link_index import LinkIndex
+from repo_core import RepoCore
+from synthetic_data import generate_dataset
+import echoforge_cli
+
+
+def make_data_dir(root: str):
+    os.makedirs(os.path.join(root, "REPOSITORY"))
+    os.makedirs(os.path.join(root, "json-logs"))
+    with open(os.path.join(root, "REPOSITORY", "repo.json"), 'w', encoding='utf-8') as f:
+        json.dump([
+            {"idea_id": "I-A", "title": "Fuel cells", "related_items": [
+                {"week": "2025-W01", "section": "tools", "item_id": "t1"},
+                {"week": "2025-W01", "section": "news", "item_id": "n9"}]},
+            {"idea_id": "I-B", "title": "Verbs", "related_items": [
+                {"week": "2025-W01", "section": "tools", "item_id": "t1"}]},
+        ], f)
+    with open(os.path.join(root, "json-logs", "2025-W01.json"), 'w', encoding='utf-8') as f:
+        json.dump({"items": {"tools": [{"id": "t1", "text": "Stack simulator"}, {"id": "t2", "text": "CAD"}],
+                             "news": [{"id": "n1", "text": "Launch"}]}}, f)
+    with open(os.path.join(root, "json-logs", "2025-W02.json"), 'w', encoding='utf-8') as f:
+        json.dump({"items": {"news": [{"id": "n1", "text": "Recall"}]}}, f)
+
+
+class TestLinkIndex(unittest.TestCase):
+    """Tests for the reverse index on its own"""
+
+    def test_add_replace_remove(self):
+        index = LinkIndex()
+        index.add("I-A", [{"week": "W1", "section": "news", "item_id": "n1"},
+                          {"week": "W1", "section": "news", "item_id": "n1"},
+                          {"week": "W2", "section": "tools", "item_id": "t1"},
+                          "junk", {"week": "W3"}])
+        index.add("I-B", [{"week": "W1", "section": "news", "item_id": "n1"}])
+        self.assertEqual(index.ideas_for("W1", "news", "n1"), ["I-A", "I-B"])
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.linked_weeks(), ["W1", "W2"])
+
+        index.add("I-A", [{"week": "W1", "section": "news", "item_id": "n2"}])
+        self.assertEqual(index.ideas_for("W2", "tools", "t1"), [])
+        self.assertEqual(index.week_links("W1"), {("news", "n1"): ["I-B"], ("news", "n2"): ["I-A"]})
+
+        index.remove("I-B")
+        index.remove("I-MISSING")
+        self.assertFalse(index.is_linked("W1", "news", "n1"))
+        self.assertEqual(index.unlinked("W1", [("news", "n1"), ("news", "n2")]), [("news", "n1")])
+        self.assertEqual(index.linked_weeks(), ["W1"])
+
+
+class TestCoreLinks(unittest.TestCase):
+    """Tests for the link index kept alongside repo_data"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        make_data_dir(self.tmp.name)
+        self.core = RepoCore(self.tmp.name)
+        self.core.load_repo_data()
+        self.core.load_source_data()
+
+    def tearDown(self):
+        self.core.close()
+        self.tmp.cleanup()
+
+    def test_week_links_and_orphans(self):
+        self.assertEqual(self.core.ideas_linked_to("2025-W01", "tools", "t1"), ["I-A", "I-B"])
+        rows = self.core.get_week_links("2025-W01")
+        self.assertEqual([(row['section'], row['item_id'], row['idea_ids'], row['found']) for row in rows], [
+            ("tools", "t1", ["I-A", "I-B"], True), ("tools", "t2", [], True), ("news", "n1", [], True),
+            ("news", "n9", ["I-A"], False)])
+        orphans = self.core.find_orphan_items()
+        self.assertEqual(orphans, {"2025-W01": {"tools": ["t2"], "news": ["n1"]}, "2025-W02": {"news": ["n1"]}})
+        self.assertIn("- tools: t2", self.core.format_orphan_report(orphans))
+        self.assertEqual(self.core.find_orphan_items(["2025-W02", "2099-W01"]), {"2025-W02": {"news": ["n1"]}})
+
+    def test_incremental_updates(self):
+        self.core.get_link_index()
+        idea = dict(self.core.find_idea("I-B"))
+        idea['idea_id'] = "I-C"
+        idea['related_items'] = [{"week": "2025-W02", "section": "news", "item_id": "n1"}]
+        self.core.put_idea(idea, "I-B")
+        self.assertEqual(self.core.ideas_linked_to("2025-W01", "tools", "t1"), ["I-A"])
+        self.assertEqual(self.core.ideas_linked_to("2025-W02", "news", "n1"), ["I-C"])
+
+        self.core.remove_idea("I-A")
+        self.assertEqual(self.core.ideas_linked_to("2025-W01", "tools", "t1"), [])
+        self.assertEqual(self.core.find_orphan_items(["2025-W02"]), {})
+
+        # A rebuilt index agrees with the incrementally maintained one
+        weeks = self.core.link_index.weeks
+        self.core.link_index = None
+        self.assertEqual(self.core.get_link_index().weeks, weeks)
+
+    def test_sharded_storage_reads_related_items(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            generate_dataset(temp_dir, weeks=2, ideas=6, related_per_idea=2, seed=3)
+            single = RepoCore(temp_dir)
+            single.load_repo_data()
+            expected = single.get_link_index().weeks
+            single.close()
+
+            from repo_storage import ShardedStorage
+            ShardedStorage(os.path.join(temp_dir, "REPOSITORY", "ideas")).import_repo_json(
+                os.path.join(temp_dir, "REPOSITORY", "repo.json"))
+            sharded = RepoCore(temp_dir, storage_mode="sharded")
+            sharded.load_repo_data()
+            self.assertEqual(sharded.get_link_index().weeks, expected)
+            self.assertTrue(all(sharded.storage.is_partial(idea) for idea in sharded.repo_data))
+            sharded.close()
+
+    def test_cli(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            code = echoforge_cli.main(["--data-dir", self.tmp.name, "orphans", "--json"])
+        self.assertEqual(code, 0)
+        self.assertEqual(json.loads(output.getvalue())["2025-W01"]["tools"], ["t2"])
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            code = echoforge_cli.main(["--data-dir", self.tmp.name, "links", "2025-W01"])
+        self.assertEqual(code, 0)
+        self.assertIn("news\tn9 (missing)\tI-A", output.getvalue())
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(echoforge_cli.main(["--data-dir", self.tmp.name, "links", "1999-W01"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the markdown log offset index
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from md_index import MarkdownIndex, MarkdownIndexStore, index_markdown, section_key
+from repo_core import RepoCore
+from source_store import SourceStore
+
+
+MARKDOWN = """# Weekly Log 2025-W29
+
+_2025-07-14 to 2025-07-20_
+
+## Experiments & Research
+
+- Tried a hydrogen stack simulator
+  with a second line
+- Compared two solvers
+
+## Coding & Projects
+
+```bash
+# not a heading
+- not a bullet
+```
+
+1. Wrote the repo manager
+### Details
+- Nested detail
+"""
+
+
+def write_log(path: str, text: str, stamp: float):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.utime(path, (stamp, stamp))
+
+
+class TestMarkdownIndex(unittest.TestCase):
+    """Tests for heading and bullet offsets"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "2025-W29.md")
+        write_log(self.path, MARKDOWN, 1000.0)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_section_key(self):
+        self.assertEqual(section_key("Experiments & Research"), "experiments_and_research")
+        self.assertEqual(section_key("Notes And Observations"), "notes_and_observations")
+
+    def test_offsets_and_reads(self):
+        index = MarkdownIndex.build(self.path)
+        self.assertEqual(index.headings(), [(1, "Weekly Log 2025-W29"), (2, "Experiments & Research"),
+                                            (2, "Coding & Projects"), (3, "Details")])
+        self.assertEqual(index.item_text("experiments_and_research", "e1"),
+                         "- Tried a hydrogen stack simulator\n  with a second line")
+        self.assertEqual(index.item_text("experiments_and_research", "e2"), "- Compared two solvers")
+        # Fenced lines are neither headings nor bullets, and a sub-heading ends the bullet above it
+        self.assertEqual(index.item_text("coding_and_projects", "c1"), "1. Wrote the repo manager")
+        # An item without a matching bullet falls back to the whole section, sub-headings included
+        section = index.item_text("coding_and_projects", "c9")
+        self.assertTrue(section.startswith("## Coding & Projects"))
+        self.assertTrue(section.endswith("- Nested detail"))
+        self.assertIsNone(index.item_text("content_ideas", "ci1"))
+
+        data = MARKDOWN.encode('utf-8')
+        for section in index_markdown(data):
+            self.assertTrue(data[section[2]:].startswith(b"#"))
+
+    def test_offsets_are_bytes(self):
+        write_log(self.path, "## Notes\n\n- Café crème ☕\n- Second\n", 1000.0)
+        self.assertEqual(MarkdownIndex.build(self.path).item_text("notes", "n2"), "- Second")
+
+
+class TestStoreMarkdown(unittest.TestCase):
+    """Tests for the on-disk offset cache and the source report"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp.name, "cache")
+        self.previous_cache_dir = os.environ.get("ECHOFORGE_CACHE_DIR")
+        os.environ["ECHOFORGE_CACHE_DIR"] = self.cache_dir
+        for name in ("REPOSITORY", "json-logs", "md-logs"):
+            os.makedirs(os.path.join(self.tmp.name, name))
+        self.md_path = os.path.join(self.tmp.name, "md-logs", "2025-W29.md")
+        write_log(self.md_path, MARKDOWN, 1000.0)
+        with open(os.path.join(self.tmp.name, "json-logs", "2025-W29.json"), 'w', encoding='utf-8') as f:
+            json.dump({"items": {"experiments_and_research": [{"id": "e1", "text": "Simulator"},
+                                                              {"id": "e2", "text": "Solvers"}]}}, f)
+
+    def tearDown(self):
+        if self.previous_cache_dir is None:
+            del os.environ["ECHOFORGE_CACHE_DIR"]
+        else:
+            os.environ["ECHOFORGE_CACHE_DIR"] = self.previous_cache_dir
+        self.tmp.cleanup()
+
+    def make_store(self) -> SourceStore:
+        store = SourceStore(os.path.join(self.tmp.name, "json-logs"), os.path.join(self.tmp.name, "md-logs"))
+        store.scan()
+        return store
+
+    def test_offsets_persist_until_the_log_changes(self):
+        store = self.make_store()
+        self.assertEqual(store.markdown_section("2025-W29", "experiments_and_research", "e2"),
+                         "- Compared two solvers")
+        self.assertEqual(store.md_indexes.built, 1)
+        # The offsets live in the tool's cache directory, never next to the user's logs
+        self.assertTrue(store.md_indexes.cache_path.startswith(self.cache_dir))
+        self.assertTrue(os.path.exists(store.md_indexes.cache_path))
+        self.assertEqual(os.listdir(os.path.join(self.tmp.name, "md-logs")), ["2025-W29.md"])
+
+        # A new session reuses the offsets from disk
+        store = self.make_store()
+        self.assertEqual(store.markdown_section("2025-W29", "experiments_and_research", "e1")[:21],
+                         "- Tried a hydrogen st")
+        self.assertEqual(store.md_indexes.built, 0)
+
+        write_log(self.md_path, "## Experiments and research\n\n- Rewritten\n", time.time() + 10)
+        store.scan()
+        self.assertEqual(store.markdown_section("2025-W29", "experiments_and_research", "e1"), "- Rewritten")
+        self.assertEqual(store.md_indexes.built, 1)
+
+        os.remove(self.md_path)
+        store.scan()
+        self.assertIsNone(store.markdown_section("2025-W29", "experiments_and_research", "e1"))
+        store.md_indexes.save()
+        with open(store.md_indexes.cache_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['weeks'], {})
+
+    def test_unwritable_cache_keeps_offsets_in_memory(self):
+        blocker = os.path.join(self.tmp.name, "not-a-directory")
+        with open(blocker, 'w', encoding='utf-8') as f:
+            f.write("")
+        indexes = MarkdownIndexStore(os.path.join(blocker, "md-index.json"))
+        index = indexes.get("2025-W29", self.md_path, os.path.getsize(self.md_path), os.path.getmtime(self.md_path))
+        self.assertFalse(indexes.save())
+        self.assertIsNone(indexes.cache_path)
+        self.assertEqual(index.item_text("experiments_and_research", "e2"), "- Compared two solvers")
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["REPOSITORY", "json-logs", "md-logs", "not-a-directory"])
+
+    def test_source_report_shows_the_item_bullet(self):
+        core = RepoCore(self.tmp.name)
+        core.load_source_data()
+        idea = {"idea_id": "I-M", "title": "Markdown", "related_items": [
+            {"week": "2025-W29", "section": "experiments_and_research", "item_id": "e2"},
+            {"week": "2025-W29", "section": "content_ideas", "item_id": "ci1"}]}
+        report = core.get_source_information(idea)
+        core.close()
+        self.assertIn("```markdown\n- Compared two solvers\n```", report)
+        self.assertNotIn("Tried a hydrogen stack simulator", report)
+        self.assertIn("No heading for section content_ideas", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the GUI-free repository core and the echoforge CLI
+"""
+
+import unittest
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+# Add src directory to Python path
+SRC_PATH = os.path.join(os.path.dirname(__file__), '..', 'src')
+sys.path.insert(0, SRC_PATH)
+
+from repo_core import RepoCore
+import echoforge_cli
+
+
+def make_data_dir(root: str):
+    os.makedirs(os.path.join(root, "REPOSITORY"))
+    os.makedirs(os.path.join(root, "json-logs"))
+    os.makedirs(os.path.join(root, "evaluations"))
+    with open(os.path.join(root, "REPOSITORY", "repo.json"), 'w', encoding='utf-8') as f:
+        json.dump([
+            {"idea_id": "I-A", "title": "Fuel cell architecture", "description": "Stack design",
+             "tags": ["energy"], "related_items": [{"week": "2025-W01", "section": "tools", "item_id": "t1"}]},
+            {"idea_id": "I-B", "title": "Functional verbs", "description": "MBSE modelling",
+             "tags": ["mbse"], "related_items": []},
+        ], f)
+    with open(os.path.join(root, "json-logs", "2025-W01.json"), 'w', encoding='utf-8') as f:
+        json.dump({"items": {"tools": [{"id": "t1", "text": "Hydrogen stack simulator"}]}}, f)
+
+
+class TestRepoCore(unittest.TestCase):
+    """Tests for loading, querying and saving without Tk"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        make_data_dir(self.tmp.name)
+        self.core = RepoCore(self.tmp.name)
+
+    def tearDown(self):
+        self.core.close()
+        self.tmp.cleanup()
+
+    def test_load_search_and_sources(self):
+        self.core.load_repo_data()
+        self.core.load_source_data()
+        self.core.rebuild_search_index()
+
+        self.assertEqual([idea["idea_id"] for idea, _ in self.core.search_ideas("mbse")], ["I-B"])
+        idea = self.core.find_idea("I-A")
+        self.assertIn("Hydrogen stack simulator", self.core.get_source_information(idea))
+        self.assertEqual(self.core.find_unresolved_related_items(idea["related_items"]), [])
+        self.assertIsNone(self.core.find_idea("I-MISSING"))
+
+    def test_source_sections_stream_week_by_week(self):
+        with open(os.path.join(self.tmp.name, "json-logs", "2025-W02.json"), 'w', encoding='utf-8') as f:
+            json.dump({"items": {"news": [{"id": "n1", "text": "Second week"}]}}, f)
+        self.core.load_source_data()
+        idea = {"idea_id": "I-S", "title": "Streamed", "related_items": [
+            {"week": "2025-W01", "section": "tools", "item_id": "t1"},
+            {"week": "2025-W02", "section": "news", "item_id": "n1"}]}
+
+        sections = self.core.source_sections(idea)
+        self.assertIn("Idea ID: I-S", next(sections))
+        self.assertFalse(self.core.source_data.is_loaded("2025-W01"))
+        self.assertIn("Hydrogen stack simulator", next(sections))
+        # Later weeks are only read when their section is requested
+        self.assertFalse(self.core.source_data.is_loaded("2025-W02"))
+        self.assertIn("Second week", next(sections))
+        self.assertEqual(list(sections), [])
+
+        self.assertEqual("\n".join(self.core.source_sections(idea)), self.core.get_source_information(idea))
+        self.assertEqual(list(self.core.source_sections(None)), ["No idea selected"])
+
+    def test_sort_keys_for_every_list_column(self):
+        try:
+            from repo_manager import RepoManager
+        except ImportError:
+            self.skipTest("tkinter is not installed")
+        self.core.load_repo_data()
+        self.core.put_idea({"idea_id": "I-C", "title": "apples", "maturity_score": 9, "tags": ["zeta"]})
+        expected = {'idea_id': ["I-A", "I-B", "I-C"], 'title': ["I-C", "I-A", "I-B"],
+                    'maturity': ["I-A", "I-B", "I-C"], 'interest': ["I-A", "I-B", "I-C"],
+                    'trend': ["I-A", "I-B", "I-C"], 'tags': ["I-A", "I-B", "I-C"]}
+        for column, _, _ in RepoManager.IDEA_COLUMNS:
+            keys = self.core.get_sort_keys(column)
+            order = sorted(range(len(self.core.repo_data)), key=keys.__getitem__)
+            self.assertEqual([self.core.repo_data[i]["idea_id"] for i in order], expected[column], column)
+        self.assertEqual(set(self.core.sort_keys), set(RepoCore.SORT_KEYS))
+        self.core.load_repo_data()
+        self.assertEqual(self.core.sort_keys, {})
+
+    def test_put_remove_and_assessments(self):
+        self.core.load_repo_data()
+        self.core.rebuild_search_index()
+        position, added = self.core.put_idea({"idea_id": "I-C", "title": "Solar kites", "tags": []})
+        self.assertEqual((position, added), (2, True))
+        self.core.put_idea({"idea_id": "I-C2", "title": "Solar kites v2", "tags": []}, "I-C")
+        self.core.remove_idea("I-B")
+        self.assertTrue(self.core.flush_repo_data())
+
+        reloaded = RepoCore(self.tmp.name)
+        self.assertEqual([idea["idea_id"] for idea in reloaded.load_repo_data()], ["I-A", "I-C2"])
+        self.assertEqual([idea["idea_id"] for idea, _ in self.core.search_ideas("solar")], ["I-C2"])
+
+        assessment = {"idea_id": "I-A", "trend_score": 7, "justification": "j", "suggested_tags": []}
+        self.assertTrue(self.core.save_assessment("I-A", "trend", assessment))
+        self.assertFalse(self.core.save_assessment("I-A", "trend", assessment))
+        reloaded.load_assessment_index()
+        self.assertEqual(reloaded.load_assessment("I-A", "trend"), assessment)
+        reloaded.close()
+
+    def test_duplicate_ids_are_rejected_in_every_backend(self):
+        from repo_storage import ShardedStorage
+        from sqlite_storage import SqliteStorage
+        ShardedStorage(self.core.ideas_path).import_repo_json(self.core.repo_file_path)
+        storage = SqliteStorage(self.core.db_path, mode="rwc")
+        storage.import_directory(self.tmp.name)
+        storage.close()
+
+        for mode in ("single", "sharded", "sqlite"):
+            core = RepoCore(self.tmp.name, storage_mode=mode)
+            core.load_repo_data()
+            with self.assertRaises(ValueError, msg=mode):
+                core.put_idea({"idea_id": "I-B", "title": "Renamed onto I-B"}, "I-A")
+            with self.assertRaises(ValueError, msg=mode):
+                core.put_idea({"idea_id": "I-B", "title": "Second I-B"})
+            self.assertEqual([idea["idea_id"] for idea in core.repo_data], ["I-A", "I-B"], mode)
+            core.flush_repo_data()
+            core.close()
+            reloaded = RepoCore(self.tmp.name, storage_mode=mode)
+            self.assertEqual([idea["idea_id"] for idea in reloaded.load_repo_data()], ["I-A", "I-B"], mode)
+            reloaded.close()
+
+    def test_rejected_write_leaves_ideas_unchanged(self):
+        self.core.load_repo_data()
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+        self.core.storage.save_idea = fail
+        with self.assertRaises(OSError):
+            self.core.put_idea({"idea_id": "I-A2", "title": "Renamed"}, "I-A")
+        with self.assertRaises(OSError):
+            self.core.put_idea({"idea_id": "I-C", "title": "New"})
+        self.assertEqual([idea["idea_id"] for idea in self.core.repo_data], ["I-A", "I-B"])
+        self.assertEqual(self.core.find_idea("I-A")["title"], "Fuel cell architecture")
+        self.assertIsNone(self.core.find_idea("I-A2"))
+
+        # A front end that reports the error itself gets (None, False) back
+        self.core.record_change = lambda *args, **kwargs: False
+        self.assertEqual(self.core.put_idea({"idea_id": "I-C", "title": "New"}), (None, False))
+        self.assertEqual([idea["idea_id"] for idea in self.core.repo_data], ["I-A", "I-B"])
+
+
+class TestEchoforgeCli(unittest.TestCase):
+    """Tests for the command-line interface"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        make_data_dir(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_cli(self, *argv) -> tuple:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            code = echoforge_cli.main(["--data-dir", self.tmp.name, *argv])
+        return code, output.getvalue()
+
+    def test_commands(self):
+        code, output = self.run_cli("ideas", "list", "--tag", "energy")
+        self.assertEqual((code, output.split("\t")[0]), (0, "I-A"))
+
+        code, output = self.run_cli("ideas", "show", "I-B")
+        self.assertEqual(json.loads(output)["title"], "Functional verbs")
+
+        code, output = self.run_cli("ideas", "search", "hydrogen", "--with-sources", "--json")
+        self.assertEqual([idea["idea_id"] for idea in json.loads(output)], ["I-A"])
+
+        code, output = self.run_cli("sources", "I-A")
+        self.assertEqual(code, 0)
+        self.assertIn("## Week: 2025-W01", output)
+
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(self.run_cli("ideas", "show", "I-MISSING")[0], 1)
+
+    def test_never_imports_tkinter(self):
+        code = ("import sys; sys.path.insert(0, %r); import echoforge_cli; "
+                "echoforge_cli.main(['--data-dir', %r, 'ideas', 'list']); "
+                "sys.exit('tkinter' in sys.modules)") % (SRC_PATH, self.tmp.name)
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True)
+        self.assertEqual(result.returncode, 0)
+
+    def test_read_commands_skip_schema_validation(self):
+        code = ("import sys; sys.path.insert(0, %r); import echoforge_cli; "
+                "echoforge_cli.main(['--data-dir', %r, 'ideas', 'show', 'I-A']); "
+                "sys.exit('schema_validation' in sys.modules)") % (SRC_PATH, self.tmp.name)
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True)
+        self.assertEqual(result.returncode, 0)
+        # The explicit command still checks the data
+        with open(os.path.join(self.tmp.name, "REPOSITORY", "repo.json"), 'w', encoding='utf-8') as f:
+            json.dump([{"idea_id": "I-BAD"}], f)
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(self.run_cli("validate", "--workers", "1")[0], 1)
+
+    def test_validate_checks_the_live_ideas(self):
+        valid = {"idea_id": "I-V", "title": "Valid", "description": "d", "related_items": [],
+                 "maturity_score": 1, "personal_interest_score": 1, "tags": []}
+        with open(os.path.join(self.tmp.name, "REPOSITORY", "repo.json"), 'w', encoding='utf-8') as f:
+            json.dump([valid], f)
+        # The fixture log predates the weekly schema
+        os.remove(os.path.join(self.tmp.name, "json-logs", "2025-W01.json"))
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(self.run_cli("validate", "--workers", "1")[0], 0)
+
+        # An edit still in the journal is what the application shows, so it is checked too
+        core = RepoCore(self.tmp.name)
+        core.load_repo_data()
+        core.put_idea(dict(valid, title=""), "I-V")
+        core.close()
+        with contextlib.redirect_stderr(io.StringIO()):
+            code, output = self.run_cli("validate", "--workers", "1")
+        self.assertEqual(code, 1)
+        self.assertIn("idea I-V: title", output)
+
+        # Sharded placeholders only hold the index fields; the shard itself is checked
+        from repo_storage import ShardedStorage
+        storage = ShardedStorage(os.path.join(self.tmp.name, "REPOSITORY", "ideas"))
+        storage.import_repo_json(os.path.join(self.tmp.name, "REPOSITORY", "repo.json"))
+        with contextlib.redirect_stderr(io.StringIO()):
+            code, output = self.run_cli("--storage", "sharded", "validate", "--workers", "1")
+        self.assertEqual(code, 1)
+        self.assertIn("idea I-V: title", output)
+
+    def test_read_commands_defer_feature_imports(self):
+        # Duplicates, the report cache and the markdown index load with the commands that use them
+        for command in (['ideas', 'list'], ['links', '2025-W01']):
+            code = ("import sys; sys.path.insert(0, %r); import echoforge_cli; "
+                    "echoforge_cli.main(['--data-dir', %r] + %r); "
+                    "deferred = {'duplicates', 'report_cache', 'md_index', 'hashlib'}; "
+                    "sys.exit(', '.join(sorted(deferred & set(sys.modules))) or None)"
+                    ) % (SRC_PATH, self.tmp.name, command)
+            result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+            self.assertEqual((result.returncode, result.stderr), (0, ""), command)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the repo.json change journal
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from repo_journal import RepoJournal
+
+
+def make_idea(idea_id: str, title: str = "Idea") -> dict:
+    return {
+        "idea_id": idea_id,
+        "title": title,
+        "description": "Test description",
+        "maturity_score": 5,
+        "personal_interest_score": 7,
+        "trend_score": 6,
+        "tags": ["test"],
+        "related_items": []
+    }
+
+
+class TestRepoJournal(unittest.TestCase):
+    """Tests for journalling, replay and compaction"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo_file_path = os.path.join(self.tmp.name, "REPOSITORY", "repo.json")
+        os.makedirs(os.path.dirname(self.repo_file_path))
+        with open(self.repo_file_path, 'w', encoding='utf-8') as f:
+            json.dump([make_idea("I-A"), make_idea("I-B")], f)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def load_base(self) -> list:
+        with open(self.repo_file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_replay(self):
+        """Upserts, renames and deletes are replayed over the base file in order"""
+        journal = RepoJournal(self.repo_file_path)
+        journal.append_upsert(make_idea("I-A", "Updated"), "I-A")
+        journal.append_upsert(make_idea("I-C"))
+        journal.append_upsert(make_idea("I-B2", "Renamed"), "I-B")
+        journal.append_delete("I-A")
+
+        repo_data = self.load_base()
+        applied = RepoJournal(self.repo_file_path).replay(repo_data)
+        self.assertEqual(applied, 4)
+        self.assertEqual([idea["idea_id"] for idea in repo_data], ["I-B2", "I-C"])
+        self.assertEqual(repo_data[0]["title"], "Renamed")
+
+    def test_torn_line_is_ignored(self):
+        """A partially written last line does not break loading"""
+        journal = RepoJournal(self.repo_file_path)
+        journal.append_delete("I-B")
+        with open(journal.path, 'a', encoding='utf-8') as f:
+            f.write('{"op": "upsert", "idea": {"idea_')
+
+        repo_data = self.load_base()
+        journal.replay(repo_data)
+        self.assertEqual([idea["idea_id"] for idea in repo_data], ["I-A"])
+
+    def test_compaction(self):
+        """Compaction writes repo.json and removes the journal"""
+        journal = RepoJournal(self.repo_file_path, max_bytes=1)
+        repo_data = self.load_base()
+        repo_data.append(make_idea("I-C"))
+        journal.append_upsert(repo_data[-1])
+        self.assertTrue(journal.needs_compaction())
+
+        self.assertTrue(journal.maybe_compact(repo_data))
+        journal.wait()
+        self.assertIsNone(journal.last_error)
+        self.assertFalse(journal.has_pending_changes())
+        self.assertEqual([idea["idea_id"] for idea in self.load_base()], ["I-A", "I-B", "I-C"])
+
+    def test_interrupted_compaction_is_replayed(self):
+        """Changes from a compaction that never finished are still applied"""
+        journal = RepoJournal(self.repo_file_path)
+        journal.append_delete("I-A")
+        os.replace(journal.path, journal.compacting_path)
+        journal.append_upsert(make_idea("I-C"))
+
+        repo_data = self.load_base()
+        RepoJournal(self.repo_file_path).replay(repo_data)
+        self.assertEqual([idea["idea_id"] for idea in repo_data], ["I-B", "I-C"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the repository storage backends
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from repo_storage import JsonFileStorage, ShardedStorage, IdeaSummary
+
+
+def make_idea(idea_id: str, title: str = "Idea") -> dict:
+    return {
+        "idea_id": idea_id,
+        "title": title,
+        "description": "Test description",
+        "maturity_score": 5,
+        "personal_interest_score": 7,
+        "trend_score": 6,
+        "tags": ["test"],
+        "related_items": [{"week": "2025-W29", "item_id": "e1", "section": "experiments_and_research"}]
+    }
+
+
+class TestShardedStorage(unittest.TestCase):
+    """Tests for per-idea shards, the compact index and repo.json conversion"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo_file_path = os.path.join(self.tmp.name, "repo.json")
+        self.ideas_path = os.path.join(self.tmp.name, "ideas")
+        with open(self.repo_file_path, 'w', encoding='utf-8') as f:
+            json.dump([make_idea("I-A"), make_idea("I-B")], f)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_import_and_list_from_index(self):
+        """Import writes one shard per idea and listing only needs the index"""
+        storage = ShardedStorage(self.ideas_path)
+        self.assertEqual(storage.import_repo_json(self.repo_file_path), 2)
+        self.assertEqual(sorted(os.listdir(self.ideas_path)), ["I-A.json", "I-B.json", "index.json"])
+
+        ideas = ShardedStorage(self.ideas_path).load_ideas()
+        self.assertEqual([idea["idea_id"] for idea in ideas], ["I-A", "I-B"])
+        self.assertIsInstance(ideas[0], IdeaSummary)
+        self.assertNotIn("related_items", ideas[0])
+        self.assertEqual(ideas[0]["tags"], ["test"])
+
+    def test_save_rename_delete(self):
+        """Changes touch only the affected shard and the index"""
+        storage = ShardedStorage(self.ideas_path)
+        storage.import_repo_json(self.repo_file_path)
+        storage.save_idea(make_idea("I-A2", "Renamed"), "I-A")
+        storage.save_idea(make_idea("I-C"))
+        storage.delete_idea("I-B")
+
+        reloaded = ShardedStorage(self.ideas_path)
+        self.assertEqual([idea["idea_id"] for idea in reloaded.load_ideas()], ["I-A2", "I-C"])
+        self.assertEqual(reloaded.load_idea("I-A2")["title"], "Renamed")
+        self.assertEqual(sorted(os.listdir(self.ideas_path)), ["I-A2.json", "I-C.json", "index.json"])
+
+    def test_unsafe_ids_get_distinct_shards(self):
+        """IDs that only differ in replaced characters do not share a shard"""
+        storage = ShardedStorage(self.ideas_path)
+        storage.import_repo_json(self.repo_file_path)
+        storage.save_idea(make_idea("I/A", "Slash"))
+        storage.save_idea(make_idea("I_A", "Underscore"))
+        self.assertNotEqual(storage.shard_name("I/A"), storage.shard_name("I_A"))
+
+        reloaded = ShardedStorage(self.ideas_path)
+        self.assertEqual(reloaded.load_idea("I/A")["title"], "Slash")
+        self.assertEqual(reloaded.load_idea("I_A")["title"], "Underscore")
+
+    def test_index_only_written_when_listed_fields_change(self):
+        """Editing fields the index does not hold rewrites only the shard"""
+        storage = ShardedStorage(self.ideas_path)
+        storage.import_repo_json(self.repo_file_path)
+        index_path = os.path.join(self.ideas_path, "index.json")
+        os.utime(index_path, (1000.0, 1000.0))
+
+        idea = make_idea("I-A")
+        idea["description"] = "Edited"
+        storage.save_idea(idea)
+        self.assertEqual(os.path.getmtime(index_path), 1000.0)
+        self.assertEqual(ShardedStorage(self.ideas_path).load_idea("I-A")["description"], "Edited")
+
+        idea["title"] = "Retitled"
+        storage.save_idea(idea)
+        self.assertNotEqual(os.path.getmtime(index_path), 1000.0)
+        self.assertEqual(ShardedStorage(self.ideas_path).load_ideas()[0]["title"], "Retitled")
+
+    def test_round_trip_export(self):
+        """Exporting the shards reproduces the single-file repository"""
+        storage = ShardedStorage(self.ideas_path)
+        storage.import_repo_json(self.repo_file_path)
+        exported = os.path.join(self.tmp.name, "exported.json")
+        storage.export_repo_json(exported)
+
+        with open(self.repo_file_path, 'r', encoding='utf-8') as f:
+            original = json.load(f)
+        self.assertEqual(JsonFileStorage(exported).load_ideas(), original)
+
+
+if __name__ == '__main__':
+    unittest.main()
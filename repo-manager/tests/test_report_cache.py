@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the source report cache
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from repo_core import RepoCore
+from report_cache import ReportCache
+
+
+def write_week(root: str, week: str, text: str):
+    path = os.path.join(root, "json-logs", f"{week}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"items": {"tools": [{"id": "t1", "text": text}]}}, f)
+    # Make sure the mtime moves even on coarse-grained filesystems
+    stamp = time.time() + len(text)
+    os.utime(path, (stamp, stamp))
+
+
+class TestReportCache(unittest.TestCase):
+    """Tests for the LRU on its own"""
+
+    def test_lru_and_invalidation(self):
+        cache = ReportCache(max_entries=2)
+        key_a = ("a", (("W1", (1, 1.0, None, None)),), True)
+        key_b = ("b", (("W2", (1, 1.0, None, None)),), True)
+        cache.put("I-A", key_a, ["a"])
+        cache.put("I-B", key_b, ["b"])
+        self.assertEqual(cache.get("I-A", key_a), ["a"])
+        cache.put("I-C", ("c", (("W1", None),), True), ["c"])
+        # I-B was the least recently used
+        self.assertIsNone(cache.get("I-B", key_b))
+        self.assertEqual(len(cache), 2)
+
+        self.assertIsNone(cache.get("I-A", ("a2",) + key_a[1:]))
+        self.assertEqual(len(cache), 1)
+        cache.invalidate_week("W1")
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats(), {'entries': 0, 'max_entries': 2, 'hits': 1, 'misses': 2,
+                                         'invalidations': 1})
+
+
+class TestCoreReportCache(unittest.TestCase):
+    """Tests for cached source reports in the core"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        os.makedirs(os.path.join(self.tmp.name, "REPOSITORY"))
+        os.makedirs(os.path.join(self.tmp.name, "json-logs"))
+        write_week(self.tmp.name, "2025-W01", "first text")
+        write_week(self.tmp.name, "2025-W02", "other week")
+        with open(os.path.join(self.tmp.name, "REPOSITORY", "repo.json"), 'w', encoding='utf-8') as f:
+            json.dump([
+                {"idea_id": "I-A", "title": "A", "related_items": [{"week": "2025-W01", "section": "tools", "item_id": "t1"}]},
+                {"idea_id": "I-B", "title": "B", "related_items": [{"week": "2025-W02", "section": "tools", "item_id": "t1"}]},
+            ], f)
+        self.core = RepoCore(self.tmp.name)
+        self.core.load_repo_data()
+        self.core.load_source_data()
+
+    def tearDown(self):
+        self.core.close()
+        self.tmp.cleanup()
+
+    def test_hits_until_the_idea_or_a_week_changes(self):
+        cache = self.core.report_cache
+        first = self.core.get_source_information(self.core.find_idea("I-A"))
+        self.assertEqual(self.core.get_source_information(self.core.find_idea("I-A")), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # Another week changing leaves the report alone
+        write_week(self.tmp.name, "2025-W02", "other week, edited")
+        self.core.load_source_data()
+        self.assertEqual(len(cache), 1)
+        self.core.get_source_information(self.core.find_idea("I-A"))
+        self.assertEqual(cache.hits, 2)
+
+        # Its own week changing drops it at once, and the next report shows the new text
+        write_week(self.tmp.name, "2025-W01", "second text")
+        self.core.load_source_data()
+        self.assertEqual(len(cache), 0)
+        self.assertIn("second text", self.core.get_source_information(self.core.find_idea("I-A")))
+
+        # So does saving the idea
+        idea = dict(self.core.find_idea("I-A"), title="Renamed")
+        self.core.put_idea(idea, "I-A")
+        self.assertEqual(len(cache), 0)
+        self.assertIn("Renamed", self.core.get_source_information(self.core.find_idea("I-A")))
+        self.assertEqual(cache.hits, 2)
+
+    def test_stale_key_is_a_miss_without_a_rescan_hook(self):
+        idea = dict(self.core.find_idea("I-A"))
+        self.core.get_source_information(idea)
+        idea['related_items'] = idea['related_items'] + [{"week": "2025-W02", "section": "tools", "item_id": "t1"}]
+        self.assertIn("other week", self.core.get_source_information(idea))
+        self.assertEqual(self.core.report_cache.hits, 0)
+
+    def test_partial_reports_are_not_cached(self):
+        sections = self.core.source_sections(self.core.find_idea("I-A"))
+        next(sections)
+        sections.close()
+        self.assertEqual(len(self.core.report_cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Unit tests for compiled schema validation of weekly logs and the idea repository
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+from unittest import mock
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import schema_validation
+from repo_core import RepoCore
+from schema_validation import (compile_schema, load_schema, locate_line, validate_file, validate_files,
+                               data_files, SchemaError, SCHEMA_PATHS)
+from synthetic_data import generate_dataset
+
+
+class TestCompiledSchema(unittest.TestCase):
+    """Tests for the schema compiler"""
+
+    def test_keywords(self):
+        check = compile_schema({
+            'type': 'object',
+            'required': ['name'],
+            'properties': {
+                'name': {'type': 'string', 'minLength': 1, 'pattern': '^[a-z]+$'},
+                'score': {'type': 'integer', 'minimum': 1, 'maximum': 10},
+                'kind': {'type': 'string', 'enum': ['a', 'b']},
+                'when': {'type': 'string', 'format': 'date-time'},
+                'tags': {'type': 'array', 'items': {'type': 'string'}},
+            },
+            'additionalProperties': False,
+        })
+        self.assertEqual(check({'name': 'ok', 'score': 3, 'kind': 'a', 'when': '2025-07-21T17:42:00Z',
+                                'tags': ['x']}, (), []), [])
+
+        errors = dict(check({'score': True, 'kind': 'c', 'when': 'today', 'tags': ['x', 2], 'extra': 1}, (), []))
+        self.assertEqual(errors[()], "unexpected property 'extra'")
+        self.assertIn("expected integer", errors[('score',)])
+        self.assertIn("not one of", errors[('kind',)])
+        self.assertIn("date-time", errors[('when',)])
+        self.assertIn("expected string", errors[('tags', 1)])
+        self.assertIn("missing required property 'name'", [message for path, message
+                                                            in check({}, (), []) if path == ()])
+
+        # Memoized patterns still reject bad values on every call
+        for _ in range(2):
+            self.assertEqual(check({'name': 'BAD'}, (), [])[0][0], ('name',))
+
+    def test_unsupported_keyword(self):
+        with self.assertRaises(SchemaError):
+            compile_schema({'type': 'string', 'oneOf': []})
+
+    def test_shipped_schemas(self):
+        weekly = load_schema('weekly')
+        with open(os.path.join(os.path.dirname(SCHEMA_PATHS['weekly']), "weekly.example.json"), 'r',
+                  encoding='utf-8') as f:
+            self.assertEqual(weekly.validate(json.load(f)), [])
+        repo = load_schema('repo')
+        idea = {"idea_id": "I-TEST", "title": "Test", "description": "Test idea", "related_items": [],
+                "maturity_score": 5, "personal_interest_score": 7, "trend_score": 3, "tags": ["test"]}
+        self.assertEqual(repo.validate_item(idea), [])
+        self.assertEqual(repo.validate([idea]), [])
+
+
+class TestFileValidation(unittest.TestCase):
+    """Tests for file/line reporting and directory validation"""
+
+    def test_locate_line(self):
+        text = '{\n  "a": 1,\n  "b": [\n    {"c": 2},\n    {"c": "x"}\n  ]\n}'
+        self.assertEqual(locate_line(text, ('b', 1, 'c')), 5)
+        self.assertEqual(locate_line(text, ('a',)), 2)
+        self.assertEqual(locate_line(text, ()), 1)
+        self.assertIsNone(locate_line(text, ('missing',)))
+
+    def test_directory(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            generate_dataset(temp_dir, 4, 10, 2, seed=2)
+            files = data_files(temp_dir)
+            self.assertEqual(len(files), 5)
+            self.assertEqual(validate_files(files), [])
+
+            week_file = files[2][0]
+            with open(week_file, 'r', encoding='utf-8') as f:
+                week_data = json.load(f)
+            week_data['items']['content_ideas'][0]['text'] = ""
+            with open(week_file, 'w', encoding='utf-8') as f:
+                json.dump(week_data, f, indent=2)
+            with open(files[3][0], 'w', encoding='utf-8') as f:
+                f.write('{\n  "week": ]')
+
+            errors = validate_files(files)
+            with mock.patch.object(schema_validation, 'PARALLEL_THRESHOLD', 0):
+                self.assertEqual(validate_files(files, workers=2), errors)
+            by_file = {error['file']: error for error in errors}
+            self.assertEqual(by_file[week_file]['path'], "items/content_ideas/0/text")
+            with open(week_file, 'r', encoding='utf-8') as f:
+                line = f.read().splitlines()[by_file[week_file]['line'] - 1]
+            self.assertIn('"text": ""', line)
+            self.assertEqual(by_file[files[3][0]]['line'], 2)
+            self.assertEqual(validate_file(files[0][0], 'repo'), [])
+
+
+class TestCoreValidation(unittest.TestCase):
+    """Tests for validation as ideas and weeks are loaded and saved"""
+
+    def test_ideas_and_weeks(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            generate_dataset(temp_dir, 2, 5, 2, seed=4)
+            core = RepoCore(temp_dir)
+            core.load_repo_data()
+            self.assertEqual(core.idea_errors, {})
+
+            idea = dict(core.repo_data[0], maturity_score=0)
+            core.put_idea(idea, idea['idea_id'])
+            self.assertIn("maturity_score", core.idea_errors[idea['idea_id']][0])
+            core.put_idea(dict(idea, maturity_score=4), idea['idea_id'])
+            self.assertEqual(core.idea_errors, {})
+
+            week = core.repo_data[0]['related_items'][0]['week']
+            week_file = os.path.join(temp_dir, "json-logs", f"{week}.json")
+            with open(week_file, 'r', encoding='utf-8') as f:
+                week_data = json.load(f)
+            del week_data['metadata']
+            with open(week_file, 'w', encoding='utf-8') as f:
+                json.dump(week_data, f)
+            core.load_source_data()
+            core.source_data.load_week(week)
+            self.assertEqual(core.source_data.week_errors[week], ["(root): missing required property 'metadata'"])
+            self.assertIn("does not match weekly.schema.json", core.get_source_information(core.repo_data[0]))
+            core.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
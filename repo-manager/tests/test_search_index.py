@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the incremental BM25 search index
+"""
+
+import unittest
+import os
+import sys
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from search_index import SearchIndex, idea_document, tokenize
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Tests for indexing, ranking and incremental updates"""
+
+    def setUp(self):
+        self.index = SearchIndex()
+        self.index.add("I-AGENTS", "AI agents for systems engineering\nagents agents")
+        self.index.add("I-API", "Fuel cell API gateway\napi")
+        self.index.add("I-SE", "Systems engineering requirements")
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("I-FUNC-ARCH systems_engineering"), ["i", "func", "arch", "systems", "engineering"])
+
+    def test_ranking(self):
+        """Documents matching all terms are ranked by BM25"""
+        results = self.index.search("systems engineering ")
+        self.assertEqual([doc_id for doc_id, _ in results], ["I-SE", "I-AGENTS"])
+        self.assertEqual([doc_id for doc_id, _ in self.index.search("agents systems ")], ["I-AGENTS"])
+        self.assertEqual(self.index.search("blockchain"), [])
+
+    def test_prefix_while_typing(self):
+        """The last, unfinished word matches as a prefix"""
+        self.assertEqual([doc_id for doc_id, _ in self.index.search("gate")], ["I-API"])
+        self.assertEqual(self.index.search("gate "), [])
+
+    def test_incremental_update(self):
+        """Re-adding and removing documents only changes their own postings"""
+        self.index.add("I-API", "Hydrogen storage")
+        self.assertEqual(self.index.search("gateway"), [])
+        self.assertEqual([doc_id for doc_id, _ in self.index.search("hydrogen")], ["I-API"])
+        self.index.remove("I-SE")
+        self.assertNotIn("requirements", self.index.postings)
+        self.assertEqual(len(self.index), 2)
+        self.assertEqual(self.index.total_length, sum(self.index.doc_lengths.values()))
+
+    def test_idea_document(self):
+        """Idea documents include tags and linked item text"""
+        idea = {"idea_id": "I-X", "title": "Title", "description": "Desc", "tags": ["mbse"],
+                "related_items": [{"week": "2025-W29", "section": "content_ideas", "item_id": "ci1"}]}
+        text = idea_document(idea, lambda week, section, item_id: f"{week} {item_id} blog post")
+        self.assertIn("mbse", text)
+        self.assertIn("2025-W29 ci1 blog post", text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the lazy source store
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from source_store import SourceStore
+
+
+def write_week(json_dir: str, md_dir: str, week: str):
+    """Write a minimal weekly JSON log and markdown log"""
+    week_data = {
+        "week": week,
+        "date_range": "2025-07-15 to 2025-07-21",
+        "items": {"experiments_and_research": [{"id": "e1", "text": f"Experiment in {week}"}]},
+        "metadata": {"tools_used": ["Python"], "tags": ["ai"], "source": "test",
+                     "generated_at": "2025-07-21T17:42:00Z"}
+    }
+    with open(os.path.join(json_dir, f"{week}.json"), 'w', encoding='utf-8') as f:
+        json.dump(week_data, f)
+    with open(os.path.join(md_dir, f"{week}.md"), 'w', encoding='utf-8') as f:
+        f.write(f"# {week}\n")
+
+
+class TestSourceStore(unittest.TestCase):
+    """Tests for manifest scanning and lazy week loading"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.json_dir = os.path.join(self.tmp.name, "json-logs")
+        self.md_dir = os.path.join(self.tmp.name, "md-logs")
+        os.makedirs(self.json_dir)
+        os.makedirs(self.md_dir)
+        for week in ("2025-W29", "2025-W30", "2025-W31"):
+            write_week(self.json_dir, self.md_dir, week)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_scan_does_not_parse(self):
+        """Scanning builds the manifest without loading any week"""
+        store = SourceStore(self.json_dir, self.md_dir)
+        self.assertEqual(store.scan(), 3)
+        self.assertEqual(store.weeks(), ["2025-W29", "2025-W30", "2025-W31"])
+        self.assertEqual(store.loaded_weeks(), [])
+        self.assertIn("json_size", store.manifest["2025-W29"])
+
+    def test_lazy_load(self):
+        """Weeks are parsed on first access; the markdown log is only read on request"""
+        store = SourceStore(self.json_dir, self.md_dir)
+        store.scan()
+        week_data = store["2025-W30"]
+        self.assertEqual(week_data["items"]["experiments_and_research"][0]["id"], "e1")
+        self.assertNotIn("markdown", week_data)
+        self.assertEqual(store.markdown("2025-W30"), "# 2025-W30\n")
+        self.assertEqual(store.loaded_weeks(), ["2025-W30"])
+        self.assertIsNone(store.get("2024-W01"))
+        self.assertNotIn("2024-W01", store)
+
+    def test_cache_limit(self):
+        """Least recently used weeks are evicted beyond the limit"""
+        store = SourceStore(self.json_dir, self.md_dir, max_cached_weeks=2)
+        store.scan()
+        store["2025-W29"]
+        store["2025-W30"]
+        store["2025-W29"]
+        store["2025-W31"]
+        self.assertEqual(store.loaded_weeks(), ["2025-W29", "2025-W31"])
+
+    def test_rescan_drops_changed_weeks(self):
+        """Re-scanning forgets parsed weeks whose files changed"""
+        store = SourceStore(self.json_dir, self.md_dir)
+        store.scan()
+        store["2025-W29"]
+        store["2025-W30"]
+        with open(os.path.join(self.md_dir, "2025-W29.md"), 'a', encoding='utf-8') as f:
+            f.write("More notes\n")
+        store.scan()
+        self.assertEqual(store.loaded_weeks(), ["2025-W30"])
+
+    def test_item_index(self):
+        """Items resolve by (week, section, item_id) and follow evictions"""
+        store = SourceStore(self.json_dir, self.md_dir, max_cached_weeks=1)
+        store.scan()
+        item = store.get_item("2025-W29", "experiments_and_research", "e1")
+        self.assertEqual(item["text"], "Experiment in 2025-W29")
+        self.assertIsNone(store.get_item("2025-W29", "content_ideas", "e1"))
+        self.assertIsNone(store.get_item("2024-W01", "experiments_and_research", "e1"))
+
+        store.get_item("2025-W30", "experiments_and_research", "e1")
+        self.assertEqual(list(store.item_index), [("2025-W30", "experiments_and_research", "e1")])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,44 +5,29 @@ Test script to verify source information functionality
 
 import sys
 import os
-import json
+import unittest
 
 # Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-def test_source_data_loading():
-    """Test loading source data from JSON and MD files"""
+from repo_core import RepoCore
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'data')
+
+def load_source_data():
+    """Load source data from JSON and MD files; returns (source store, success)"""
     print("🧪 Testing source data loading...")
     
-    # Test paths
-    json_logs_path = "../data/json-logs"
-    md_logs_path = "../data/md-logs"
-    
-    source_data = {}
+    core = RepoCore(DATA_PATH)
     
     try:
-        # Load JSON logs
-        import glob
-        json_files = glob.glob(os.path.join(json_logs_path, "*.json"))
-        print(f"📁 Found {len(json_files)} JSON log files")
-        
-        for json_file in json_files:
-            week = os.path.basename(json_file).replace('.json', '')
-            with open(json_file, 'r', encoding='utf-8') as f:
-                source_data[week] = json.load(f)
-            print(f"✅ Loaded JSON data for week: {week}")
+        weeks = core.load_source_data()
+        print(f"📁 Found {weeks} weeks of JSON/markdown logs")
         
-        # Load markdown logs
-        md_files = glob.glob(os.path.join(md_logs_path, "*.md"))
-        print(f"📁 Found {len(md_files)} markdown log files")
-        
-        for md_file in md_files:
-            week = os.path.basename(md_file).replace('.md', '')
-            if week not in source_data:
-                source_data[week] = {}
-            with open(md_file, 'r', encoding='utf-8') as f:
-                source_data[week]['markdown'] = f.read()
-            print(f"✅ Loaded markdown data for week: {week}")
+        source_data = core.source_data
+        for week in source_data.weeks():
+            source_data.load_week(week)
+            print(f"✅ Loaded source data for week: {week}")
         
         return source_data, True
         
@@ -50,21 +35,20 @@ def test_source_data_loading():
         print(f"❌ Error loading source data: {e}")
         return {}, False
 
-def test_idea_source_linking():
-    """Test linking ideas to their source information"""
+def check_idea_source_linking():
+    """Check linking ideas to their source information"""
     print("\n🔗 Testing idea source linking...")
     
     # Load repo data
-    repo_file_path = "../data/REPOSITORY/repo.json"
+    core = RepoCore(DATA_PATH)
     try:
-        with open(repo_file_path, 'r', encoding='utf-8') as f:
-            repo_data = json.load(f)
+        repo_data = core.load_repo_data()
     except Exception as e:
         print(f"❌ Error loading repo data: {e}")
         return False
     
     # Load source data
-    source_data, success = test_source_data_loading()
+    source_data, success = load_source_data()
     if not success:
         return False
     
@@ -102,8 +86,9 @@ def test_idea_source_linking():
                     print(f"     ⚠️  Section {section} not found in JSON data")
                 
                 # Check markdown data
-                if 'markdown' in week_data:
-                    print(f"     ✅ Markdown context available ({len(week_data['markdown'])} chars)")
+                markdown = source_data.markdown_section(week, section, item_id)
+                if markdown is not None:
+                    print(f"     ✅ Markdown context available ({len(markdown)} chars)")
                 else:
                     print(f"     ⚠️  No markdown context found")
             else:
@@ -111,21 +96,20 @@ def test_idea_source_linking():
     
     return True
 
-def test_source_information_generation():
-    """Test generating source information text"""
+def check_source_information_generation():
+    """Check generating source information text; returns None when no idea has related items"""
     print("\n📝 Testing source information generation...")
     
     # Load repo data
-    repo_file_path = "../data/REPOSITORY/repo.json"
+    core = RepoCore(DATA_PATH)
     try:
-        with open(repo_file_path, 'r', encoding='utf-8') as f:
-            repo_data = json.load(f)
+        repo_data = core.load_repo_data()
     except Exception as e:
         print(f"❌ Error loading repo data: {e}")
         return False
     
     # Load source data
-    source_data, success = test_source_data_loading()
+    source_data, success = load_source_data()
     if not success:
         return False
     
@@ -138,55 +122,30 @@ def test_source_information_generation():
     
     if not test_idea:
         print("⚠️  No ideas with related items found for testing")
-        return False
+        return None
     
     print(f"📋 Testing with idea: {test_idea.get('idea_id')}")
     
-    # Generate source information (simplified version)
-    related_items = test_idea.get('related_items', [])
-    source_info = []
-    source_info.append(f"# Source Information for: {test_idea.get('title', 'Unknown Idea')}")
-    source_info.append(f"Idea ID: {test_idea.get('idea_id', 'Unknown')}")
-    source_info.append("=" * 60)
-    source_info.append("")
-    
-    for item in related_items:
-        week = item.get('week', 'Unknown')
-        item_id = item.get('item_id', 'Unknown')
-        section = item.get('section', 'Unknown')
-        
-        source_info.append(f"## Week: {week} | Item: {item_id} | Section: {section}")
-        source_info.append("")
-        
-        if week in source_data:
-            week_data = source_data[week]
-            
-            # Find JSON source
-            if 'items' in week_data and section in week_data['items']:
-                items = week_data['items'][section]
-                for item_data in items:
-                    if item_data.get('id') == item_id:
-                        source_info.append("### JSON Source:")
-                        source_info.append(f"```json")
-                        source_info.append(json.dumps(item_data, indent=2, ensure_ascii=False))
-                        source_info.append("```")
-                        source_info.append("")
-                        break
-            
-            # Add markdown context
-            if 'markdown' in week_data:
-                source_info.append("### Markdown Context:")
-                source_info.append("```markdown")
-                source_info.append(week_data['markdown'])
-                source_info.append("```")
-                source_info.append("")
-    
-    source_text = "\n".join(source_info)
+    # Generate source information
+    core.source_data = source_data
+    source_text = core.get_source_information(test_idea)
     print(f"✅ Generated source information ({len(source_text)} characters)")
     print(f"📄 Preview: {source_text[:200]}...")
     
     return True
 
+def test_source_data_loading():
+    assert load_source_data()[1]
+
+def test_idea_source_linking():
+    assert check_idea_source_linking()
+
+def test_source_information_generation():
+    generated = check_source_information_generation()
+    if generated is None:
+        raise unittest.SkipTest("no ideas with related items in the data directory")
+    assert generated
+
 def main():
     """Run all source information tests"""
     print("🧪 Testing Source Information Functionality...")
@@ -194,15 +153,15 @@ def main():
     
     # Test 1: Source data loading
     print("\n1. Testing source data loading...")
-    source_data, load_success = test_source_data_loading()
+    source_data, load_success = load_source_data()
     
     # Test 2: Idea source linking
     print("\n2. Testing idea source linking...")
-    linking_success = test_idea_source_linking()
+    linking_success = check_idea_source_linking()
     
     # Test 3: Source information generation
     print("\n3. Testing source information generation...")
-    generation_success = test_source_information_generation()
+    generation_success = check_source_information_generation()
     
     # Summary
     print("\n" + "=" * 60)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the SQLite storage backend
+"""
+
+import unittest
+import contextlib
+import io
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from unittest import mock
+
+# Add src directory to Python path
+SRC_PATH = os.path.join(os.path.dirname(__file__), '..', 'src')
+sys.path.insert(0, SRC_PATH)
+
+import echoforge_cli
+from repo_core import RepoCore
+from repo_storage import JsonFileStorage
+from sqlite_storage import SqliteStorage
+
+
+def make_idea(idea_id: str, tags: list, maturity: int, weeks: list) -> dict:
+    return {
+        "idea_id": idea_id,
+        "title": f"Title {idea_id}",
+        "description": "Test description",
+        "maturity_score": maturity,
+        "personal_interest_score": 5,
+        "trend_score": 5,
+        "tags": tags,
+        "related_items": [{"week": week, "item_id": "e1", "section": "experiments_and_research"} for week in weeks]
+    }
+
+
+class TestSqliteStorage(unittest.TestCase):
+    """Tests for the importer, idea persistence and point queries"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        data_path = os.path.join(self.tmp.name, "data")
+        for sub in ("REPOSITORY", "json-logs", "evaluations"):
+            os.makedirs(os.path.join(data_path, sub))
+        self.ideas = [
+            make_idea("I-A", ["ai"], 4, ["2025-W12"]),
+            make_idea("I-B", ["ai"], 2, ["2025-W20"]),
+            make_idea("I-C", ["api"], 5, ["2025-W40"]),
+        ]
+        with open(os.path.join(data_path, "REPOSITORY", "repo.json"), 'w', encoding='utf-8') as f:
+            json.dump(self.ideas, f)
+        with open(os.path.join(data_path, "json-logs", "2025-W12.json"), 'w', encoding='utf-8') as f:
+            json.dump({"week": "2025-W12", "date_range": "x", "metadata": {},
+                       "items": {"experiments_and_research": [{"id": "e1", "text": "Agents"}]}}, f)
+        with open(os.path.join(data_path, "evaluations", "I-A_trend.json"), 'w', encoding='utf-8') as f:
+            json.dump({"trend_score": 7, "justification": "x", "suggested_tags": []}, f)
+
+        self.data_path = data_path
+        self.db_path = os.path.join(self.tmp.name, "echoforge.db")
+        self.storage = SqliteStorage(self.db_path, mode="rwc")
+        self.counts = self.storage.import_directory(data_path)
+
+    def tearDown(self):
+        self.storage.close()
+        self.tmp.cleanup()
+
+    def test_import(self):
+        """The importer reads ideas and assessments losslessly and leaves the weekly logs as files"""
+        self.assertEqual(self.counts, {'ideas': 3, 'assessments': 1})
+        self.assertEqual(self.storage.load_ideas(), self.ideas)
+        tables = {name for (name,) in self.storage.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        self.assertFalse(tables & {'weeks', 'weekly_items'})
+        self.assertEqual(self.storage.load_assessment("I-A", "trend")["trend_score"], 7)
+
+    def test_query(self):
+        """Tag, score and week range filters combine"""
+        ideas = self.storage.query_ideas(tag="ai", min_maturity=3, week_from="2025-W10", week_to="2025-W30")
+        self.assertEqual([idea["idea_id"] for idea in ideas], ["I-A"])
+        ideas = self.storage.query_ideas(week_from="2025-W15")
+        self.assertEqual([idea["idea_id"] for idea in ideas], ["I-B", "I-C"])
+
+    def test_save_rename_delete(self):
+        """Renames keep the list position and replace normalized rows"""
+        renamed = make_idea("I-A2", ["new"], 4, [])
+        self.storage.save_idea(renamed, "I-A")
+        self.storage.delete_idea("I-B")
+        self.assertEqual([idea["idea_id"] for idea in self.storage.load_ideas()], ["I-A2", "I-C"])
+        self.assertEqual(self.storage.query_ideas(tag="ai"), [])
+        self.assertEqual(self.storage.query_ideas(tag="new"), [renamed])
+
+    def test_rename_onto_existing_id_is_rejected(self):
+        """A rename never deletes the idea that already has the new ID"""
+        with self.assertRaises(ValueError):
+            self.storage.save_idea(make_idea("I-C", ["ai"], 4, []), "I-A")
+        self.assertEqual(self.storage.load_ideas(), self.ideas)
+
+
+class TestSqliteSelection(unittest.TestCase):
+    """Tests that reading never creates a database the core would then pick"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        os.makedirs(os.path.join(self.tmp.name, "REPOSITORY"))
+        with open(os.path.join(self.tmp.name, "REPOSITORY", "repo.json"), 'w', encoding='utf-8') as f:
+            json.dump([make_idea("I-A", ["x"], 4, [])], f)
+        self.db_path = os.path.join(self.tmp.name, "echoforge.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_query_does_not_create_the_database(self):
+        result = subprocess.run([sys.executable, os.path.join(SRC_PATH, "sqlite_storage.py"), "--db", self.db_path,
+                                 "query", "--tag", "x"], capture_output=True)
+        self.assertEqual(result.returncode, 1)
+        self.assertFalse(os.path.exists(self.db_path))
+        with self.assertRaises(FileNotFoundError):
+            SqliteStorage(self.db_path).load_ideas()
+
+    def test_only_an_imported_database_is_picked(self):
+        # Tables without a completed import (e.g. only assessments written) leave the flat files in charge
+        storage = SqliteStorage(self.db_path, mode="rwc")
+        storage.save_assessment("I-A", "trend", {"trend_score": 3})
+        storage.close()
+        core = RepoCore(self.tmp.name)
+        self.assertIsInstance(core.storage, JsonFileStorage)
+        self.assertEqual(len(core.load_repo_data()), 1)
+        core.close()
+
+        storage = SqliteStorage(self.db_path, mode="rwc")
+        storage.import_directory(self.tmp.name)
+        storage.close()
+        core = RepoCore(self.tmp.name)
+        self.assertIsInstance(core.storage, SqliteStorage)
+        self.assertEqual(len(core.load_repo_data()), 1)
+        core.close()
+
+        reader = SqliteStorage(self.db_path, mode="ro")
+        with self.assertRaises(sqlite3.OperationalError):
+            reader.delete_idea("I-A")
+        reader.close()
+
+    def test_cli_opens_the_database_read_only(self):
+        storage = SqliteStorage(self.db_path, mode="rwc")
+        storage.import_directory(self.tmp.name)
+        storage.close()
+        self.assertEqual(RepoCore(self.tmp.name).storage.mode, "rw")
+        self.assertEqual(RepoCore(self.tmp.name, read_only=True).storage.mode, "ro")
+
+        with mock.patch.object(echoforge_cli, "RepoCore", wraps=RepoCore) as core_class, \
+                contextlib.redirect_stdout(io.StringIO()) as output:
+            for command in (["ideas", "list"], ["validate", "--workers", "1"]):
+                self.assertEqual(echoforge_cli.main(["--data-dir", self.tmp.name] + command), 0, command)
+        self.assertTrue(all(call.kwargs.get("read_only") for call in core_class.call_args_list))
+        self.assertTrue(output.getvalue().startswith("I-A\t"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the startup profiler
+"""
+
+import unittest
+import io
+import os
+import sys
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from startup_profile import StartupProfiler
+
+
+class TestStartupProfiler(unittest.TestCase):
+    """Tests for phase recording and the printed breakdown"""
+
+    def test_phases_and_report(self):
+        stream = io.StringIO()
+        profiler = StartupProfiler(stream=stream)
+        profiler.mark("imports")
+        profiler.mark("first paint")
+
+        self.assertEqual([name for name, _, _ in profiler.phases], ["imports", "first paint"])
+        self.assertLessEqual(profiler.elapsed("imports"), profiler.elapsed("first paint"))
+        self.assertIsNone(profiler.elapsed("repo load"))
+
+        profiler.report()
+        profiler.report()
+        output = stream.getvalue()
+        self.assertEqual(output.count("Startup profile:"), 1)
+        self.assertIn("first paint", output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the synthetic data generator and the benchmark runner
+"""
+
+import unittest
+import json
+import os
+import re
+import sys
+import tempfile
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from synthetic_data import generate_dataset
+from benchmark import run_benchmarks, compare_results
+
+
+def read_tree(path):
+    contents = {}
+    for directory, _, files in os.walk(path):
+        for name in files:
+            file_path = os.path.join(directory, name)
+            with open(file_path, 'rb') as f:
+                contents[os.path.relpath(file_path, path)] = f.read()
+    return contents
+
+
+class TestSyntheticData(unittest.TestCase):
+    """Tests for determinism and schema shape of generated data"""
+
+    def test_same_seed_same_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first, second, other = (os.path.join(temp_dir, name) for name in ("a", "b", "c"))
+            generate_dataset(first, 3, 12, 4, seed=7)
+            generate_dataset(second, 3, 12, 4, seed=7)
+            generate_dataset(other, 3, 12, 4, seed=8)
+            self.assertEqual(read_tree(first), read_tree(second))
+            self.assertNotEqual(read_tree(first), read_tree(other))
+
+    def test_generated_shapes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            counts = generate_dataset(temp_dir, 2, 10, 3, items_per_section=2, seed=1)
+            self.assertEqual(counts['related_items'], 30)
+
+            with open(os.path.join(temp_dir, "REPOSITORY", "repo.json"), 'r', encoding='utf-8') as f:
+                repo_data = json.load(f)
+            self.assertEqual(len(repo_data), 10)
+            weeks = {name[:-len(".json")] for name in os.listdir(os.path.join(temp_dir, "json-logs"))}
+            self.assertEqual(len(weeks), 2)
+            self.assertEqual(len(os.listdir(os.path.join(temp_dir, "md-logs"))), 2)
+
+            for idea in repo_data:
+                self.assertRegex(idea['idea_id'], r'^[A-Z0-9-]+$')
+                self.assertEqual(len(idea['related_items']), 3)
+                for item in idea['related_items']:
+                    self.assertRegex(item['item_id'], r'^[a-z]\d+$')
+                    self.assertIn(item['week'], weeks)
+
+            for week in weeks:
+                with open(os.path.join(temp_dir, "json-logs", f"{week}.json"), 'r', encoding='utf-8') as f:
+                    week_data = json.load(f)
+                self.assertTrue(re.match(r'^\d{4}-W\d{2}$', week_data['week']))
+                for items in week_data['items'].values():
+                    self.assertEqual(len(items), 2)
+
+
+class TestBenchmark(unittest.TestCase):
+    """Tests for benchmark results and regression detection"""
+
+    def test_run_and_compare(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report = run_benchmarks([1], related_per_idea=2, repeats=1, work_path=temp_dir)
+            self.assertEqual(os.listdir(temp_dir), [])
+
+        operations = {result['operation'] for result in report['results']}
+        self.assertEqual(operations, {'load_repo', 'load_sources', 'index_markdown', 'index_markdown_cached',
+                                      'build_search_index', 'search',
+                                      'source_report', 'source_report_cached',
+                                      'assessment_lookup_cold', 'assessment_lookup_warm',
+                                      'save_idea', 'flush_repo', 'save_assessment',
+                                      'save_repo_pretty', 'load_repo_pretty', 'load_weeks_pretty',
+                                      'save_repo_compact', 'load_repo_compact', 'load_weeks_compact'})
+        sizes = {result['operation']: result.get('bytes') for result in report['results']}
+        self.assertLess(sizes['save_repo_compact'], sizes['save_repo_pretty'])
+        json.dumps(report)
+
+        self.assertEqual(compare_results(report, report, 1.5), [])
+        faster = {'results': [dict(result, seconds=result['seconds'] / 10) for result in report['results']]}
+        regressions = compare_results(report, faster, 1.5)
+        self.assertTrue(any(line.startswith("load_repo at 1x") for line in regressions))
+
+
+if __name__ == '__main__':
+    unittest.main()
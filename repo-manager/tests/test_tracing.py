@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Unit tests for tracing spans and metrics export
+"""
+
+import unittest
+import csv
+import json
+import os
+import sys
+import tempfile
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from repo_core import RepoCore
+from synthetic_data import generate_dataset
+from tracing import Tracer
+
+
+class Worker:
+    def outer(self, value):
+        return self.inner(value) + 1
+
+    def inner(self, value):
+        if value < 0:
+            raise ValueError("negative")
+        return value * 2
+
+
+class TestTracer(unittest.TestCase):
+    """Tests for wrapping, span recording and export"""
+
+    def test_disabled_tracer_wraps_nothing(self):
+        worker = Worker()
+        tracer = Tracer()
+        tracer.instrument(worker, {'outer': None, 'inner': None})
+        self.assertNotIn('outer', worker.__dict__)
+
+        tracer.enable()
+        self.assertIn('outer', worker.__dict__)
+        tracer.disable()
+        self.assertNotIn('outer', worker.__dict__)
+        self.assertEqual(worker.outer(1), 3)
+        self.assertEqual(len(tracer.spans), 0)
+
+    def test_spans_parents_and_errors(self):
+        worker = Worker()
+        tracer = Tracer()
+        tracer.instrument(worker, {'outer': lambda target, args, result: (None, result), 'inner': None})
+        tracer.enable()
+
+        self.assertEqual(worker.outer(2), 5)
+        with self.assertRaises(ValueError):
+            worker.outer(-1)
+
+        spans = list(tracer.spans)
+        self.assertEqual([(span['name'], span['parent']) for span in spans],
+                         [('inner', 'outer'), ('outer', None), ('inner', 'outer'), ('outer', None)])
+        self.assertEqual(spans[1]['count'], 5)
+        self.assertEqual(spans[2]['error'], 'ValueError')
+
+        summary = {row['name']: row for row in tracer.summary()}
+        self.assertEqual(summary['outer']['calls'], 2)
+        self.assertEqual(summary['outer']['errors'], 1)
+        self.assertEqual(summary['outer']['count'], 5)
+
+        tracer.reset()
+        self.assertEqual(tracer.summary(), [])
+
+    def test_core_metrics_and_export(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            generate_dataset(temp_dir, 2, 5, 3, seed=3)
+            core = RepoCore(temp_dir)
+            core.tracer.enable()
+            core.load_repo_data()
+            core.load_source_data()
+            idea = core.repo_data[0]
+            core.get_source_information(idea)
+            core.save_assessment(idea['idea_id'], "trend", {"idea_id": idea['idea_id'], "trend_score": 4,
+                                                            "justification": "test", "suggested_tags": []})
+
+            summary = {row['name']: row for row in core.tracer.summary()}
+            self.assertEqual(summary['load_repo_data']['count'], 5)
+            self.assertEqual(summary['load_repo_data']['bytes'], os.path.getsize(core.repo_file_path))
+            self.assertEqual(summary['load_source_data']['count'], 2)
+            self.assertEqual(summary['get_source_information']['count'], 3)
+            self.assertEqual(summary['save_assessment']['bytes'],
+                             os.path.getsize(core.get_assessment_file_path(idea['idea_id'], "trend")))
+            # The lookup save_assessment does first is attributed to it
+            self.assertTrue(any(span['name'] == 'load_assessment' and span['parent'] == 'save_assessment'
+                                for span in core.tracer.spans))
+
+            json_path = os.path.join(temp_dir, "metrics.json")
+            csv_path = os.path.join(temp_dir, "metrics.csv")
+            core.tracer.export(json_path)
+            core.tracer.export(csv_path)
+            with open(json_path, 'r', encoding='utf-8') as f:
+                exported = json.load(f)
+            self.assertEqual(len(exported['spans']), len(core.tracer.spans))
+            with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual(rows[0]['name'], 'load_repo_data')
+            core.close()
+
+
+if __name__ == '__main__':
+    unittest.main()